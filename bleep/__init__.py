@@ -10,27 +10,18 @@ __author__ = "Paul A. Wortman"
 # Next Steps: Create User Mode (more stream-lined)
 
 # ---------------------------------------------------------------------------
-# Initialise logging on *package import* so every code path (even when the
-# CLI is not used) has the legacy /tmp/bti__logging__*.txt files available.
-# This is a no-op if the module was already imported.
+# Importing the package is deliberately side-effect free so short-lived CLI
+# invocations (``bleep uuid-translate``, ``bleep db``) stay cheap:
+#
+# * bleep.core.log creates its files (and the legacy /tmp/bti__logging__*.txt
+#   symlinks) when a log type is first written, not on import.
+# * patch_signal_capture_class() runs when bleep.dbuslayer.signals – the
+#   module defining SignalCapture – is loaded, instead of importing D-Bus and
+#   GLib here.
+# * integrate_with_bluez_signals() instantiates system_dbus__bluez_signals()
+#   which calls dbus.SystemBus(); this triggers the circular-import problem if
+#   device_le.py is still being loaded.  Defer it to first actual D-Bus usage.
 # ---------------------------------------------------------------------------
-import importlib as _importlib
-
-_importlib.import_module("bleep.core.log")  # noqa: F401 – side-effect import
-
-# ---------------------------------------------------------------------------
-# Initialize signal capture system
-# ---------------------------------------------------------------------------
-# patch_signal_capture_class() is safe to run eagerly – it patches the
-# SignalCapture dataclass __init__ and does not touch D-Bus.
-# integrate_with_bluez_signals() instantiates system_dbus__bluez_signals()
-# which calls dbus.SystemBus(); this triggers the circular-import problem if
-# device_le.py is still being loaded.  Defer it to first actual D-Bus usage.
-# ---------------------------------------------------------------------------
-from bleep.signals import patch_signal_capture_class
-
-patch_signal_capture_class()
-
 _bluez_signals_integrated = False
 
 
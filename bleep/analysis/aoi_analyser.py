@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 
 from bleep.core.errors import BLEEPError
-from bleep.bt_ref.utils import get_name_from_uuid
+from bleep.bt_ref.utils import get_name_from_uuid, get_names_from_uuids
 from bleep.core import observations
 
 
@@ -107,6 +107,8 @@ class AOIAnalyser:
         self.reports = {}
         self.use_db = use_db
         self.db_only = db_only
+        # UUID -> name, filled in batches before each analysis/report
+        self._uuid_names: Dict[str, str] = {}
         
     def _prepare_data_for_json(self, data):
         """
@@ -410,6 +412,26 @@ class AOIAnalyser:
         landmine_map = data.get("landmine_map", {})
         permission_map = data.get("permission_map", {})
         
+        # Resolve every UUID the analysis will name in one batch
+        uuid_list: List[str] = []
+        if isinstance(services_data, list):
+            uuid_list.extend(
+                elem.get("uuid", elem.get("UUID", "")) if isinstance(elem, dict) else str(elem)
+                for elem in services_data
+            )
+        elif isinstance(services_data, dict):
+            uuid_list.extend(services_data)
+        if isinstance(characteristics, dict):
+            uuid_list.extend(characteristics)
+        for svc_data in (data.get("services_mapping") or {}).values():
+            if isinstance(svc_data, dict):
+                chars_data = svc_data.get("chars") or svc_data.get("Characteristics") or {}
+                if isinstance(chars_data, dict):
+                    uuid_list.extend(chars_data)
+        uuid_list.extend(landmine_map)
+        uuid_list.extend(permission_map)
+        self._prefetch_uuid_names(uuid_list)
+        
         # Handle different service data formats
         if isinstance(services_data, list):
             for elem in services_data:
@@ -559,6 +581,16 @@ class AOIAnalyser:
                 
         return report
     
+    def _prefetch_uuid_names(self, uuid_list) -> None:
+        """Batch-resolve names for *uuid_list* into the per-analyser cache."""
+        self._uuid_names.update(get_names_from_uuids(u for u in uuid_list if isinstance(u, str)))
+    
+    def _uuid_name(self, uuid: str) -> str:
+        name = self._uuid_names.get(uuid)
+        if name is None:
+            name = self._uuid_names[uuid] = get_name_from_uuid(uuid)
+        return name
+    
     def _analyse_service(self, uuid: str, service_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a service and generate a report.
@@ -573,7 +605,7 @@ class AOIAnalyser:
         # Basic service report
         service_report = {
             "uuid": uuid,
-            "name": get_name_from_uuid(uuid),
+            "name": self._uuid_name(uuid),
             "is_primary": service_info.get("is_primary", False),
             "is_notable": False,
             "characteristics": service_info.get("characteristics", []),
@@ -606,7 +638,7 @@ class AOIAnalyser:
         # Basic characteristic report
         char_report = {
             "uuid": uuid,
-            "name": get_name_from_uuid(uuid),
+            "name": self._uuid_name(uuid),
             "properties": char_info.get("properties", []),
             "security_concern": False,
             "is_unusual": False,
@@ -681,7 +713,7 @@ class AOIAnalyser:
             True if the UUID is critical, False otherwise
         """
         # Get UUID name and convert to lowercase
-        name = get_name_from_uuid(uuid).lower()
+        name = self._uuid_name(uuid).lower()
         
         # Check for critical keywords
         critical_keywords = ["auth", "password", "key", "firmware", "dfu", "ota", "security"]
@@ -915,13 +947,21 @@ class AOIAnalyser:
         
         if "services" in device_data:
             report.extend(["## Services", ""])
+            uuid_list = []
+            for service in device_data["services"]:
+                if isinstance(service, dict):
+                    uuid_list.append(service.get("uuid", "Unknown"))
+                    uuid_list.extend(c.get("uuid", "Unknown") for c in service.get("characteristics", []))
+                elif isinstance(service, str):
+                    uuid_list.append(service)
+            self._prefetch_uuid_names(uuid_list)
             for service in device_data["services"]:
                 if isinstance(service, dict):
                     uuid = service.get("uuid", "Unknown")
-                    name = service.get("name", get_name_from_uuid(uuid) or uuid)
+                    name = service["name"] if "name" in service else (self._uuid_name(uuid) or uuid)
                 elif isinstance(service, str):
                     uuid = service
-                    name = get_name_from_uuid(uuid) or uuid
+                    name = self._uuid_name(uuid) or uuid
                 else:
                     continue
                 report.append(f"### {name}")
@@ -932,7 +972,7 @@ class AOIAnalyser:
                         report.append("- **Characteristics:**")
                         for char in chars:
                             char_uuid = char.get("uuid", "Unknown")
-                            char_name = char.get("name", get_name_from_uuid(char_uuid) or char_uuid)
+                            char_name = char["name"] if "name" in char else (self._uuid_name(char_uuid) or char_uuid)
                             flags = ", ".join(char.get("flags", []))
                             report.append(f"  - {char_name} (`{char_uuid}`): {flags}")
                             for vuln in vulnerabilities:
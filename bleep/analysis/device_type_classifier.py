@@ -821,7 +821,8 @@ class DeviceTypeClassifier:
         mac: str,
         context: Dict[str, Any],
         scan_mode: str = "passive",
-        use_database_cache: bool = True
+        use_database_cache: bool = True,
+        evidence_sink: Optional[List[Dict[str, Any]]] = None
     ) -> ClassificationResult:
         """
         Classify device type with mode-aware evidence collection and database caching.
@@ -831,6 +832,10 @@ class DeviceTypeClassifier:
             context: Available device properties/context
             scan_mode: Scan mode ('passive', 'naggy', 'pokey', 'bruteforce')
             use_database_cache: If True, check database signature first
+            evidence_sink: If given, evidence rows are appended here (as
+                ``store_device_type_evidence`` keyword dicts) instead of being
+                written immediately, so batch callers can store them in one
+                transaction
         
         Returns:
             ClassificationResult with device type and confidence
@@ -849,7 +854,10 @@ class DeviceTypeClassifier:
         
         # Step 4: Store evidence in database for future cache hits
         if use_database_cache:
-            self._store_evidence_signature(mac, evidence, result)
+            if evidence_sink is not None:
+                evidence_sink.extend(self._evidence_records(mac, evidence, result))
+            else:
+                self._store_evidence_signature(mac, evidence, result)
         
         return result
     
@@ -1102,13 +1110,12 @@ class DeviceTypeClassifier:
         - Need full classification
         """
         try:
-            from bleep.core.observations import get_device_detail
+            from bleep.core.observations import get_device_type_and_signature
             
-            device_detail = get_device_detail(mac)
-            if not device_detail or not device_detail.get('device'):
+            stored_device = get_device_type_and_signature(mac)
+            if not stored_device:
                 return None  # Device not in database
             
-            stored_device = device_detail['device']
             stored_type = stored_device.get('device_type')
             
             # Don't use cache if stored type is unknown
@@ -1118,10 +1125,8 @@ class DeviceTypeClassifier:
             # Build current evidence signature
             current_sig = self._build_evidence_signature(context, scan_mode)
             
-            # Get stored signature from evidence table
-            from bleep.core.observations import get_device_evidence_signature
-            
-            stored_sig = get_device_evidence_signature(mac)
+            # Stored signature from the evidence table (LRU-cached per MAC)
+            stored_sig = stored_device.get('signature')
             
             # If no stored signature exists, fall back to simple device property comparison
             if stored_sig is None:
@@ -1296,6 +1301,41 @@ class DeviceTypeClassifier:
         
         return matches / total if total > 0 else 0.0
     
+    @staticmethod
+    def _evidence_records(
+        mac: str,
+        evidence: EvidenceSet,
+        result: ClassificationResult
+    ) -> List[Dict[str, Any]]:
+        """Evidence rows (``store_device_type_evidence`` kwargs) for one classification."""
+        records = [
+            {
+                "mac": mac,
+                "evidence_type": ev.evidence_type.value,
+                "evidence_weight": ev.weight.value,
+                "source": ev.source,
+                "value": ev.value,
+                "metadata": ev.metadata,
+            }
+            for evidence_list in evidence._evidence.values()
+            for ev in evidence_list
+        ]
+        # Also store the classification result as metadata
+        # This helps with debugging and understanding classification decisions
+        records.append({
+            "mac": mac,
+            "evidence_type": "classification_result",
+            "evidence_weight": "inconclusive",  # Not used for classification
+            "source": "device_type_classifier",
+            "value": result.device_type,
+            "metadata": {
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+                "cached": result.cached
+            },
+        })
+        return records
+    
     def _store_evidence_signature(
         self,
         mac: str,
@@ -1311,32 +1351,8 @@ class DeviceTypeClassifier:
         try:
             from bleep.core.observations import store_device_type_evidence
             
-            # Store each piece of evidence in the database
-            for evidence_type, evidence_list in evidence._evidence.items():
-                for ev in evidence_list:
-                    store_device_type_evidence(
-                        mac=mac,
-                        evidence_type=ev.evidence_type.value,
-                        evidence_weight=ev.weight.value,
-                        source=ev.source,
-                        value=ev.value,
-                        metadata=ev.metadata
-                    )
-            
-            # Also store the classification result as metadata
-            # This helps with debugging and understanding classification decisions
-            store_device_type_evidence(
-                mac=mac,
-                evidence_type="classification_result",
-                evidence_weight="inconclusive",  # Not used for classification
-                source="device_type_classifier",
-                value=result.device_type,
-                metadata={
-                    "confidence": result.confidence,
-                    "reasoning": result.reasoning,
-                    "cached": result.cached
-                }
-            )
+            for record in self._evidence_records(mac, evidence, result):
+                store_device_type_evidence(**record)
             
         except Exception as e:
             # Don't fail classification if evidence storage fails
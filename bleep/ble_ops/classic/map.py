@@ -10,6 +10,9 @@ Limitations / future expansion:
   - Multi-instance MAS is supported via ``list_mas_instances()`` and the
     ``instance`` parameter on all session-based operations.
   - ``push_message`` targets ``telecom/msg/outbox`` by default.
+  - ``sync_messages`` / ``download_all_messages`` reuse one session for the
+    whole folder walk and skip messages recorded in the ``map_messages``
+    manifest of the observation database.
   - BIP-related features (image thumbnails in messages) are not handled.
   - SMS-only; MMS attachment download is not implemented beyond what
     ``Message1.Get`` with ``attachment=True`` provides.
@@ -360,9 +363,15 @@ def download_all_messages(
     timeout: int = 120,
     instance: Optional[int] = None,
     progress_cb: Optional[Callable[[str, int, int, str], None]] = None,
+    incremental: bool = True,
+    verify: bool = False,
+    window: Optional[int] = None,
 ) -> Dict[str, List[Path]]:
     """Download every message from the remote device into *dest_dir*.
 
+    Thin wrapper around :func:`sync_messages` (one session for the whole
+    walk, manifest-based skipping, pipelined transfers).
+
     Parameters
     ----------
     folders : list of str, optional
@@ -371,87 +380,227 @@ def download_all_messages(
         ``MaxCount`` filter per folder to limit listing size.
     progress_cb : callable, optional
         ``progress_cb(folder, current_1based, total, dest_path)`` called
-        after each successful download.
+        after each download attempt (``total`` counts messages fetched in
+        that folder, not ones skipped as unchanged).
+    incremental : bool
+        Skip messages already recorded in the manifest (default ``True``).
 
-    Returns a mapping ``{folder: [Path, ...]}``.
+    Returns a mapping ``{folder: [Path, ...]}`` covering downloaded *and*
+    unchanged messages.
+    """
+    return sync_messages(
+        mac_address, dest_dir,
+        folders=folders, max_count=max_count, timeout=timeout,
+        instance=instance, progress_cb=progress_cb,
+        incremental=incremental, verify=verify, window=window,
+    )["folders"]
+
+
+def sync_messages(
+    mac_address: str,
+    dest_dir: str,
+    *,
+    folders: Optional[List[str]] = None,
+    max_count: Optional[int] = None,
+    timeout: int = 120,
+    instance: Optional[int] = None,
+    progress_cb: Optional[Callable[[str, int, int, str], None]] = None,
+    incremental: bool = True,
+    verify: bool = False,
+    window: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Mirror the remote message store into *dest_dir*, fetching only changes.
+
+    One obexd session is used for the folder walk, every listing and every
+    transfer.  A message is skipped when the ``map_messages`` manifest in the
+    observation DB has the same ``Size`` and ``Timestamp`` for its
+    ``(folder, handle)`` and the recorded file still exists at the target
+    path (``verify=True`` also re-checks its SHA-1).  The remaining messages
+    are fetched with up to *window* transfers queued in obexd
+    (``BLEEP_MAP_PIPELINE``, default 4), and the manifest is updated as they
+    complete, so an interrupted run resumes where it stopped.
+
+    Returns ``{"folders": {folder: [Path, ...]}, "downloaded": n,
+    "unchanged": n, "failed": n}``.
     """
-    import re
     import dbus as _dbus
 
     mac_address = mac_address.strip().upper()
-    dest = Path(dest_dir)
+    # Absolute, like the paths get_messages() returns and the manifest stores
+    dest = Path(dest_dir).resolve()
     dest.mkdir(parents=True, exist_ok=True)
+    if window is None:
+        window = _default_pipeline_window()
+
+    manifest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if incremental and _obs:
+        try:
+            for row in _obs.get_map_manifest(mac_address, instance):
+                manifest[(row["folder"], row["handle"])] = row
+        except Exception as exc:
+            print_and_log(f"[MAP] sync: manifest unavailable: {exc}", LOG__DEBUG)
 
-    if folders is None:
-        tree = list_folder_tree(mac_address, timeout=timeout, instance=instance)
-        folders = sorted(collect_leaf_paths(tree))
+    filters: Optional[Dict[str, Any]] = None
+    if max_count is not None:
+        filters = {"MaxCount": _dbus.UInt16(max_count)}
+
+    stats: Dict[str, Any] = {"folders": {}, "downloaded": 0, "unchanged": 0, "failed": 0}
+    with _session(mac_address, timeout, instance) as sess:
+        if folders is None:
+            folders = sorted(collect_leaf_paths(sess.walk_folder_tree()))
+
+        print_and_log(
+            f"[MAP] download-all: {len(folders)} folder(s) on {mac_address} "
+            f"({len(manifest)} message(s) in manifest)",
+            LOG__GENERAL,
+        )
+        for folder in folders:
+            stats["folders"][folder] = _sync_folder(
+                sess, mac_address, instance, folder, dest, filters,
+                manifest, verify, window, progress_cb, stats,
+            )
 
     print_and_log(
-        f"[MAP] download-all: {len(folders)} folder(s) on {mac_address}", LOG__GENERAL,
+        f"[MAP] download-all: {stats['downloaded']} downloaded, "
+        f"{stats['unchanged']} unchanged, {stats['failed']} failed",
+        LOG__DEBUG,
     )
+    return stats
 
-    results: Dict[str, List[Path]] = {}
-    for folder in folders:
-        short = re.sub(r"^telecom/msg/", "", folder)
-        safe = short.replace("/", "_") or folder.replace("/", "_")
 
-        filters: Optional[Dict[str, Any]] = None
-        if max_count is not None:
-            filters = {"MaxCount": _dbus.UInt16(max_count)}
+# Manifest rows are written in batches of this size while a folder downloads
+_MANIFEST_BATCH = 50
 
-        try:
-            with _session(mac_address, timeout, instance) as sess:
-                if folder:
-                    sess.set_folder(folder)
-                msgs = sess.list_messages("", filters=filters)
-
-                if not msgs:
-                    print_and_log(f"[MAP] {folder}: empty", LOG__DEBUG)
-                    results[folder] = []
-                    continue
-
-                downloaded: List[Path] = []
-                for idx, m in enumerate(msgs, 1):
-                    handle = (
-                        m.get("path", "").rsplit("message", 1)[-1]
-                        if "path" in m
-                        else None
-                    )
-                    if not handle:
-                        continue
-
-                    fname = f"{safe}_{handle}.bmsg"
-                    file_dest = str(dest / fname)
-                    try:
-                        result_path = sess.get_message(
-                            handle, file_dest, folder="",
-                        )
-                        downloaded.append(result_path)
-                        if progress_cb:
-                            progress_cb(folder, idx, len(msgs), str(result_path))
-                    except Exception as exc:
-                        print_and_log(
-                            f"[MAP] download-all: get {handle} in {folder} "
-                            f"failed: {exc}",
-                            LOG__DEBUG,
-                        )
-                        if progress_cb:
-                            progress_cb(folder, idx, len(msgs), f"FAILED: {exc}")
-
-                    if _obs:
-                        try:
-                            _obs.upsert_map_access(mac_address, handle, "get")
-                        except Exception:
-                            pass
-
-                results[folder] = downloaded
-        except Exception as exc:
-            print_and_log(
-                f"[MAP] download-all: folder '{folder}' failed: {exc}", LOG__DEBUG,
-            )
-            results[folder] = []
 
-    return results
+def _default_pipeline_window() -> int:
+    try:
+        return max(1, int(_os.getenv("BLEEP_MAP_PIPELINE", "4")))
+    except ValueError:
+        return 4
+
+
+def _message_handle(msg: Dict[str, Any]) -> Optional[str]:
+    return msg.get("path", "").rsplit("message", 1)[-1] if "path" in msg else None
+
+
+def _file_hash(path: str) -> Optional[str]:
+    import hashlib
+
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _is_unchanged(row: Optional[Dict[str, Any]], entry: Dict[str, Any], verify: bool) -> bool:
+    """True when manifest *row* still describes the listed message *entry*."""
+    if row is None:
+        return False
+    if row.get("size") != entry["size"] or row.get("datetime") != entry["datetime"]:
+        return False
+    if row.get("path") != entry["path"] or not _os.path.isfile(entry["path"]):
+        return False
+    return not verify or row.get("hash") == _file_hash(entry["path"])
+
+
+def _record_manifest(mac: str, entries: List[Dict[str, Any]], instance: Optional[int]) -> None:
+    if not _obs or not entries:
+        return
+    try:
+        _obs.upsert_map_manifest(mac, entries, instance)
+    except Exception as exc:
+        print_and_log(f"[MAP] sync: manifest update failed: {exc}", LOG__DEBUG)
+
+
+def _sync_folder(
+    sess: MapSession,
+    mac_address: str,
+    instance: Optional[int],
+    folder: str,
+    dest: Path,
+    filters: Optional[Dict[str, Any]],
+    manifest: Dict[Tuple[str, str], Dict[str, Any]],
+    verify: bool,
+    window: int,
+    progress_cb: Optional[Callable[[str, int, int, str], None]],
+    stats: Dict[str, Any],
+) -> List[Path]:
+    """List *folder* in *sess* and fetch its new or changed messages."""
+    short = _re.sub(r"^telecom/msg/", "", folder)
+    safe = short.replace("/", "_") or folder.replace("/", "_")
+
+    try:
+        sess.change_folder(folder)
+        msgs = sess.list_messages("", filters=filters)
+    except Exception as exc:
+        print_and_log(
+            f"[MAP] download-all: folder '{folder}' failed: {exc}", LOG__DEBUG,
+        )
+        return []
+
+    paths: List[Path] = []
+    pending: Dict[str, Dict[str, Any]] = {}
+    for m in msgs:
+        handle = _message_handle(m)
+        if not handle:
+            continue
+        entry = {
+            "folder": folder,
+            "handle": handle,
+            "size": m.get("Size"),
+            "datetime": m.get("Timestamp"),
+            "path": str(dest / f"{safe}_{handle}.bmsg"),
+        }
+        if _is_unchanged(manifest.get((folder, handle)), entry, verify):
+            paths.append(Path(entry["path"]))
+            stats["unchanged"] += 1
+        else:
+            pending[handle] = entry
+
+    print_and_log(
+        f"[MAP] {folder}: {len(msgs)} listed, {len(pending)} to fetch", LOG__DEBUG,
+    )
+    if not pending:
+        return paths
+
+    total = len(pending)
+    done: List[Dict[str, Any]] = []
+    try:
+        items = [(handle, entry["path"]) for handle, entry in pending.items()]
+        for idx, (handle, result) in enumerate(sess.get_messages(items, window=window), 1):
+            if not isinstance(result, Exception) and not result.exists():
+                result = RuntimeError("transfer finished but no file was written")
+            if isinstance(result, Exception):
+                stats["failed"] += 1
+                print_and_log(
+                    f"[MAP] download-all: get {handle} in {folder} failed: {result}",
+                    LOG__DEBUG,
+                )
+                if progress_cb:
+                    progress_cb(folder, idx, total, f"FAILED: {result}")
+                continue
+
+            if _obs:
+                try:
+                    _obs.upsert_map_access(mac_address, handle, "get")
+                except Exception:
+                    pass
+
+            entry = pending[handle]
+            entry["path"] = str(result)
+            entry["hash"] = _file_hash(entry["path"])
+            done.append(entry)
+            paths.append(result)
+            stats["downloaded"] += 1
+            if progress_cb:
+                progress_cb(folder, idx, total, str(result))
+            if len(done) >= _MANIFEST_BATCH:
+                _record_manifest(mac_address, done, instance)
+                done = []
+    finally:
+        _record_manifest(mac_address, done, instance)
+    return paths
 
 
 _SESSION_RETRY_ERRORS = ("CreateSession", "Timed out", "Timeout")
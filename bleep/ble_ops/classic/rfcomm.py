@@ -15,14 +15,25 @@ Classification of the concatenated response:
     * ``data``      — non-empty binary response that doesn't match above
     * ``closed``    — connection refused or reset by peer (RFCOMM rejected)
     * ``silent``    — connection succeeded but no response within timeout
+
+:func:`probe_all_channels` runs the same sequence on several channels at once
+from a single :mod:`selectors` loop: connects are non-blocking, each probe is
+sent as soon as its socket is ready, and a channel stops early once its reply
+classifies as ``terminal`` or ``ssh``.  At most ``concurrency`` channels
+(``BLEEP_RFCOMM_CONCURRENCY``, default 4) are in flight, since every DLC to a
+device shares one ACL link and RFCOMM session.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import errno
+import os
+import selectors
 import socket
 import time
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from bleep.core.log import print_and_log, LOG__DEBUG, LOG__GENERAL
 from bleep.ble_ops.classic.connect import classic_rfccomm_open
@@ -122,14 +133,36 @@ def probe_all_channels(
     *,
     timeout: float = 4.0,
     read_window: float = 1.5,
+    concurrency: Optional[int] = None,
 ) -> List[ProbeResult]:
-    """Probe multiple RFCOMM channels sequentially."""
+    """Probe multiple RFCOMM channels, up to *concurrency* at a time.
+
+    Returns one :class:`ProbeResult` per entry of *channels*, in the same
+    order (a channel listed twice is probed once).  *concurrency* defaults to
+    ``BLEEP_RFCOMM_CONCURRENCY`` (4); ``1`` probes the channels one after
+    another with :func:`probe_rfcomm_channel`.
+    """
+    mac = mac.strip().upper()
+    if concurrency is None:
+        concurrency = _default_concurrency()
+
+    if concurrency <= 1:
+        results = []
+        for ch in channels:
+            print_and_log(f"[*] Probing RFCOMM channel {ch}...", LOG__GENERAL)
+            results.append(
+                probe_rfcomm_channel(mac, ch, timeout=timeout, read_window=read_window)
+            )
+        return results
+
+    unique = list(dict.fromkeys(channels))
+    by_channel = _probe_concurrently(mac, unique, timeout, read_window, concurrency)
+    seen = set()
     results = []
     for ch in channels:
-        print_and_log(f"[*] Probing RFCOMM channel {ch}...", LOG__GENERAL)
-        results.append(
-            probe_rfcomm_channel(mac, ch, timeout=timeout, read_window=read_window)
-        )
+        result = by_channel[ch]
+        results.append(dataclasses.replace(result) if ch in seen else result)
+        seen.add(ch)
     return results
 
 
@@ -280,3 +313,190 @@ def _classify(data: bytes) -> str:
         return "serial"
 
     return "data"
+
+
+# ---------------------------------------------------------------------------
+# Concurrent sweep (selectors)
+# ---------------------------------------------------------------------------
+
+# Bytes sent at the start of each read window; None = passive read
+_PROBES = (b"\r\n", b"\x1b[c", None)
+
+# Classifications that end a channel's probing early.  A VT100 DA reply or
+# an SSH banner already identifies the service, so the remaining probes are
+# skipped.  This is a heuristic, not a guarantee: more data could still
+# change _classify()'s answer (e.g. trailing bytes after the DA reply).
+_FINAL_CLASSES = ("terminal", "ssh")
+
+
+def _default_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("BLEEP_RFCOMM_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
+def _errno_text(code: int) -> str:
+    # Same text as str(OSError) from a blocking connect
+    return str(OSError(code, os.strerror(code)))
+
+
+class _ChannelProbe:
+    """State of one channel inside :func:`_probe_concurrently`."""
+
+    def __init__(self, mac: str, channel: int, timeout: float):
+        self.channel = channel
+        self.t0 = time.monotonic()
+        self.deadline = self.t0 + timeout
+        self.phase = -1  # -1 = connecting, else index into _PROBES
+        self.collected = b""
+        self.result: Optional[ProbeResult] = None
+
+        print_and_log(f"[*] Probing RFCOMM channel {channel}...", LOG__GENERAL)
+        print_and_log(
+            f"[rfcomm-probe] Connecting RFCOMM → {mac}:{channel} (non-blocking)", LOG__DEBUG
+        )
+        self.sock = socket.socket(socket.AF_BLUETOOTH, socket.SOCK_STREAM, socket.BTPROTO_RFCOMM)
+        try:
+            self.sock.setblocking(False)
+            rc = self.sock.connect_ex((mac, channel))
+        except OSError:
+            self.sock.close()
+            raise
+        if rc not in (0, errno.EINPROGRESS, errno.EAGAIN):
+            self.fail(_errno_text(rc))
+
+    def fail(self, error: str) -> None:
+        """Finish as ``closed`` (connect refused / reset)."""
+        print_and_log(f"[rfcomm-probe] ch={self.channel} connect failed: {error}", LOG__DEBUG)
+        self.result = ProbeResult(
+            channel=self.channel,
+            classification="closed",
+            error=error,
+            latency_ms=(time.monotonic() - self.t0) * 1000,
+        )
+
+    def connected(self, read_window: float) -> None:
+        err = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err:
+            self.fail(_errno_text(err))
+            return
+        self.next_phase(read_window)
+
+    def next_phase(self, read_window: float) -> None:
+        """Send the next probe and open its read window, or finish."""
+        self.phase += 1
+        if self.phase >= len(_PROBES):
+            self.finish()
+            return
+        self.deadline = time.monotonic() + read_window
+        probe = _PROBES[self.phase]
+        if probe is not None:
+            try:
+                self.sock.send(probe)
+            except OSError:
+                pass
+
+    def readable(self) -> None:
+        try:
+            chunk = self.sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            chunk = b""
+        if not chunk:
+            self.finish()
+            return
+        self.collected += chunk
+        if _classify(self.collected) in _FINAL_CLASSES:
+            self.finish()
+
+    def finish(self) -> None:
+        elapsed = (time.monotonic() - self.t0) * 1000
+        classification = _classify(self.collected)
+        print_and_log(
+            f"[rfcomm-probe] ch={self.channel} class={classification} "
+            f"bytes={len(self.collected)} latency={elapsed:.0f}ms",
+            LOG__DEBUG,
+        )
+        self.result = ProbeResult(
+            channel=self.channel,
+            classification=classification,
+            raw_response=self.collected,
+            latency_ms=elapsed,
+        )
+
+    def close(self) -> None:
+        if self.phase >= 0:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.sock.close()
+
+
+def _probe_concurrently(
+    mac: str,
+    channels: List[int],
+    timeout: float,
+    read_window: float,
+    concurrency: int,
+) -> Dict[int, ProbeResult]:
+    """Probe *channels* from one selector loop with a shared deadline scan."""
+    pending = list(reversed(channels))
+    active: Dict[int, _ChannelProbe] = {}
+    results: Dict[int, ProbeResult] = {}
+    sel = selectors.DefaultSelector()
+
+    def settle(probe: _ChannelProbe) -> None:
+        if probe.result is None:
+            return
+        del active[probe.channel]
+        sel.unregister(probe.sock)
+        probe.close()
+        results[probe.channel] = probe.result
+
+    try:
+        while pending or active:
+            while pending and len(active) < concurrency:
+                ch = pending.pop()
+                try:
+                    probe = _ChannelProbe(mac, ch, timeout)
+                except OSError as exc:
+                    results[ch] = ProbeResult(channel=ch, classification="closed", error=str(exc))
+                    continue
+                if probe.result is not None:
+                    probe.close()
+                    results[ch] = probe.result
+                    continue
+                active[ch] = probe
+                sel.register(probe.sock, selectors.EVENT_WRITE, probe)
+
+            now = time.monotonic()
+            wait = max(0.0, min(p.deadline for p in active.values()) - now) if active else 0.0
+            for key, _mask in sel.select(wait):
+                probe = key.data
+                if probe.result is not None:
+                    continue
+                if probe.phase < 0:
+                    probe.connected(read_window)
+                    if probe.result is None:
+                        sel.modify(probe.sock, selectors.EVENT_READ, probe)
+                else:
+                    probe.readable()
+                settle(probe)
+
+            now = time.monotonic()
+            for probe in list(active.values()):
+                if now < probe.deadline:
+                    continue
+                if probe.phase < 0:
+                    probe.fail("timed out")
+                else:
+                    probe.next_phase(read_window)
+                settle(probe)
+    finally:
+        for probe in active.values():
+            probe.close()
+        sel.close()
+    return results
@@ -69,16 +69,10 @@ def _discover_services_dbus(mac_address: str, timeout: int = 5) -> List[Dict[str
     mac_address = mac_address.strip().upper()
 
     try:
+        from bleep.dbus.object_mirror import find_device_path
+
         bus = dbus.SystemBus()
-        om = dbus.Interface(bus.get_object("org.bluez", "/"), "org.freedesktop.DBus.ObjectManager")
-        objects = om.GetManagedObjects()
-        device_path = None
-        for path, ifaces in objects.items():
-            if "org.bluez.Device1" not in ifaces:
-                continue
-            if ifaces["org.bluez.Device1"].get("Address", "").upper() == mac_address:
-                device_path = path
-                break
+        device_path = find_device_path(mac_address)
 
         if not device_path:
             print_and_log("[classic_sdp] Device not found on bus for D-Bus SDP", LOG__DEBUG)
@@ -830,59 +830,34 @@ def format_device_info_block(
 # SIG data resolution helpers (M5)
 # ---------------------------------------------------------------------------
 
-_COMPANY_IDENTS_CACHE: Optional[Dict] = None
-_AD_TYPES_CACHE: Optional[Dict] = None
-_APPEARANCE_SIG_CACHE: Optional[Dict] = None
-
-
 def _resolve_company_name(company_id: int) -> Optional[str]:
     """Resolve a 16-bit company identifier to its BT SIG registered name."""
-    global _COMPANY_IDENTS_CACHE
-    if _COMPANY_IDENTS_CACHE is None:
-        try:
-            from bleep.bt_ref.uuids import SPEC_ID_NAMES__COMPANY_IDENTS
-            _COMPANY_IDENTS_CACHE = SPEC_ID_NAMES__COMPANY_IDENTS
-        except ImportError:
-            _COMPANY_IDENTS_CACHE = {}
-    key = f"0x{company_id:04x}"
-    return _COMPANY_IDENTS_CACHE.get(key)
+    from bleep.bt_ref.sig_lookup import get_company_name
+
+    return get_company_name(company_id)
 
 
 def _resolve_ad_type_name(ad_type: int) -> Optional[str]:
     """Resolve an Advertising Data type code to its BT SIG name."""
-    global _AD_TYPES_CACHE
-    if _AD_TYPES_CACHE is None:
-        try:
-            from bleep.bt_ref.uuids import SPEC_ID_NAMES__ADVERTISING_TYPES
-            _AD_TYPES_CACHE = SPEC_ID_NAMES__ADVERTISING_TYPES
-        except ImportError:
-            _AD_TYPES_CACHE = {}
-    key = f"0x{ad_type:04x}"
-    return _AD_TYPES_CACHE.get(key)
+    from bleep.bt_ref.sig_lookup import sig_id_name
+
+    return sig_id_name("advertising_types", ad_type)
 
 
 def _resolve_appearance_sig(appearance_value: int) -> Optional[str]:
     """Resolve a 16-bit appearance value through the SIG table.
 
-    The SIG table uses category-level string keys (``"0x0002"`` = Computer).
+    The SIG table uses category-level keys (``0x0002`` = Computer).
     The 16-bit appearance encodes ``category << 6 | subcategory``.  We try
     the exact value first, then fall back to the category.
     """
-    global _APPEARANCE_SIG_CACHE
-    if _APPEARANCE_SIG_CACHE is None:
-        try:
-            from bleep.bt_ref.uuids import SPEC_ID_NAMES__APPEARANCE_VALUES
-            _APPEARANCE_SIG_CACHE = SPEC_ID_NAMES__APPEARANCE_VALUES
-        except ImportError:
-            _APPEARANCE_SIG_CACHE = {}
-    exact = f"0x{appearance_value:04x}"
-    hit = _APPEARANCE_SIG_CACHE.get(exact)
+    from bleep.bt_ref.sig_lookup import sig_id_name
+
+    hit = sig_id_name("appearance_values", appearance_value)
     if hit:
         return hit
     # Fall back to category (top 10 bits)
-    category = appearance_value >> 6
-    cat_key = f"0x{category:04x}"
-    return _APPEARANCE_SIG_CACHE.get(cat_key)
+    return sig_id_name("appearance_values", appearance_value >> 6)
 
 
 __all__ = [
@@ -965,7 +940,7 @@ def format_gatt_tree(
     When *device_props* is supplied (a ``Properties.GetAll("org.bluez.Device1")``
     dict), a ``Device Information`` block is prepended before the GATT tree.
     """
-    from bleep.bt_ref.utils import get_name_from_uuid
+    from bleep.bt_ref.utils import get_names_from_uuids
 
     lines: list[str] = []
 
@@ -981,10 +956,19 @@ def format_gatt_tree(
     lines.append(header)
     lines.append("=" * len(header))
 
+    # Resolve every service/characteristic/descriptor name in one batch
+    all_uuids: list[str] = []
+    for svc_uuid, svc_data in mapping.items():
+        all_uuids.append(svc_uuid)
+        for char_uuid, char_data in (svc_data.get("Characteristics") or svc_data.get("chars") or {}).items():
+            all_uuids.append(char_uuid)
+            all_uuids.extend(char_data.get("Descriptors") or char_data.get("descriptors") or {})
+    names = get_names_from_uuids(all_uuids)
+
     svc_keys = list(mapping.keys())
     for si, svc_uuid in enumerate(svc_keys):
         svc_data = mapping[svc_uuid]
-        svc_name = get_name_from_uuid(svc_uuid)
+        svc_name = names[svc_uuid]
         svc_prefix = "└── " if si == len(svc_keys) - 1 else "├── "
         svc_cont   = "    " if si == len(svc_keys) - 1 else "│   "
         svc_primary = svc_data.get("Primary")
@@ -1011,7 +995,7 @@ def format_gatt_tree(
         char_keys = list(chars.keys())
         for ci, char_uuid in enumerate(char_keys):
             char_data = chars[char_uuid]
-            char_name = get_name_from_uuid(char_uuid)
+            char_name = names[char_uuid]
             ch_prefix = "└── " if ci == len(char_keys) - 1 else "├── "
             ch_cont   = "    " if ci == len(char_keys) - 1 else "│   "
 
@@ -1064,7 +1048,7 @@ def format_gatt_tree(
                 desc_data = descs[desc_uuid]
                 d_prefix = "└── " if di == len(desc_keys) - 1 else "├── "
                 d_cont   = "    " if di == len(desc_keys) - 1 else "│   "
-                d_name = get_name_from_uuid(desc_uuid)
+                d_name = names[desc_uuid]
                 d_handle = desc_data.get("Handle") or desc_data.get("handle")
                 d_label = f"{svc_cont}{ch_cont}{d_prefix}Desc: {desc_uuid}"
                 if d_handle:
@@ -1,6 +1,7 @@
 """UUID utility functions for Bluetooth operations."""
 
-from typing import Set, Optional
+from typing import FrozenSet, Set, Optional
+from functools import lru_cache
 import re
 import logging
 
@@ -24,6 +25,12 @@ def identify_uuid(uuid: str) -> Set[str]:
     Set[str]
         A set of possible canonical representations of the UUID
     """
+    # Normalization is memoized; hand out a fresh set callers may modify
+    return set(_identify_uuid_cached(uuid))
+
+
+@lru_cache(maxsize=4096)
+def _identify_uuid_cached(uuid: str) -> FrozenSet[str]:
     # Normalize input: remove dashes and convert to lowercase
     target = uuid.replace("-", "").lower()
     canonical_targets: set[str] = set()
@@ -79,7 +86,7 @@ def identify_uuid(uuid: str) -> Set[str]:
     if short_uuid:
         canonical_targets.add(short_uuid)
     
-    return canonical_targets
+    return frozenset(canonical_targets)
 
 
 def match_uuid(target_uuid: str, available_uuids: list[str]) -> Optional[str]:
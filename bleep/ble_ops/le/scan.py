@@ -35,6 +35,8 @@ from bleep.core.constants import (
     BT_DEVICE_TYPE_DUAL
 )
 import json as _json
+import os
+import time
 from typing import Any, Dict
 
 
@@ -46,6 +48,122 @@ def _json_compact(obj: Any) -> str:
         return "{}"
 
 
+def _scan_entry_device_info(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate one adapter discovery entry into ``devices`` columns."""
+    name = entry.get("name") or entry.get("alias") or "?"
+    rssi_val = entry.get("rssi")
+    device_info: Dict[str, Any] = {
+        'name': name,
+        'rssi_last': rssi_val,
+        'addr_type': entry.get("address_type"),
+    }
+
+    # Seed rssi_min/rssi_max so the DB can track the observed range
+    if rssi_val is not None:
+        device_info['rssi_min'] = rssi_val
+        device_info['rssi_max'] = rssi_val
+    # Multi-adapter scans carry one reading per adapter
+    per_adapter = [v for v in (entry.get("rssi_by_adapter") or {}).values() if v is not None]
+    if per_adapter:
+        device_info['rssi_min'] = min(per_adapter)
+        device_info['rssi_max'] = max(per_adapter)
+
+    if entry.get("device_class") is not None:
+        device_info['device_class'] = entry["device_class"]
+
+    # v10 enrichment from adapter discovery data
+    if entry.get("tx_power") is not None:
+        device_info['tx_power'] = int(entry["tx_power"])
+    if entry.get("appearance") is not None:
+        device_info['appearance'] = int(entry["appearance"])
+    if entry.get("modalias"):
+        device_info['modalias'] = str(entry["modalias"])
+    if entry.get("icon"):
+        device_info['icon'] = str(entry["icon"])
+    if entry.get("manufacturer_data"):
+        # Pick the entry with the longest payload (most informative)
+        best_key, best_val = None, b''
+        for mfr_key, mfr_val in entry["manufacturer_data"].items():
+            val_bytes = bytes(mfr_val)
+            if len(val_bytes) >= len(best_val):
+                best_key, best_val = mfr_key, val_bytes
+        if best_key is not None:
+            device_info['manufacturer_id'] = int(best_key)
+            device_info['manufacturer_data'] = best_val
+    if entry.get("service_data"):
+        device_info['service_data'] = _json_compact(
+            {k: v.hex() if isinstance(v, bytes) else str(v)
+             for k, v in entry["service_data"].items()}
+        )
+    if entry.get("advertising_data"):
+        device_info['advertising_data'] = _json_compact(
+            {str(k): v.hex() if isinstance(v, bytes) else str(v)
+             for k, v in entry["advertising_data"].items()}
+        )
+    return device_info
+
+
+def _persist_scan_results(raw: list[dict], scan_mode: str = "passive") -> None:
+    """Classify every discovered device, then persist the batch in one transaction.
+
+    Classification runs first (it only reads the DB via the classifier's
+    signature cache) and hands its evidence rows back instead of storing
+    them; devices and evidence are then written by a single
+    :func:`observations.upsert_devices_bulk` call instead of per-device
+    commits.
+    """
+    from bleep.analysis.device_type_classifier import DeviceTypeClassifier
+    classifier = DeviceTypeClassifier()  # Create once, reuse for all devices
+
+    batch = []
+    evidence: list[dict] = []
+    for entry in raw:
+        addr = entry.get("address", "??")
+        if addr == "??":
+            continue
+        try:
+            device_info = _scan_entry_device_info(entry)
+
+            context = {
+                "device_class": entry.get("device_class"),
+                "address_type": entry.get("address_type"),
+                "uuids": entry.get("uuids", []),
+                "connected": entry.get("connected", False),
+                "service_data": entry.get("service_data", {}),
+                "advertising_data": entry.get("advertising_data", {}),
+                "manufacturer_data": entry.get("manufacturer_data", {}),
+            }
+            result = classifier.classify_with_mode(
+                mac=addr,
+                context=context,
+                scan_mode=scan_mode,
+                use_database_cache=True,
+                evidence_sink=evidence,
+            )
+            device_info['device_type'] = result.device_type
+            device_info['mac'] = addr
+            batch.append(device_info)
+
+        except Exception as e:
+            # Preserve behavior (continue scanning) but include structured
+            # D-Bus diagnostics when applicable.
+            if hasattr(e, "get_dbus_name") and hasattr(e, "get_dbus_message"):
+                print_and_log(
+                    f"[-] Error processing device {addr}: {e.get_dbus_name()}: {e.get_dbus_message() or ''}",
+                    LOG__DEBUG,
+                )
+            else:
+                print_and_log(f"[-] Error processing device {addr}: {e}", LOG__DEBUG)
+
+    if not batch:
+        return
+    try:
+        written = _obs.upsert_devices_bulk(batch, evidence=evidence)
+        print_and_log(f"[DEBUG] Persisted {written} scanned device(s) in one batch", LOG__DEBUG)
+    except Exception as e:
+        print_and_log(f"[-] Error persisting scan results: {e}", LOG__DEBUG)
+
+
 def _native_scan(device: str | None, timeout: int, transport: str = "auto", quiet: bool = False) -> int:
     """Perform a simple LE discovery using the refactored stack."""
 
@@ -80,98 +198,7 @@ def _native_scan(device: str | None, timeout: int, transport: str = "auto", quie
     
     # Always update observations if available
     if raw and _obs:
-        from bleep.analysis.device_type_classifier import DeviceTypeClassifier
-        classifier = DeviceTypeClassifier()  # Create once, reuse for all devices
-        
-        for entry in raw:
-            addr = entry.get("address", "??")
-            if addr == "??":
-                continue
-                
-            name = entry.get("name") or entry.get("alias") or "?"
-            rssi_val = entry.get("rssi")
-            addr_type = entry.get("address_type")
-            device_class = entry.get("device_class")
-            
-            try:
-                device_info = {
-                    'name': name,
-                    'rssi_last': rssi_val,
-                    'addr_type': addr_type,
-                }
-
-                # Seed rssi_min/rssi_max so the DB can track the observed range
-                if rssi_val is not None:
-                    device_info['rssi_min'] = rssi_val
-                    device_info['rssi_max'] = rssi_val
-
-                if device_class is not None:
-                    device_info['device_class'] = device_class
-
-                # v10 enrichment from adapter discovery data
-                if entry.get("tx_power") is not None:
-                    device_info['tx_power'] = int(entry["tx_power"])
-                if entry.get("appearance") is not None:
-                    device_info['appearance'] = int(entry["appearance"])
-                if entry.get("modalias"):
-                    device_info['modalias'] = str(entry["modalias"])
-                if entry.get("icon"):
-                    device_info['icon'] = str(entry["icon"])
-                if entry.get("manufacturer_data"):
-                    # Pick the entry with the longest payload (most informative)
-                    best_key, best_val = None, b''
-                    for mfr_key, mfr_val in entry["manufacturer_data"].items():
-                        val_bytes = bytes(mfr_val)
-                        if len(val_bytes) >= len(best_val):
-                            best_key, best_val = mfr_key, val_bytes
-                    if best_key is not None:
-                        device_info['manufacturer_id'] = int(best_key)
-                        device_info['manufacturer_data'] = best_val
-                if entry.get("service_data"):
-                    device_info['service_data'] = _json_compact(
-                        {k: v.hex() if isinstance(v, bytes) else str(v)
-                         for k, v in entry["service_data"].items()}
-                    )
-                if entry.get("advertising_data"):
-                    device_info['advertising_data'] = _json_compact(
-                        {str(k): v.hex() if isinstance(v, bytes) else str(v)
-                         for k, v in entry["advertising_data"].items()}
-                    )
-
-                _obs.upsert_device(addr, **device_info)
-                
-                # STEP 2: NOW perform classification with database cache enabled
-                # Device exists in DB, so foreign key constraints will be satisfied
-                context = {
-                    "device_class": device_class,
-                    "address_type": addr_type,
-                    "uuids": entry.get("uuids", []),
-                    "connected": entry.get("connected", False),
-                    "service_data": entry.get("service_data", {}),
-                    "advertising_data": entry.get("advertising_data", {}),
-                    "manufacturer_data": entry.get("manufacturer_data", {}),
-                }
-                
-                result = classifier.classify_with_mode(
-                    mac=addr,
-                    context=context,
-                    scan_mode="passive",
-                    use_database_cache=True
-                )
-                
-                # STEP 3: Update device with classified device_type
-                _obs.upsert_device(addr, device_type=result.device_type)
-                
-            except Exception as e:
-                # Preserve behavior (continue scanning) but include structured
-                # D-Bus diagnostics when applicable.
-                if hasattr(e, "get_dbus_name") and hasattr(e, "get_dbus_message"):
-                    print_and_log(
-                        f"[-] Error processing device {addr}: {e.get_dbus_name()}: {e.get_dbus_message() or ''}",
-                        LOG__DEBUG,
-                    )
-                else:
-                    print_and_log(f"[-] Error processing device {addr}: {e}", LOG__DEBUG)
+        _persist_scan_results(raw)
 
     # Convert raw device list to dictionary format expected by higher-level code
     devices = {}
@@ -185,6 +212,262 @@ def _native_scan(device: str | None, timeout: int, transport: str = "auto", quie
     return devices
 
 
+def _parse_adapter_specs(adapters, default_transport: str = "auto") -> list[tuple[str, str]]:
+    """Parse ``hci0,hci1:le,hci2:bredr`` into ``[(name, transport), ...]``."""
+    if isinstance(adapters, str):
+        adapters = adapters.split(",")
+    specs: list[tuple[str, str]] = []
+    for item in adapters:
+        item = item.strip()
+        if not item:
+            continue
+        name, _, transport = item.partition(":")
+        transport = (transport or default_transport).lower()
+        if transport not in ("auto", "le", "bredr"):
+            raise ValueError(f"Invalid transport '{transport}' for adapter {name}")
+        if name not in [n for n, _ in specs]:
+            specs.append((name, transport))
+    return specs
+
+
+def _merge_adapter_results(per_adapter: Dict[str, list]) -> list[dict]:
+    """Merge discovery entries from several adapters by MAC address.
+
+    The first adapter that saw a device supplies the base entry.  Missing
+    fields are filled from the other adapters.  ``rssi`` becomes the strongest
+    reading, ``rssi_by_adapter`` keeps every adapter's reading and
+    ``adapters`` lists the adapters that saw the device.
+    """
+    merged: Dict[str, dict] = {}
+    for adapter_name, entries in per_adapter.items():
+        for entry in entries:
+            addr = (entry.get("address") or "").upper()
+            if not addr:
+                continue
+            current = merged.get(addr)
+            if current is None:
+                current = merged[addr] = dict(entry)
+                current["address"] = addr
+                current["uuids"] = list(entry.get("uuids") or [])
+                current["rssi_by_adapter"] = {}
+                current["adapters"] = []
+            else:
+                for key, value in entry.items():
+                    if current.get(key) in (None, "", [], {}) and value not in (None, "", [], {}):
+                        current[key] = value
+                for uuid in entry.get("uuids") or []:
+                    if uuid not in current["uuids"]:
+                        current["uuids"].append(uuid)
+            current["adapters"].append(adapter_name)
+            current["rssi_by_adapter"][adapter_name] = entry.get("rssi")
+            readings = [r for r in current["rssi_by_adapter"].values() if r is not None]
+            current["rssi"] = max(readings) if readings else None
+    return list(merged.values())
+
+
+def multi_adapter_scan(
+    adapters,
+    timeout: int = 10,
+    transport: str = "auto",
+    quiet: bool = False,
+    duplicate_data: bool | None = None,
+) -> Dict[str, dict]:
+    """Discover on several adapters at once and merge the results by MAC.
+
+    *adapters* is a list or comma-separated string of adapter names.  Each
+    name may carry its own transport (``hci1:le``); otherwise *transport*
+    applies.  Discovery is started on every adapter and runs concurrently
+    under a single GLib main-loop.  The merged batch is persisted once.
+    """
+    if not _HAS_NATIVE_STACK:
+        raise RuntimeError("GI/BlueZ runtime missing – multi_adapter_scan unavailable")
+
+    from bleep.dbuslayer.manager import run_discovery_concurrently
+
+    specs = _parse_adapter_specs(adapters, transport)
+    started: list[tuple[str, Any, Any]] = []
+    for name, adapter_transport in specs:
+        try:
+            adapter = _Adapter(name)
+            manager = adapter.create_device_manager()
+            manager.start_discovery(
+                timeout=timeout, transport=adapter_transport, duplicate_data=duplicate_data,
+            )
+            started.append((name, adapter, manager))
+            print_and_log(f"[*] Discovery started on {name} (transport={adapter_transport})", LOG__DEBUG)
+        except Exception as e:
+            print_and_log(f"[-] Skipping adapter {name}: {e}", LOG__GENERAL)
+
+    if not started:
+        print_and_log("[-] No adapter could start discovery", LOG__GENERAL)
+        return {}
+
+    run_discovery_concurrently([manager for _, _, manager in started])
+
+    per_adapter = {
+        name: adapter.get_discovered_devices(adapter_only=True)
+        for name, adapter, _ in started
+    }
+    merged = _merge_adapter_results(per_adapter)
+
+    if not quiet:
+        counts = ", ".join(f"{name}={len(entries)}" for name, entries in per_adapter.items())
+        print_and_log(f"[*] Discovered {len(merged)} unique device(s) ({counts})", LOG__GENERAL)
+        for entry in merged:
+            name = entry.get("name") or entry.get("alias") or "?"
+            readings = " ".join(
+                f"{a}={r if r is not None else '?'}" for a, r in entry["rssi_by_adapter"].items()
+            )
+            print_and_log(f"  {entry['address']} ({name}) - RSSI: {readings}", LOG__GENERAL)
+
+    if merged and _obs:
+        _persist_scan_results(merged, scan_mode="naggy" if duplicate_data is False else "passive")
+
+    return {entry["address"]: entry for entry in merged}
+
+
+def _stream_flush_interval() -> float:
+    try:
+        return float(os.getenv("BLEEP_SCAN_STREAM_FLUSH", "1.0"))
+    except ValueError:
+        return 1.0
+
+
+def _persisting_stream(stream, scan_mode: str, persist: bool, flush_interval: float):
+    """Yield *stream* entries and persist them in coalesced batches.
+
+    Entries are buffered per MAC and written with one
+    :func:`_persist_scan_results` call at most every *flush_interval*
+    seconds, plus a final flush when the stream ends.
+    """
+    persist = persist and bool(_obs)
+    pending: Dict[str, dict] = {}
+    last_flush = time.monotonic()
+
+    def _flush():
+        nonlocal last_flush
+        if pending:
+            _persist_scan_results(list(pending.values()), scan_mode=scan_mode)
+            pending.clear()
+        last_flush = time.monotonic()
+
+    stream.start()
+    try:
+        while not stream.finished:
+            for entry in stream.poll(flush_interval if persist else None):
+                if persist and entry.get("address"):
+                    pending[entry["address"].upper()] = entry
+                yield entry
+            if persist and time.monotonic() - last_flush >= flush_interval:
+                _flush()
+    finally:
+        stream.close()
+        if persist:
+            _flush()
+
+
+def _build_stream(timeout, transport, adapter, duplicate_data, updates):
+    if not _HAS_NATIVE_STACK:
+        raise RuntimeError("GI/BlueZ runtime missing – stream_scan unavailable")
+
+    from bleep.dbuslayer.discovery_stream import DiscoveryStream
+
+    discovery_filter: Dict[str, Any] = {"Transport": transport.lower()}
+    if duplicate_data is not None:
+        discovery_filter["DuplicateData"] = duplicate_data
+    return DiscoveryStream(
+        _Adapter(adapter) if adapter else _Adapter(),
+        timeout=timeout,
+        discovery_filter=discovery_filter,
+        updates=updates,
+    )
+
+
+def stream_scan(
+    timeout: float | None = 10,
+    transport: str = "auto",
+    *,
+    adapter: str | None = None,
+    duplicate_data: bool | None = None,
+    updates: bool = True,
+    persist: bool = True,
+    flush_interval: float | None = None,
+):
+    """Yield discovery entries as devices are seen instead of after *timeout*.
+
+    Entries have the ``get_discovered_devices()`` layout plus ``event``
+    (``"new"`` or ``"update"``, see :mod:`bleep.dbuslayer.discovery_stream`).
+    ``timeout=None`` streams until the consumer stops iterating.  When
+    *persist* is set, entries are written to the observation database in
+    batches every *flush_interval* seconds (``BLEEP_SCAN_STREAM_FLUSH``,
+    default 1.0).
+
+    Example::
+
+        for entry in stream_scan(timeout=None, transport="le"):
+            if entry["address"] == target:
+                break   # discovery is stopped when the generator closes
+    """
+    stream = _build_stream(timeout, transport, adapter, duplicate_data, updates)
+    interval = flush_interval if flush_interval is not None else _stream_flush_interval()
+    scan_mode = "naggy" if duplicate_data is False else "passive"
+    return _persisting_stream(stream, scan_mode, persist, interval)
+
+
+async def astream_scan(
+    timeout: float | None = 10,
+    transport: str = "auto",
+    *,
+    adapter: str | None = None,
+    duplicate_data: bool | None = None,
+    updates: bool = True,
+    persist: bool = True,
+    flush_interval: float | None = None,
+):
+    """Async-iterator form of :func:`stream_scan` (same parameters).
+
+    Discovery runs on a worker thread; entries are handed to the event loop
+    as they arrive.  Leaving the ``async for`` early stops discovery.
+    """
+    import asyncio
+    import threading
+
+    stream = _build_stream(timeout, transport, adapter, duplicate_data, updates)
+    interval = flush_interval if flush_interval is not None else _stream_flush_interval()
+    scan_mode = "naggy" if duplicate_data is False else "passive"
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    def _put(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            stream.stop()  # event loop closed underneath us
+
+    def _pump() -> None:
+        try:
+            for entry in _persisting_stream(stream, scan_mode, persist, interval):
+                _put(entry)
+        except Exception as exc:  # noqa: BLE001 – re-raised in the consumer
+            _put(exc)
+        finally:
+            _put(done)
+
+    thread = threading.Thread(target=_pump, name="bleep-stream-scan", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stream.stop()
+
+
 # ---------------------------------------------------------------------------
 # Legacy monolith loader *removed* – the following helpers have been deleted:
 #   * _load_monolith()
@@ -700,6 +983,9 @@ __all__ = [
     "naggy_scan",
     "pokey_scan",
     "brute_scan",
+    "multi_adapter_scan",
+    "stream_scan",
+    "astream_scan",
     "create_and_return__bluetooth_scan__discovered_devices",
     "create_and_return__bluetooth_scan__discovered_devices__specific_adapter",
 ]
@@ -90,9 +90,8 @@ def decode_pnp_id_vendor(vendor_id_source: int, vendor_id: int) -> str:
     """
     if vendor_id_source == 1:  # Bluetooth SIG
         # Import here to avoid circular dependency
-        from bleep.bt_ref.bluetooth_uuids import SPEC_ID_NAMES__COMPANY_IDENTS
-        vendor_key = f"0x{vendor_id:04x}"
-        return SPEC_ID_NAMES__COMPANY_IDENTS.get(vendor_key, f"Unknown (0x{vendor_id:04x})")
+        from bleep.bt_ref.sig_lookup import get_company_name
+        return get_company_name(vendor_id) or f"Unknown (0x{vendor_id:04x})"
     elif vendor_id_source == 2:  # USB IF
         return get_vendor_name(f"{vendor_id:04x}")
     else:
@@ -1,22 +1,29 @@
 """
 Bluetooth reference data and constants.
+
+Only :mod:`constants` is imported eagerly.  ``exceptions`` and ``utils``
+import D-Bus and ``uuids`` is a multi-megabyte generated dictionary module,
+so they (and ``uuid_translator``) are loaded on first attribute access;
+``from bleep.bt_ref import uuids`` keeps working unchanged.
 """
 
+from importlib import import_module as _imp
+
 from . import constants
-from . import exceptions
-# utils / uuids may be temporarily broken while the update script regenerates
-# them.  Avoid hard-crashing the entire *bleep.bt_ref* package when they raise
-# a syntax error (e.g. incomplete file write).
-try:
-    from . import utils  # noqa: F401 – re-export
-    from . import uuids  # noqa: F401 – re-export
-except (SyntaxError, IndentationError):
+
+__all__ = ["constants", "exceptions", "utils", "uuids", "uuid_translator"]
+
+_LAZY_SUBMODULES = ("exceptions", "utils", "uuids", "uuid_translator")
+
+
+def _install_stubs() -> None:
     # Provide minimal stub modules so that other imports (e.g. legacy helpers)
     # do not explode while the update process is running.  They expose only
     # the attributes required by those scripts (an empty *UUID_NAMES* dict).
 
     import types as _types
     import warnings as _warn
+    import sys as _s
 
     _stub_utils = _types.ModuleType("bleep.bt_ref.utils")
     _stub_utils.get_name_from_uuid = lambda _u: "Unknown"
@@ -26,7 +33,6 @@ except (SyntaxError, IndentationError):
 
     globals()["utils"] = _stub_utils
     globals()["uuids"] = _stub_uuids
-    import sys as _s
     _s.modules["bleep.bt_ref.utils"] = _stub_utils
     _s.modules["bleep.bt_ref.uuids"] = _stub_uuids
 
@@ -35,12 +41,17 @@ except (SyntaxError, IndentationError):
         "then restart to restore full functionality."
     )
 
-__all__ = ["constants", "exceptions", "utils", "uuids"]
-
-# Export UUID translator if available
-try:
-    from . import uuid_translator  # noqa: F401
-    __all__.append("uuid_translator")
-except (ImportError, SyntaxError):
-    pass
 
+def __getattr__(name: str):
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = _imp(f"{__name__}.{name}")
+    except (SyntaxError, IndentationError):
+        # uuids.py is being rewritten by the updater
+        if name not in ("utils", "uuids"):
+            raise
+        _install_stubs()
+        return globals()[name]
+    globals()[name] = module
+    return module
@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+"""Compact, memory-mapped reference-data store.
+
+The generated reference modules (``_usb_ids_data.py``, ``uuids.py``) are tens
+of thousands of lines of dict literals; importing them costs hundreds of
+milliseconds and several MB of RSS even when only one name is looked up.  The
+updaters therefore also emit a ``.bref`` artifact that is read with
+:mod:`mmap` and searched in place.
+
+File layout (little-endian except keys)::
+
+    header      b"BREF", u16 version, u16 n_tables,
+                u32 n_strings, u32 string_offsets_pos, u32 blob_pos, u32 blob_len
+    directory   n_tables x (24s name, u8 key_width, 3x pad, u32 count,
+                            u32 keys_pos, u32 values_pos)
+    keys        per table: count x key_width bytes, big-endian, sorted
+    values      per table: count x u32 string index
+    offsets     (n_strings + 1) x u32 into the blob
+    blob        interned UTF-8 strings
+
+Keys are unsigned integers stored big-endian at a fixed width, so comparing
+the raw bytes orders them numerically and a lookup is a binary search over
+the mapped file.  Identical strings are stored once.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+__all__ = ["RefStore", "RefTable", "open_store", "write_store"]
+
+MAGIC = b"BREF"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIII")
+_TABLE = struct.Struct("<24sB3xIII")
+_U32 = struct.Struct("<I")
+
+PathLike = Union[str, os.PathLike]
+
+
+class RefTable:
+    """Sorted integer-keyed table inside a :class:`RefStore`."""
+
+    __slots__ = ("name", "key_width", "_store", "_count", "_keys_pos", "_values_pos")
+
+    def __init__(self, store: "RefStore", name: str, key_width: int, count: int,
+                 keys_pos: int, values_pos: int):
+        self.name = name
+        self.key_width = key_width
+        self._store = store
+        self._count = count
+        self._keys_pos = keys_pos
+        self._values_pos = values_pos
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _index(self, key: int) -> int:
+        """Position of *key*, or -1."""
+        width = self.key_width
+        if key < 0 or key >> (8 * width):
+            return -1
+        target = key.to_bytes(width, "big")
+        mm = self._store._mm
+        base = self._keys_pos
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            start = base + mid * width
+            probe = mm[start:start + width]
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def get(self, key: int, default: Optional[str] = None) -> Optional[str]:
+        """Return the string stored for *key*, or *default*."""
+        idx = self._index(key)
+        if idx < 0:
+            return default
+        (string_id,) = _U32.unpack_from(self._store._mm, self._values_pos + idx * 4)
+        return self._store.string(string_id)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, int) and self._index(key) >= 0
+
+    def items(self) -> Iterator[Tuple[int, str]]:
+        """Yield ``(key, value)`` pairs in key order."""
+        mm = self._store._mm
+        width = self.key_width
+        for idx in range(self._count):
+            start = self._keys_pos + idx * width
+            key = int.from_bytes(mm[start:start + width], "big")
+            (string_id,) = _U32.unpack_from(mm, self._values_pos + idx * 4)
+            yield key, self._store.string(string_id)
+
+
+class RefStore:
+    """Read-only view of a ``.bref`` file."""
+
+    def __init__(self, path: PathLike):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, n_tables, n_strings, offsets_pos, blob_pos, blob_len = \
+                _HEADER.unpack_from(self._mm, 0)
+        except struct.error as exc:
+            self._mm.close()
+            raise ValueError(f"{self.path}: truncated reference store") from exc
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path}: not a version-{VERSION} reference store")
+        self._n_strings = n_strings
+        self._offsets_pos = offsets_pos
+        self._blob_pos = blob_pos
+        self._tables: Dict[str, RefTable] = {}
+        pos = _HEADER.size
+        for _ in range(n_tables):
+            raw_name, key_width, count, keys_pos, values_pos = _TABLE.unpack_from(self._mm, pos)
+            name = raw_name.rstrip(b"\0").decode("ascii")
+            self._tables[name] = RefTable(self, name, key_width, count, keys_pos, values_pos)
+            pos += _TABLE.size
+
+    def string(self, string_id: int) -> str:
+        start, end = struct.unpack_from("<II", self._mm, self._offsets_pos + string_id * 4)
+        return self._mm[self._blob_pos + start:self._blob_pos + end].decode("utf-8")
+
+    def table(self, name: str) -> RefTable:
+        """Return the table called *name* (``KeyError`` if absent)."""
+        return self._tables[name]
+
+    def tables(self) -> List[str]:
+        return list(self._tables)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tables
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+_stores: Dict[str, RefStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(path: PathLike) -> RefStore:
+    """Return a shared :class:`RefStore` for *path* (opened once per process).
+
+    Raises ``OSError`` when the file is missing and ``ValueError`` when it is
+    not a valid store; callers fall back to the Python dictionaries.
+    """
+    key = str(path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = _stores[key] = RefStore(key)
+    return store
+
+
+def write_store(path: PathLike, tables: Mapping[str, Tuple[int, Mapping[int, str]]]) -> None:
+    """Write *tables* (``name -> (key_width, {int: str})``) to *path* atomically."""
+    strings: List[bytes] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        sid = string_ids.get(value)
+        if sid is None:
+            sid = string_ids[value] = len(strings)
+            strings.append(value.encode("utf-8"))
+        return sid
+
+    directory_size = _HEADER.size + _TABLE.size * len(tables)
+    sections: List[bytes] = []
+    entries = []
+    pos = directory_size
+    for name, (key_width, mapping) in tables.items():
+        encoded_name = name.encode("ascii")
+        if len(encoded_name) > 24:
+            raise ValueError(f"table name too long: {name}")
+        items = sorted(mapping.items())
+        keys = b"".join(k.to_bytes(key_width, "big") for k, _ in items)
+        values = b"".join(_U32.pack(intern(v)) for _, v in items)
+        entries.append(_TABLE.pack(encoded_name, key_width, len(items), pos, pos + len(keys)))
+        sections += [keys, values]
+        pos += len(keys) + len(values)
+
+    offsets = [0]
+    for raw in strings:
+        offsets.append(offsets[-1] + len(raw))
+    offsets_blob = struct.pack(f"<{len(offsets)}I", *offsets)
+    blob = b"".join(strings)
+    header = _HEADER.pack(MAGIC, VERSION, len(tables), len(strings), pos,
+                          pos + len(offsets_blob), len(blob))
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(b"".join(entries))
+        for section in sections:
+            f.write(section)
+        f.write(offsets_blob)
+        f.write(blob)
+    os.replace(tmp, path)
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""Bluetooth SIG assigned-number lookups backed by ``uuids.bref``.
+
+Thin wrappers over the compact store written by ``update_ble_uuids.py``, so
+resolving a company identifier or AD type does not require importing the
+generated ``uuids.py`` dictionaries.  Table names are the lower-cased suffix
+of the matching ``SPEC_*_NAMES__<X>`` variable (``"company_idents"``,
+``"advertising_types"``, ``"serv"``, ``"char"`` …).  When the store is
+missing the dictionaries in :mod:`bleep.bt_ref.uuids` are used instead.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from bleep.bt_ref.refstore import RefStore, open_store
+
+__all__ = ["sig_id_name", "sig_uuid_name", "get_company_name"]
+
+STORE_PATH = Path(__file__).parent / "uuids.bref"
+
+_store: Optional[RefStore] = None
+_store_failed = False
+
+
+def _get_store() -> Optional[RefStore]:
+    global _store, _store_failed
+    if _store is None and not _store_failed:
+        try:
+            _store = open_store(STORE_PATH)
+        except (OSError, ValueError):
+            _store_failed = True
+    return _store
+
+
+def _fallback(prefix: str, table: str) -> dict:
+    from bleep.bt_ref import uuids
+
+    return getattr(uuids, f"{prefix}__{table.upper()}", {})
+
+
+def sig_id_name(table: str, value: int) -> Optional[str]:
+    """Return the SIG name for 16-bit *value* in ID *table*, or ``None``."""
+    store = _get_store()
+    if store is None:
+        return _fallback("SPEC_ID_NAMES", table).get(f"0x{value:04x}")
+    if table not in store:
+        return None
+    return store.table(table).get(value)
+
+
+def sig_uuid_name(table: str, uuid: str) -> Optional[str]:
+    """Return the SIG name for 128-bit *uuid* (dashed string) in UUID *table*."""
+    uuid = uuid.lower()
+    store = _get_store()
+    if store is None:
+        return _fallback("SPEC_UUID_NAMES", table).get(uuid)
+    if table not in store:
+        return None
+    try:
+        key = int(uuid.replace("-", ""), 16)
+    except ValueError:
+        return None
+    return store.table(table).get(key)
+
+
+def get_company_name(company_id: int) -> Optional[str]:
+    """Resolve a 16-bit company identifier to its registered name."""
+    return sig_id_name("company_idents", company_id)
@@ -2,13 +2,16 @@
 """BLE SIG UUID updater for the refactored BLEEP code-base.
 
 Usage (CLI):
-    python -m bleep.bt_ref.update_ble_uuids           # regenerates uuids.py
+    python -m bleep.bt_ref.update_ble_uuids                 # regenerates uuids.py + uuids.bref
+    python -m bleep.bt_ref.update_ble_uuids --compact-only  # rebuilds uuids.bref from uuids.py
 
 The script downloads the official YAML tables from the Bluetooth SIG Bitbucket
 repository and converts them into static dictionaries identical to those used
 by the historical monolith.  The generated module is written to
 `bleep/bt_ref/uuids.py` *inside the package* so regular imports pick it up on
-next interpreter start.
+next interpreter start.  Alongside it, `uuids.bref` holds the same tables in
+the compact memory-mapped format of :mod:`bleep.bt_ref.refstore`, which the
+runtime name lookups (``sig_lookup``) read without importing uuids.py.
 
 Note: this tool purposefully lives **inside** bleep so it has no external
 references and can be invoked from any environment that has the editable
@@ -18,6 +21,7 @@ previous uuids.py untouched.
 from __future__ import annotations
 
 import os
+import sys
 import json
 import textwrap
 import urllib.request as _url
@@ -98,6 +102,7 @@ _HEADER = (
 _SRC_LIST = list(_FILES.values())  # Populated below – declared early for f-string
 
 _OUT_PATH = Path(__file__).with_name("uuids.py")
+_STORE_PATH = Path(__file__).with_name("uuids.bref")
 _SIG_SUFFIX = "-0000-1000-8000-00805f9b34fb"
 
 def _save_url_mappings():
@@ -444,7 +449,43 @@ def regenerate() -> None:
 
     _OUT_PATH.write_text(content, encoding="utf-8")
     print(f"\n[+] Regenerated {_OUT_PATH.relative_to(Path.cwd())}")
+    write_compact_store()
+
+
+def write_compact_store(source: Path = _OUT_PATH, dest: Path = _STORE_PATH) -> None:
+    """Rebuild the compact lookup store from the generated *source* module.
+
+    ``SPEC_UUID_NAMES__<X>`` tables are keyed by the 128-bit UUID (16 bytes),
+    ``SPEC_ID_NAMES__<X>`` tables by the numeric ID (2 bytes); each table is
+    named after the lower-cased ``<X>`` suffix.
+    """
+    import runpy
+    from bleep.bt_ref.refstore import write_store
+
+    namespace = runpy.run_path(str(source))
+    tables: dict = {}
+    for var, mapping in namespace.items():
+        if var.startswith("SPEC_UUID_NAMES__"):
+            width = 16
+            parse = lambda k: int(k.replace("-", ""), 16)  # noqa: E731
+        elif var.startswith("SPEC_ID_NAMES__"):
+            width = 2
+            parse = lambda k: int(k, 16)  # noqa: E731
+        else:
+            continue
+        table = {}
+        for key, name in mapping.items():
+            try:
+                table[parse(key)] = name
+            except ValueError:
+                print(f"[!] Skipping unparsable key {key!r} in {var}")
+        tables[var.split("__", 1)[1].lower()] = (width, table)
+    write_store(dest, tables)
+    print(f"[+] Wrote compact store {dest.name} ({len(tables)} tables)")
 
 
 if __name__ == "__main__":
-    regenerate() 
\ No newline at end of file
+    if "--compact-only" in sys.argv[1:]:
+        write_compact_store()
+    else:
+        regenerate()
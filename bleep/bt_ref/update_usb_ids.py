@@ -2,12 +2,13 @@
 """USB ID database updater for BLEEP.
 
 Usage (CLI):
-    python -m bleep.bt_ref.update_usb_ids           # regenerates usb_ids.py
+    python -m bleep.bt_ref.update_usb_ids                 # regenerates _usb_ids_data.py + usb_ids.bref
+    python -m bleep.bt_ref.update_usb_ids --compact-only  # rebuilds usb_ids.bref from _usb_ids_data.py
 
 The script downloads the official USB ID database from linux-usb.org and converts
-it into static dictionaries for use throughout the codebase. The generated module
-is written to `bleep/bt_ref/usb_ids.py` inside the package so regular imports
-pick it up on next interpreter start.
+it into static dictionaries (`bleep/bt_ref/_usb_ids_data.py`) plus a compact
+memory-mapped table (`bleep/bt_ref/usb_ids.bref`, see :mod:`refstore`).  The
+lookup helpers in `usb_ids.py` read the compact table at runtime.
 
 This follows the same pattern as the BT SIG UUID updater, ensuring consistent
 handling of external reference data.
@@ -16,6 +17,7 @@ from __future__ import annotations
 
 import os
 import re
+import sys
 import urllib.request as _url
 from datetime import datetime
 from pathlib import Path
@@ -31,8 +33,9 @@ USB_IDS_URL = "http://www.linux-usb.org/usb.ids"
 # Backup URL in case the primary fails
 USB_IDS_BACKUP_URL = "http://www.linux-usb.org/usb-ids.txt"
 
-# Output file path (relative to this script)
-OUTPUT_PATH = Path(__file__).parent / "usb_ids.py"
+# Output file paths (relative to this script)
+OUTPUT_PATH = Path(__file__).parent / "_usb_ids_data.py"
+STORE_PATH = Path(__file__).parent / "usb_ids.bref"
 
 # Regular expressions for parsing the USB IDs file
 VENDOR_RE = re.compile(r'^([0-9a-f]{4})\s+(.+)$')
@@ -112,20 +115,19 @@ def generate_module_content(vendors: Dict[str, str], products: Dict[str, Dict[st
         products: Dictionary mapping vendor IDs to dictionaries of product IDs and names
         
     Returns:
-        str: Python code for the usb_ids.py module
+        str: Python code for the _usb_ids_data.py module
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Start with the module docstring and imports
     content = [
         '#!/usr/bin/python3',
-        '"""USB ID database for BLEEP.',
+        '"""USB ID tables for BLEEP (source data for ``usb_ids.bref``).',
         '',
         f'Auto-generated from linux-usb.org/usb.ids on {timestamp}.',
         'Do not edit manually - run update_usb_ids.py to regenerate.',
         '"""',
         'from __future__ import annotations',
-        'import re',
         '',
         '# Dictionary mapping vendor IDs (as lowercase hex strings) to vendor names',
         'USB_VENDORS = {',
@@ -156,69 +158,36 @@ def generate_module_content(vendors: Dict[str, str], products: Dict[str, Dict[st
     content.append('}')
     content.append('')
     
-    # Add helper functions for modalias parsing
-    content.append('''
-# Helper functions for modalias parsing
+    return '\n'.join(content)
 
-def get_vendor_name(vendor_id: str) -> str:
-    """Get vendor name from vendor ID.
-    
-    Args:
-        vendor_id: Vendor ID as a hex string (with or without '0x' prefix)
-        
-    Returns:
-        str: Vendor name or "Unknown" if not found
-    """
-    # Normalize vendor ID to lowercase without '0x' prefix
-    vendor_id = vendor_id.lower().replace('0x', '')
-    
-    return USB_VENDORS.get(vendor_id, f"Unknown (0x{vendor_id})")
+def write_compact_store(vendors: Dict[str, str], products: Dict[str, Dict[str, str]],
+                        path: Path = STORE_PATH) -> None:
+    """Write the compact lookup table used by ``usb_ids.get_*_name()``.
 
-def get_product_name(vendor_id: str, product_id: str) -> str:
-    """Get product name from vendor ID and product ID.
-    
-    Args:
-        vendor_id: Vendor ID as a hex string (with or without '0x' prefix)
-        product_id: Product ID as a hex string (with or without '0x' prefix)
-        
-    Returns:
-        str: Product name or "Unknown" if not found
+    Table ``vendors`` is keyed by the 16-bit vendor ID; table ``products`` by
+    ``(vendor_id << 16) | product_id``.
     """
-    # Normalize IDs to lowercase without '0x' prefix
-    vendor_id = vendor_id.lower().replace('0x', '')
-    product_id = product_id.lower().replace('0x', '')
-    
-    vendor_products = USB_PRODUCTS.get(vendor_id, {})
-    return vendor_products.get(product_id, f"Unknown (0x{product_id})")
+    from bleep.bt_ref.refstore import write_store
 
-def parse_modalias(modalias: str) -> dict:
-    """Parse a modalias string into its components.
-    
-    Args:
-        modalias: A modalias string (e.g., 'usb:v05ACp820Ad0210')
-        
-    Returns:
-        dict: Dictionary with parsed components or empty dict if parsing fails
-    """
-    # Parse USB modalias format: usb:vVVVVpPPPPdDDDD
-    match = re.match(r'usb:v([0-9A-Fa-f]{4})p([0-9A-Fa-f]{4})d([0-9A-Fa-f]{4})', modalias)
-    if not match:
-        return {}
-        
-    vendor_id = match.group(1).lower()
-    product_id = match.group(2).lower()
-    device_id = match.group(3).lower()
-    
-    return {
-        'vendor_id': vendor_id,
-        'vendor_name': get_vendor_name(vendor_id),
-        'product_id': product_id,
-        'product_name': get_product_name(vendor_id, product_id),
-        'device_id': device_id,
+    vendor_table = {int(vid, 16): name for vid, name in vendors.items()}
+    product_table = {
+        (int(vid, 16) << 16) | int(pid, 16): name
+        for vid, vendor_products in products.items()
+        for pid, name in vendor_products.items()
     }
-''')
-    
-    return '\n'.join(content)
+    write_store(path, {"vendors": (2, vendor_table), "products": (4, product_table)})
+
+def rebuild_compact_store() -> bool:
+    """Rebuild ``usb_ids.bref`` from the existing ``_usb_ids_data.py`` (no download)."""
+    try:
+        from bleep.bt_ref._usb_ids_data import USB_PRODUCTS, USB_VENDORS
+
+        print(f"Writing to {STORE_PATH}...")
+        write_compact_store(USB_VENDORS, USB_PRODUCTS)
+        return True
+    except Exception as e:
+        print(f"Error rebuilding compact USB IDs table: {e}")
+        return False
 
 def update_usb_ids() -> bool:
     """Main function to update the USB IDs database.
@@ -241,6 +210,9 @@ def update_usb_ids() -> bool:
         print(f"Writing to {OUTPUT_PATH}...")
         with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
             f.write(module_content)
+
+        print(f"Writing to {STORE_PATH}...")
+        write_compact_store(vendors, products)
         
         print("USB IDs database updated successfully!")
         return True
@@ -253,4 +225,7 @@ def update_usb_ids() -> bool:
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    update_usb_ids()
+    if "--compact-only" in sys.argv[1:]:
+        rebuild_compact_store()
+    else:
+        update_usb_ids()
@@ -7,8 +7,6 @@ Bluetooth utility functions.
 
 import dbus
 import sys
-from . import constants
-from . import uuids
 
 # Variables
 dbg = 0
@@ -18,6 +16,7 @@ __all__ = [
     "dbus_to_python",
     "device_address_to_path",
     "get_name_from_uuid",
+    "get_names_from_uuids",
     "text_to_ascii_array",
     "print_properties",
     "handle_int_to_hex",
@@ -84,36 +83,24 @@ def get_name_from_uuid(uuid, uuid_class=None):
             )
         )
 
-    # Search through the Bluetooth Constants file
-    if uuid in constants.UUID_NAMES:
-        return constants.UUID_NAMES[uuid]
-    # Search through the Bluetooth UUIDs file's Services
-    elif uuid in uuids.SPEC_UUID_NAMES__SERV:
-        if dbg != 0:
-            print(
-                "[+] bluetooth_utils::UUID [ {0} ] matches known Service UUID [ {1} ]".format(
-                    uuid, uuids.SPEC_UUID_NAMES__SERV[uuid]
-                )
-            )
-        return uuids.SPEC_UUID_NAMES__SERV[uuid]
-    # Search through the Bluetooth UUIDs file's Characteristics
-    elif uuid in uuids.SPEC_UUID_NAMES__CHAR:
-        return uuids.SPEC_UUID_NAMES__CHAR[uuid]
-    # Search through the Bluetooth UUIDs file's Descriptors
-    elif uuid in uuids.SPEC_UUID_NAMES__DESC:
-        return uuids.SPEC_UUID_NAMES__DESC[uuid]
-    # Search through the Bluetooth UUIDs file's Members
-    elif uuid in uuids.SPEC_UUID_NAMES__MEMB:
-        return uuids.SPEC_UUID_NAMES__MEMB[uuid]
-    # Search through the Bluetooth UUIDs file's SDOs
-    elif uuid in uuids.SPEC_UUID_NAMES__SDO:
-        return uuids.SPEC_UUID_NAMES__SDO[uuid]
-    # Search through the Bluetooth UUIDs file's Service Class
-    elif uuid in uuids.SPEC_UUID_NAMES__SERV_CLASS:
-        return uuids.SPEC_UUID_NAMES__SERV_CLASS[uuid]
+    # One probe of the merged integer-keyed index; priority follows the old
+    # lookup order (constants, then services, characteristics, descriptors,
+    # members, SDOs and service classes)
+    from .uuid_translator import lookup_name
+
+    name = lookup_name(uuid)
     # No idea what this UUID is
-    else:
-        return "Unknown"
+    return name if name is not None else "Unknown"
+
+
+def get_names_from_uuids(uuid_list):
+    """Batch form of :func:`get_name_from_uuid`: ``{uuid: name}`` per distinct UUID."""
+    from .uuid_translator import lookup_names
+
+    return {
+        uuid: (name if name is not None else "Unknown")
+        for uuid, name in lookup_names(uuid_list).items()
+    }
 
 
 def text_to_ascii_array(text):
@@ -7,11 +7,19 @@ based on BLEEP's internal UUID databases.
 
 The module is designed with modularity and extensibility in mind, making it easy
 to add support for new UUID formats or database sources.
+
+All databases are merged once into a single index keyed by the 128-bit integer
+value of each UUID, so a lookup is one dict probe regardless of how the UUID
+was spelled.  :func:`translate_uuid` and :func:`lookup_name` are memoized
+(``BLEEP_UUID_CACHE_SIZE`` entries, default 4096); :func:`translate_many` and
+:func:`lookup_names` translate each distinct UUID of a batch once.
 """
 
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Any, Set
+import os
 import re
 from enum import Enum
+from functools import lru_cache
 
 from bleep.core.log import print_and_log, LOG__DEBUG
 
@@ -46,6 +54,46 @@ class UUIDCategory(Enum):
 
 from bleep.bt_ref.constants import BT_SIG_BASE_UUID, BT_SIG_BASE_UUID_NODASH
 
+# Integer value of the BT SIG base UUID; a 16/32-bit UUID ``x`` expands to
+# ``_SIG_BASE_INT | (x << 96)``.
+_SIG_BASE_INT = int(BT_SIG_BASE_UUID_NODASH, 16)
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+_CACHE_SIZE = _env_int("BLEEP_UUID_CACHE_SIZE", 4096)
+
+
+def uuid_to_int(uuid: str) -> Optional[int]:
+    """Return the 128-bit integer value of *uuid*, or ``None`` if unparsable.
+
+    Accepts 16-bit, 32-bit (expanded with the BT SIG base) and 128-bit forms,
+    with or without dashes or a ``0x`` prefix.
+    """
+    text = str(uuid).strip().lower()
+    if text.startswith("0x"):
+        text = text[2:]
+    text = text.replace("-", "")
+    if not text or not _HEX_DIGITS.issuperset(text):
+        return None
+    if len(text) == 32:
+        return int(text, 16)
+    if len(text) in (4, 8):
+        return _SIG_BASE_INT | (int(text, 16) << 96)
+    return None
+
+
+def int_to_uuid(value: int) -> str:
+    """Format a 128-bit integer as a dashed lowercase UUID string."""
+    h = f"{value:032x}"
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
 
 class UUIDFormatHandler:
     """
@@ -192,13 +240,18 @@ class UUIDDatabase:
     Container for UUID database sources.
     
     This class provides a unified interface to all UUID databases in BLEEP,
-    making it easy to search across all sources and add new databases.
+    making it easy to search across all sources and add new databases.  The
+    per-category dicts are merged into one index keyed by the 128-bit integer
+    value, mapping to ``(category, name)`` tuples in category priority order.
     """
     
     def __init__(self):
         """Initialize database sources."""
         self._databases: Dict[UUIDCategory, Dict[str, str]] = {}
+        self._index: Dict[int, Tuple[Tuple[UUIDCategory, str], ...]] = {}
+        self._rank: Dict[UUIDCategory, int] = {}
         self._load_databases()
+        self._build_index()
     
     def _load_databases(self) -> None:
         """Load all available UUID databases."""
@@ -226,6 +279,23 @@ class UUIDDatabase:
             if hasattr(uuids, 'SPEC_UUID_NAMES__SERV_CLASS'):
                 self._databases[UUIDCategory.SERVICE_CLASS] = uuids.SPEC_UUID_NAMES__SERV_CLASS
     
+    def _build_index(self) -> None:
+        """Merge all databases into the integer-keyed index."""
+        index: Dict[int, List[Tuple[UUIDCategory, str]]] = {}
+        for category, db_dict in self._databases.items():
+            for key, name in db_dict.items():
+                value = uuid_to_int(key) if len(key.replace("-", "")) == 32 else None
+                if value is None:
+                    continue
+                index.setdefault(value, []).append((category, name))
+        self._index = {value: tuple(entries) for value, entries in index.items()}
+        self._rank = {category: rank for rank, category in enumerate(self._databases)}
+        print_and_log(f"[DEBUG] UUID index built: {len(self._index)} UUIDs", LOG__DEBUG)
+    
+    def lookup(self, value: int) -> Tuple[Tuple[UUIDCategory, str], ...]:
+        """Return the ``(category, name)`` entries for 128-bit *value*."""
+        return self._index.get(value, ())
+    
     def search(self, uuid: str, short_form: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search all databases for UUID matches.
@@ -241,59 +311,38 @@ class UUIDDatabase:
             - name: Human-readable name
             - source: Database source name
         """
-        matches: List[Dict[str, Any]] = []
+        keys: List[int] = []
         uuid_normalized = uuid.replace("-", "").lower()
-        
-        # Helper to format UUID with dashes (as stored in databases)
-        def format_with_dashes(uuid_no_dash: str) -> str:
-            """Format UUID with dashes: XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX"""
-            if len(uuid_no_dash) == 32:
-                return f"{uuid_no_dash[0:8]}-{uuid_no_dash[8:12]}-{uuid_no_dash[12:16]}-{uuid_no_dash[16:20]}-{uuid_no_dash[20:32]}"
-            return uuid_no_dash
-        
-        # Search each database
-        for category, db_dict in self._databases.items():
-            # Try matching with dashes (as stored in databases)
-            uuid_with_dashes = format_with_dashes(uuid_normalized)
-            if uuid_with_dashes in db_dict:
-                matches.append({
-                    "category": category,
-                    "uuid": uuid_with_dashes,
-                    "name": db_dict[uuid_with_dashes],
-                    "source": category.value,
-                })
-            
-            # Also try without dashes (for robustness)
-            elif uuid_normalized in db_dict:
-                matches.append({
-                    "category": category,
-                    "uuid": uuid_normalized,
-                    "name": db_dict[uuid_normalized],
-                    "source": category.value,
-                })
-            
-            # If we have a short form, search for matches in BT SIG format
-            if short_form:
-                # Construct BT SIG format UUID for this short form (with dashes)
-                bt_sig_uuid_no_dash = f"0000{short_form}{BT_SIG_BASE_UUID_NODASH[8:]}"
-                bt_sig_uuid_with_dashes = format_with_dashes(bt_sig_uuid_no_dash)
-                
-                if bt_sig_uuid_with_dashes in db_dict:
-                    matches.append({
-                        "category": category,
-                        "uuid": bt_sig_uuid_with_dashes,
-                        "name": db_dict[bt_sig_uuid_with_dashes],
-                        "source": category.value,
-                    })
-                elif bt_sig_uuid_no_dash in db_dict:
-                    matches.append({
-                        "category": category,
-                        "uuid": bt_sig_uuid_no_dash,
-                        "name": db_dict[bt_sig_uuid_no_dash],
-                        "source": category.value,
-                    })
-        
-        return matches
+        if len(uuid_normalized) == 32:
+            value = uuid_to_int(uuid_normalized)
+            if value is not None:
+                keys.append(value)
+        
+        # If we have a short form, also match its BT SIG expansion
+        if short_form:
+            try:
+                sig_value = _SIG_BASE_INT | (int(short_form, 16) << 96)
+            except ValueError:
+                sig_value = None
+            if sig_value is not None and sig_value not in keys:
+                keys.append(sig_value)
+        
+        # Order by category first, then exact match before short-form match
+        hits = []
+        for key_pos, value in enumerate(keys):
+            for category, name in self._index.get(value, ()):
+                hits.append((self._rank[category], key_pos, category, value, name))
+        hits.sort(key=lambda h: (h[0], h[1]))
+        
+        return [
+            {
+                "category": category,
+                "uuid": int_to_uuid(value),
+                "name": name,
+                "source": category.value,
+            }
+            for _rank, _pos, category, value, name in hits
+        ]
     
     def search_all_16bit_matches(self, short_uuid: str) -> List[Dict[str, Any]]:
         """
@@ -342,6 +391,8 @@ class UUIDTranslator:
         # For now, insert at beginning (highest priority)
         # Future: implement priority-based ordering
         self._format_handlers.insert(0, handler)
+        # Memoized translations may have been normalized differently
+        _translate_cached.cache_clear()
     
     def _normalize_uuid(self, uuid_input: str) -> Tuple[str, UUIDFormat, Optional[str]]:
         """
@@ -447,11 +498,24 @@ def get_translator() -> UUIDTranslator:
     return _translator_instance
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
+def _translate_cached(uuid_input: str, include_unknown: bool) -> Dict[str, Any]:
+    return get_translator().translate(uuid_input, include_unknown)
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Cached results are shared; hand out copies callers may mutate
+    copy = dict(result)
+    copy["matches"] = [dict(m) for m in result["matches"]]
+    return copy
+
+
 def translate_uuid(uuid_input: str, include_unknown: bool = False) -> Dict[str, Any]:
     """
     Convenience function to translate a UUID.
     
-    This is the primary public API for UUID translation.
+    This is the primary public API for UUID translation.  Results are
+    memoized per ``(uuid_input, include_unknown)``.
     
     Args:
         uuid_input: UUID in any format (16-bit, 32-bit, or 128-bit)
@@ -465,6 +529,43 @@ def translate_uuid(uuid_input: str, include_unknown: bool = False) -> Dict[str,
         >>> print(result["matches"][0]["name"])
         Device Information
     """
-    translator = get_translator()
-    return translator.translate(uuid_input, include_unknown)
+    return _copy_result(_translate_cached(uuid_input, include_unknown))
+
+
+def translate_many(uuid_inputs: Iterable[str], include_unknown: bool = False) -> List[Dict[str, Any]]:
+    """
+    Translate a batch of UUIDs, returning results in input order.
+    
+    Each distinct input is normalized and looked up once, however often it
+    repeats in *uuid_inputs*.
+    
+    Args:
+        uuid_inputs: UUIDs in any supported format
+        include_unknown: If True, include "Unknown" entries in results
+        
+    Returns:
+        List of translation result dictionaries (see UUIDTranslator.translate)
+    """
+    inputs = list(uuid_inputs)
+    unique = {u: _translate_cached(u, include_unknown) for u in dict.fromkeys(inputs)}
+    return [_copy_result(unique[u]) for u in inputs]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def lookup_name(uuid: str) -> Optional[str]:
+    """
+    Return the highest-priority name for *uuid*, or ``None`` if unknown.
+    
+    Priority follows the database order: custom names, then services,
+    characteristics, descriptors, members, SDOs and service classes.
+    """
+    value = uuid_to_int(uuid)
+    if value is None:
+        return None
+    entries = get_translator()._database.lookup(value)
+    return entries[0][1] if entries else None
+
 
+def lookup_names(uuid_list: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Return ``{uuid: name-or-None}`` for every distinct UUID in *uuid_list*."""
+    return {u: lookup_name(u) for u in dict.fromkeys(uuid_list)}
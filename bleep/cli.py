@@ -3,16 +3,45 @@ Command-line interface for BLEEP.
 """
 
 import argparse
+import re
 import signal
 import shutil
 import sys
 import os
 
-# Ensure logging subsystem (and legacy /tmp files) is initialised immediately
-import bleep.core.log  # noqa: F401  # side-effect import creates symlinks/files
-
 from . import __version__
 
+# Subcommands that own a complete argparse front-end and never touch
+# Bluetooth.  When one of them is the first argument, main() imports only the
+# handler module and passes it the remaining arguments: the ~50-subcommand
+# parser below is not built, and there is no adapter check, banner or call
+# tracing.  Pipelines run these thousands of times, so keep them cheap.
+_LAZY_COMMANDS = {
+    "db": ("bleep.modes.db", "main"),
+    "uuid-translate": ("bleep.modes.uuid_translate", "main"),
+    "uuid-lookup": ("bleep.modes.uuid_translate", "main"),
+}
+
+_MAC_RE = re.compile(r"^[0-9A-Fa-f]{2}(:[0-9A-Fa-f]{2}){5}$")
+
+
+def _run_lazy_command(argv):
+    """Dispatch ``argv[0]`` through :data:`_LAZY_COMMANDS` (see above)."""
+    from importlib import import_module
+
+    module_name, func_name = _LAZY_COMMANDS[argv[0]]
+
+    # Same normalisation/verbosity handling as the full path in main()
+    lvl = os.getenv("BLEEP_LOG_LEVEL")
+    if lvl:
+        import logging
+
+        logging.getLogger("bleep").setLevel(lvl.upper())
+    sub_argv = [a.upper() if _MAC_RE.match(a) else a for a in argv[1:]]
+
+    handler = getattr(import_module(module_name), func_name)
+    return handler(sub_argv) or 0
+
 
 def parse_args(args=None):
     parser = argparse.ArgumentParser(
@@ -23,6 +52,10 @@ def parse_args(args=None):
                        help="Check environment capabilities (tools, configs, dependencies)")
     parser.add_argument("--diagnose-audio", action="store_true",
                        help="Run detailed audio stack diagnostic and show install guidance")
+    parser.add_argument("--trace-out", metavar="FILE",
+                       help="Record D-Bus calls and write a Chrome trace-event JSON file on exit")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                       help="Serve D-Bus call metrics in Prometheus format on 127.0.0.1:PORT")
 
     # Add subparsers for different modes
     subparsers = parser.add_subparsers(dest="mode", help="Operation mode")
@@ -60,6 +93,12 @@ def parse_args(args=None):
                              help="Transport type: auto (LE+BR/EDR), le, bredr (default: auto)")
     scan_parser.add_argument("--target", help="Target MAC for pokey mode", default=None)
     scan_parser.add_argument("--adapter", default="hci0", help="Adapter name (default: hci0)")
+    scan_parser.add_argument("--adapters", metavar="LIST",
+                             help="Scan on several adapters concurrently, e.g. hci0,hci1:le,hci2:bredr "
+                                  "(optional per-adapter transport; passive/naggy variants only)")
+    scan_parser.add_argument("--stream", action="store_true",
+                             help="Print devices as they are discovered instead of after the timeout "
+                                  "(passive/naggy variants; --timeout 0 streams until Ctrl-C)")
 
     # Connect mode
     connect_parser = subparsers.add_parser("connect", help="Connect + GATT enumerate")
@@ -282,6 +321,11 @@ def parse_args(args=None):
     sig_parser.add_argument("char", help="Characteristic UUID or char handle")
     sig_parser.add_argument("--time", type=int, default=30, help="Listen duration seconds")
     sig_parser.add_argument("--adapter", default="hci0", help="Adapter name (default: hci0)")
+    sig_parser.add_argument("--out", help="Stream notifications to FILE (jsonl or binary segment)")
+    sig_parser.add_argument("--format", choices=["jsonl", "segment"], default="jsonl", help="Output format for --out (default: jsonl)")
+    sig_parser.add_argument("--compress", choices=["gzip", "zstd"], help="Compress jsonl output")
+    sig_parser.add_argument("--rotate-mb", type=float, help="Rotate --out file after N MiB")
+    sig_parser.add_argument("--rotate-seconds", type=float, help="Rotate --out file after N seconds")
     
     # User mode
     user_parser = subparsers.add_parser("user", help="User-friendly interface for Bluetooth exploration")
@@ -296,7 +340,9 @@ def parse_args(args=None):
 
     # UUID translation mode
     uuid_parser = subparsers.add_parser("uuid-translate", help="Translate UUID(s) to human-readable format", aliases=["uuid-lookup"])
-    uuid_parser.add_argument("uuids", nargs="+", help="UUID(s) to translate (16-bit, 32-bit, or 128-bit format)")
+    uuid_parser.add_argument("uuids", nargs="*", help="UUID(s) to translate (16-bit, 32-bit, or 128-bit format)")
+    uuid_parser.add_argument("--stdin", action="store_true", help="Also read UUIDs from standard input (one per line)")
+    uuid_parser.add_argument("--file", metavar="PATH", help="Also read UUIDs from PATH (one per line, '#' comments allowed)")
     uuid_parser.add_argument("--json", action="store_true", help="Output results in JSON format")
     uuid_parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed information including source databases")
     uuid_parser.add_argument("--include-unknown", action="store_true", help="Include 'Unknown' entries in results")
@@ -535,6 +581,7 @@ def parse_args(args=None):
     crfcomm_parser.add_argument("--bind", type=int, metavar="CHANNEL", default=None, help="Bind /dev/rfcomm0 to the specified RFCOMM channel")
     crfcomm_parser.add_argument("--device-id", type=int, default=0, help="Device index N for /dev/rfcommN (default: 0)")
     crfcomm_parser.add_argument("--timeout", type=float, default=4.0, help="Per-channel probe timeout (seconds, default: 4.0)")
+    crfcomm_parser.add_argument("--concurrency", type=int, default=None, help="Channels probed at once (default: BLEEP_RFCOMM_CONCURRENCY or 4; 1 = sequential)")
     crfcomm_parser.add_argument("--adapter", default="hci0", help="Adapter name (default: hci0)")
     
     # Adapter configuration
@@ -706,6 +753,10 @@ def main(args=None):
     if hasattr(signal, "SIGPIPE"):
         signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
+    argv = sys.argv[1:] if args is None else list(args)
+    if argv and argv[0] in _LAZY_COMMANDS:
+        return _run_lazy_command(argv)
+
     args, _subparsers = parse_args(args)
 
     # Normalize MAC address arguments to uppercase for DB/D-Bus consistency
@@ -736,8 +787,21 @@ def main(args=None):
     if _lvl:
         _logging.getLogger("bleep").setLevel(_lvl.upper())
 
+    # D-Bus call tracing / Prometheus export (flags override env vars)
+    from bleep.core import call_trace as _call_trace
+
+    _call_trace.configure_from_env()
+    if args.trace_out:
+        _call_trace.enable_trace_file(args.trace_out)
+    if args.metrics_port:
+        try:
+            _call_trace.serve_prometheus(args.metrics_port)
+        except OSError as exc:
+            print(f"[ERROR] Cannot serve metrics on port {args.metrics_port}: {exc}", file=sys.stderr)
+            return 1
+
     # Adapter guard for all Bluetooth-dependent modes
-    _non_bt_modes = {"db", None}
+    _non_bt_modes = {"db", "uuid-translate", "uuid-lookup", None}
     if args.mode not in _non_bt_modes:
         from bleep.core.preflight import require_adapter
         if not require_adapter():
@@ -760,6 +824,44 @@ def main(args=None):
 
             transport = args.transport
 
+            if args.stream:
+                if variant not in ("passive", "naggy") or args.adapters:
+                    print("[ERROR] --stream supports the passive and naggy variants on one adapter only",
+                          file=sys.stderr)
+                    return 1
+                try:
+                    for entry in _scan_mod.stream_scan(
+                        timeout or None,
+                        transport,
+                        adapter=args.adapter,
+                        duplicate_data=False if variant == "naggy" else None,
+                        updates=variant == "naggy",
+                    ):
+                        name = entry.get("name") or entry.get("alias") or "?"
+                        rssi = entry.get("rssi")
+                        marker = "[+]" if entry["event"] == "new" else "[~]"
+                        print(f"{marker} {entry['address']} ({name}) - RSSI: "
+                              f"{rssi if rssi is not None else '?'} dBm", flush=True)
+                except KeyboardInterrupt:
+                    pass
+                return 0
+
+            if args.adapters:
+                if variant not in ("passive", "naggy"):
+                    print("[ERROR] --adapters supports the passive and naggy variants only", file=sys.stderr)
+                    return 1
+                try:
+                    _scan_mod.multi_adapter_scan(
+                        args.adapters,
+                        timeout=timeout,
+                        transport=transport,
+                        duplicate_data=False if variant == "naggy" else None,
+                    )
+                except ValueError as exc:
+                    print(f"[ERROR] {exc}", file=sys.stderr)
+                    return 1
+                return 0
+
             dispatch = {
                 "passive": lambda: _scan_mod.passive_scan(target, timeout, transport=transport),
                 "naggy": lambda: _scan_mod.naggy_scan(target, timeout, transport=transport),
@@ -1565,6 +1667,14 @@ def main(args=None):
             from bleep.modes.signal import main as _sig_main
 
             opts = [args.mac, args.char, "--time", str(args.time)]
+            if args.out:
+                opts += ["--out", args.out, "--format", args.format]
+                if args.compress:
+                    opts += ["--compress", args.compress]
+                if args.rotate_mb:
+                    opts += ["--rotate-mb", str(args.rotate_mb)]
+                if args.rotate_seconds:
+                    opts += ["--rotate-seconds", str(args.rotate_seconds)]
             return _sig_main(opts) or 0
             
         elif args.mode == "signal-config":
@@ -1589,6 +1699,10 @@ def main(args=None):
                 uuid_opts.append("--verbose")
             if getattr(args, "include_unknown", False):
                 uuid_opts.append("--include-unknown")
+            if getattr(args, "stdin", False):
+                uuid_opts.append("--stdin")
+            if getattr(args, "file", None):
+                uuid_opts.extend(["--file", args.file])
             
             return _uuid_translate_main(uuid_opts) or 0
 
@@ -2719,7 +2833,7 @@ def main(args=None):
 
         elif args.mode == "classic-rfcomm":
             from bleep.ble_ops.classic.sdp import discover_services_sdp, build_svc_map
-            from bleep.ble_ops.classic.rfcomm import probe_rfcomm_channel
+            from bleep.ble_ops.classic.rfcomm import probe_all_channels
 
             mac = args.address.strip().upper()
             print(f"[*] Discovering SDP services for {mac}...")
@@ -2751,8 +2865,11 @@ def main(args=None):
 
             if args.probe:
                 print(f"\n[*] Probing {len(rfcomm_entries)} RFCOMM channel(s)...\n")
-                for ch, svc_name, _ in rfcomm_entries:
-                    result = probe_rfcomm_channel(mac, ch, timeout=args.timeout)
+                results = probe_all_channels(
+                    mac, [e[0] for e in rfcomm_entries],
+                    timeout=args.timeout, concurrency=args.concurrency,
+                )
+                for (ch, svc_name, _), result in zip(rfcomm_entries, results):
                     status = result.classification.upper()
                     extra = ""
                     if result.raw_response:
@@ -0,0 +1,338 @@
+"""
+D-Bus Call Tracing
+
+Records every BlueZ/obexd method call made through the timeout wrappers
+(``call_method_with_timeout`` / ``TimeoutDBusInterface``), the GATT
+characteristic read/write helpers and the pipelined GATT reader.  Each call
+is keyed by interface, member, *object path class* (the object path with
+adapter/device/handle components replaced by placeholders, so
+``/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF/service0010/char0011`` becomes
+``/org/bluez/{hci}/{dev}/{service}/{char}``) and outcome.
+
+Two exports are available:
+
+* Chrome trace-event JSON (open in ``chrome://tracing`` or Perfetto) –
+  individual spans are buffered only while tracing is enabled
+  (``BLEEP_DBUS_TRACE_FILE`` or ``bleep --trace-out FILE``).
+* Prometheus text exposition – per-key call counters and latency
+  histograms, always collected; served over HTTP by
+  :func:`serve_prometheus` (``BLEEP_METRICS_PORT`` or
+  ``bleep --metrics-port PORT``).
+
+Every call is also forwarded to :func:`bleep.core.metrics.record_operation`
+as ``dbus:<Interface>.<Member>`` so ``detect_issues()`` sees it.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from bleep.core.log import print_and_log, LOG__DEBUG, LOG__GENERAL
+from bleep.core.metrics import LatencyHistogram, record_operation
+
+# Prometheus histogram boundaries (seconds)
+PROMETHEUS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_PATH_CLASS_RULES = [
+    (re.compile(r"/hci\d+"), "/{hci}"),
+    (re.compile(r"/dev(_[0-9A-Fa-f]{2}){6}"), "/{dev}"),
+    (re.compile(r"/service[0-9a-fA-F]{4}"), "/{service}"),
+    (re.compile(r"/char[0-9a-fA-F]{4}"), "/{char}"),
+    (re.compile(r"/desc[0-9a-fA-F]{4}"), "/{desc}"),
+    (re.compile(r"/fd\d+"), "/{fd}"),
+    (re.compile(r"/sep\d+"), "/{sep}"),
+    (re.compile(r"/player\d+"), "/{player}"),
+    (re.compile(r"/session\d+"), "/{session}"),
+    (re.compile(r"/transfer\d+"), "/{transfer}"),
+]
+
+TraceKey = Tuple[str, str, str]  # (interface, member, path_class)
+
+
+def classify_path(path: Optional[str]) -> str:
+    """Collapse instance-specific components of a D-Bus object path."""
+    if not path:
+        return ""
+    path = str(path)
+    for pattern, repl in _PATH_CLASS_RULES:
+        path = pattern.sub(repl, path)
+    return path
+
+
+def outcome_of(exc: Optional[BaseException]) -> str:
+    """Short outcome label: ``ok``, the D-Bus error name, or the exception class."""
+    if exc is None:
+        return "ok"
+    get_name = getattr(exc, "get_dbus_name", None)
+    if callable(get_name):
+        try:
+            name = get_name()
+            if name:
+                return str(name)
+        except Exception:
+            pass
+    return type(exc).__name__
+
+
+class _KeyStats:
+    __slots__ = ("histogram", "outcomes")
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.outcomes: Dict[str, int] = {}
+
+
+class CallTracer:
+    """Aggregates D-Bus call timings and optionally buffers trace spans."""
+
+    def __init__(self, max_spans: Optional[int] = None):
+        if max_spans is None:
+            try:
+                max_spans = int(os.getenv("BLEEP_DBUS_TRACE_MAX", "200000"))
+            except ValueError:
+                max_spans = 200000
+        self._spans: Deque[Tuple[Any, ...]] = deque(maxlen=max(1, max_spans))
+        self._stats: Dict[TraceKey, _KeyStats] = {}
+        self._lock = threading.Lock()
+        self._epoch = time.perf_counter()
+        self.tracing = False
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record(self, interface: str, member: str, path: Optional[str],
+               start: float, duration: float, outcome: str = "ok") -> None:
+        """Record one completed call; *start* is a ``time.perf_counter()`` value."""
+        key = (str(interface or ""), str(member), classify_path(path))
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _KeyStats()
+            stats.histogram.record(duration)
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+            if self.tracing:
+                self._spans.append(
+                    (key, start, duration, outcome, threading.get_ident(), str(path or ""))
+                )
+        record_operation(f"dbus:{key[0]}.{key[1]}", duration, outcome == "ok")
+
+    @contextmanager
+    def trace_call(self, interface: str, member: str, path: Optional[str]) -> Iterator[None]:
+        """Time the enclosed block as one call; exceptions are recorded and re-raised."""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as exc:
+            self.record(interface, member, path, start, time.perf_counter() - start, outcome_of(exc))
+            raise
+        self.record(interface, member, path, start, time.perf_counter() - start)
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+    def start_tracing(self) -> None:
+        with self._lock:
+            self.tracing = True
+
+    def stop_tracing(self) -> None:
+        with self._lock:
+            self.tracing = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._stats.clear()
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the buffered spans as a Chrome trace-event document."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self._spans)
+        events: List[Dict[str, Any]] = []
+        for (interface, member, path_class), start, duration, outcome, tid, path in spans:
+            events.append({
+                "name": member,
+                "cat": interface or "dbus",
+                "ph": "X",
+                "ts": round((start - self._epoch) * 1e6, 3),
+                "dur": round(duration * 1e6, 3),
+                "pid": pid,
+                "tid": tid,
+                "args": {"path": path, "path_class": path_class, "outcome": outcome},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, filename: str) -> int:
+        """Write the Chrome trace JSON to *filename*; returns the span count."""
+        doc = self.chrome_trace()
+        directory = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(directory, exist_ok=True)
+        with open(filename, "w") as f:
+            json.dump(doc, f)
+        return len(doc["traceEvents"])
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-key totals sorted by cumulative time (largest first)."""
+        with self._lock:
+            items = [(key, stats.histogram.copy(), dict(stats.outcomes))
+                     for key, stats in self._stats.items()]
+        rows = []
+        for (interface, member, path_class), hist, outcomes in items:
+            row = {
+                "interface": interface,
+                "member": member,
+                "path_class": path_class,
+                "total_seconds": hist.total,
+                "outcomes": outcomes,
+            }
+            row.update(hist.statistics())
+            rows.append(row)
+        rows.sort(key=lambda r: r["total_seconds"], reverse=True)
+        return rows
+
+    def prometheus_text(self) -> str:
+        """Render counters and latency histograms in Prometheus text format."""
+        with self._lock:
+            items = [(key, stats.histogram.copy(), dict(stats.outcomes))
+                     for key, stats in sorted(self._stats.items())]
+        lines = [
+            "# HELP bleep_dbus_calls_total D-Bus method calls by outcome.",
+            "# TYPE bleep_dbus_calls_total counter",
+        ]
+        for key, _hist, outcomes in items:
+            base = _labels(key)
+            for outcome, count in sorted(outcomes.items()):
+                lines.append(f'bleep_dbus_calls_total{{{base},outcome="{_escape(outcome)}"}} {count}')
+        lines += [
+            "# HELP bleep_dbus_call_duration_seconds D-Bus method call latency.",
+            "# TYPE bleep_dbus_call_duration_seconds histogram",
+        ]
+        for key, hist, _outcomes in items:
+            base = _labels(key)
+            for bound, cumulative in _cumulative_buckets(hist, PROMETHEUS_BUCKETS):
+                lines.append(
+                    f'bleep_dbus_call_duration_seconds_bucket{{{base},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'bleep_dbus_call_duration_seconds_bucket{{{base},le="+Inf"}} {hist.count}')
+            lines.append(f"bleep_dbus_call_duration_seconds_sum{{{base}}} {hist.total:.6f}")
+            lines.append(f"bleep_dbus_call_duration_seconds_count{{{base}}} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: TraceKey) -> str:
+    interface, member, path_class = key
+    return (f'interface="{_escape(interface)}",member="{_escape(member)}",'
+            f'path_class="{_escape(path_class)}"')
+
+
+def _cumulative_buckets(hist: LatencyHistogram, bounds) -> List[Tuple[float, int]]:
+    """Map log buckets onto fixed Prometheus ``le`` bounds (bucket upper edges)."""
+    out = []
+    ordered = sorted(hist.counts.items())
+    pos = 0
+    seen = 0
+    for bound in bounds:
+        while pos < len(ordered):
+            index, count = ordered[pos]
+            upper = hist.min_value * hist.growth ** index
+            if upper > bound:
+                break
+            seen += count
+            pos += 1
+        out.append((bound, seen))
+    return out
+
+
+_tracer = CallTracer()
+_server = None
+_atexit_file: Optional[str] = None
+
+
+def get_call_tracer() -> CallTracer:
+    """Return the process-wide tracer."""
+    return _tracer
+
+
+def trace_call(interface: str, member: str, path: Optional[str]):
+    """Context manager timing one D-Bus call on the process-wide tracer."""
+    return _tracer.trace_call(interface, member, path)
+
+
+def record_call(interface: str, member: str, path: Optional[str],
+                start: float, duration: float, outcome: str = "ok") -> None:
+    """Record an already-timed call (e.g. completed via ``reply_handler``)."""
+    _tracer.record(interface, member, path, start, duration, outcome)
+
+
+def _write_trace_at_exit() -> None:
+    if not _atexit_file:
+        return
+    try:
+        count = _tracer.write_chrome_trace(_atexit_file)
+        print_and_log(f"[*] Wrote {count} D-Bus trace events to {_atexit_file}", LOG__GENERAL)
+    except OSError as e:
+        print_and_log(f"[-] Could not write D-Bus trace: {e}", LOG__GENERAL)
+
+
+def enable_trace_file(filename: str) -> None:
+    """Start buffering spans and write them as Chrome trace JSON at exit."""
+    global _atexit_file
+    if _atexit_file is None:
+        atexit.register(_write_trace_at_exit)
+    _atexit_file = os.path.expanduser(filename)
+    _tracer.start_tracing()
+
+
+def serve_prometheus(port: int, addr: str = "127.0.0.1"):
+    """Serve ``/metrics`` on *addr*:*port* from a daemon thread (idempotent)."""
+    global _server
+    if _server is not None:
+        return _server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - http.server API
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = _tracer.prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            print_and_log(f"[DEBUG] metrics endpoint: {fmt % args}", LOG__DEBUG)
+
+    _server = ThreadingHTTPServer((addr, port), _Handler)
+    thread = threading.Thread(target=_server.serve_forever, name="bleep-metrics", daemon=True)
+    thread.start()
+    print_and_log(f"[*] Prometheus metrics on http://{addr}:{port}/metrics", LOG__GENERAL)
+    return _server
+
+
+def configure_from_env() -> None:
+    """Honour ``BLEEP_DBUS_TRACE_FILE`` and ``BLEEP_METRICS_PORT``."""
+    trace_file = os.getenv("BLEEP_DBUS_TRACE_FILE")
+    if trace_file:
+        enable_trace_file(trace_file)
+    port = os.getenv("BLEEP_METRICS_PORT")
+    if port:
+        try:
+            serve_prometheus(int(port))
+        except (ValueError, OSError) as e:
+            print_and_log(f"[-] Could not start metrics endpoint on {port}: {e}", LOG__GENERAL)
@@ -16,9 +16,8 @@ CONFIG_DIR = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config")) / "blee
 for directory in [DATA_DIR, CACHE_DIR, CONFIG_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
-# Logging configuration
+# Logging configuration (created by bleep.core.log on the first write)
 LOG_DIR = DATA_DIR / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
 # OBEX file receive paths.
 # obexd on Ubuntu runs under AppArmor confinement and may only write to
@@ -3,12 +3,35 @@ Core logging functionality for BLEEP.
 
 This module provides a centralized logging system that maintains backward compatibility
 with the original logging implementation while providing a cleaner interface.
+
+Records are handed to a :class:`logging.handlers.QueueHandler` and written by
+a :class:`logging.handlers.QueueListener` thread, so callers never wait on
+file I/O.  The listener flushes files when the queue drains (or at least
+every ``BLEEP_LOG_FLUSH_MS``, default 200) instead of after every line.
+
+Messages may defer formatting: ``print_and_log("x=%s", LOG__DEBUG, x)`` or
+``print_and_log(lambda: expensive(), LOG__DEBUG)``.  For log types that are
+not echoed to stdout (DEBUG, ENUMERATE) the formatting happens on the
+listener thread – and not at all when the type is disabled – so arguments
+must not be mutated after the call.
+
+Tunables (environment):
+
+* ``BLEEP_DEBUG_LOG`` – ``0`` disables the DEBUG log (see :func:`set_debug_logging`)
+* ``BLEEP_LOG_ASYNC`` – ``0`` writes and flushes synchronously (legacy mode)
+* ``BLEEP_LOG_FLUSH_MS`` – maximum time a line stays buffered under load
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 from . import config
 
 # Re-export log type constants for external modules
@@ -34,7 +57,8 @@ _LEGACY_PATHS: Dict[str, str] = {
 # ---------------------------------------------------------------------------
 # Actual log records are stored under the per-user data directory to avoid
 # littering /tmp.  We keep backward-compatibility by creating symlinks at the
-# legacy paths that point at these real files.
+# legacy paths that point at these real files.  Both are created when a log
+# type is first written (see _BatchedFileHandler._open), not at import time.
 _INTERNAL_PATHS: Dict[str, Path] = {
     LOG__GENERAL: config.LOG_DIR / "general.log",
     LOG__DEBUG: config.LOG_DIR / "debug.log",
@@ -44,27 +68,63 @@ _INTERNAL_PATHS: Dict[str, Path] = {
     LOG__DATABASE: config.LOG_DIR / "database.log",
 }
 
-for _log_type, _internal_path in _INTERNAL_PATHS.items():
-    # Ensure the target directory exists and the file is present so
-    # Path.exists() on the symlink returns True immediately.
-    _internal_path.parent.mkdir(parents=True, exist_ok=True)
-    _internal_path.touch(exist_ok=True)
+# Use the internal paths for all logging handlers going forward
+_LOG_PATHS: Dict[str, Path] = _INTERNAL_PATHS
+
 
-    _legacy_path = Path(_LEGACY_PATHS[_log_type])
+def _link_legacy_path(log_type: str, internal_path: Path) -> None:
+    """Point the legacy /tmp path for *log_type* at *internal_path*."""
+    legacy_path = Path(_LEGACY_PATHS[log_type])
     try:
-        if _legacy_path.is_symlink() or _legacy_path.exists():
+        if legacy_path.is_symlink() or legacy_path.exists():
             # Remove stale file/symlink before recreating to ensure it points at
             # the correct, current target.
-            _legacy_path.unlink()
-        _legacy_path.symlink_to(_internal_path)
+            legacy_path.unlink()
+        legacy_path.symlink_to(internal_path)
     except Exception:
         # As a fallback (e.g., no permission to symlink on some filesystems) we
         # create a plain file at the legacy location so code that expects it
         # can still write or at least detect its presence.
-        _legacy_path.touch(exist_ok=True)
+        try:
+            legacy_path.touch(exist_ok=True)
+        except OSError:
+            pass
+
+
+class _BatchedFileHandler(logging.FileHandler):
+    """FileHandler whose per-record flush is skipped on the queue listener thread.
+
+    ``StreamHandler.emit()`` flushes after every record; the listener flushes
+    in batches via :meth:`flush_now` instead.  Other threads (``get_logger``
+    users, synchronous mode) keep the normal behaviour.
+
+    Handlers are created with ``delay=True``: the log directory, the file and
+    its legacy /tmp symlink only appear when the first record is written, so
+    importing :mod:`bleep` (or running ``bleep uuid-translate``) touches no
+    files.
+    """
+
+    _deferring = threading.local()
+
+    def __init__(self, path: Path, log_type: str):
+        super().__init__(path, mode="a", encoding="utf-8", delay=True)
+        self.log_type = log_type
+
+    def _open(self):
+        path = Path(self.baseFilename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = super()._open()
+        _link_legacy_path(self.log_type, path)
+        return stream
+
+    def flush(self) -> None:
+        if getattr(self._deferring, "active", False):
+            return
+        super().flush()
+
+    def flush_now(self) -> None:
+        logging.FileHandler.flush(self)
 
-# Use the internal paths for all logging handlers going forward
-_LOG_PATHS: Dict[str, Path] = _INTERNAL_PATHS
 
 # Formatter identical to legacy (raw message only)
 _formatter = logging.Formatter("%(message)s")
@@ -72,7 +132,7 @@ _formatter = logging.Formatter("%(message)s")
 # Create and configure handlers
 _handlers: Dict[str, logging.Handler] = {}
 for log_type, path in _LOG_PATHS.items():
-    handler = logging.FileHandler(path, mode="a", encoding="utf-8")
+    handler = _BatchedFileHandler(path, log_type)
     handler.setFormatter(_formatter)
     _handlers[log_type] = handler
 
@@ -86,24 +146,177 @@ for handler in _handlers.values():
 del log_type, path, handler
 
 
-def _emit(line: str, log_type: str) -> None:
-    """Internal helper to emit log records without altering the original message."""
-    if not line.endswith("\n"):
-        line += "\n"
-    record = logging.LogRecord(
+def _env_flag(name: str, default: str = "1") -> bool:
+    return os.getenv(name, default).lower() not in ("0", "false", "no", "off")
+
+
+def _flush_interval() -> float:
+    try:
+        return max(0.0, float(os.getenv("BLEEP_LOG_FLUSH_MS", "200")) / 1000.0)
+    except ValueError:
+        return 0.2
+
+
+# Log types whose records are dropped before any formatting happens
+_disabled_types = set() if _env_flag("BLEEP_DEBUG_LOG") else {LOG__DEBUG}
+
+
+def set_debug_logging(enabled: bool) -> None:
+    """Enable or disable the DEBUG log at runtime."""
+    if enabled:
+        _disabled_types.discard(LOG__DEBUG)
+    else:
+        _disabled_types.add(LOG__DEBUG)
+
+
+def debug_enabled() -> bool:
+    """Return True when DEBUG records are written (use to guard costly diagnostics)."""
+    return LOG__DEBUG not in _disabled_types
+
+
+def _render(msg: Any, args: tuple) -> str:
+    """Produce the final text of a (possibly deferred) message."""
+    if callable(msg):
+        msg = msg()
+    msg = str(msg)
+    if args:
+        try:
+            msg = msg % args
+        except (TypeError, ValueError):
+            msg = " ".join([msg] + [str(a) for a in args])
+    return msg
+
+
+class _DeferredRecord(logging.LogRecord):
+    """LogRecord whose message is a callable and/or ``%`` template rendered on demand."""
+
+    def getMessage(self) -> str:  # noqa: N802 - logging API
+        return _render(self.msg, self.args or ()).rstrip("\n")
+
+
+class _LogTypeQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchingListener(logging.handlers.QueueListener):
+    """Routes records to their log-type file and flushes in batches."""
+
+    def __init__(self, log_queue: "queue.Queue", handlers: Dict[str, logging.Handler],
+                 flush_interval: float):
+        super().__init__(log_queue)
+        self._by_type = handlers
+        self._dirty = set()
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def dequeue(self, block: bool):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self.flush()  # queue drained: make everything visible
+            return self.queue.get(block)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        barrier = getattr(record, "bleep_barrier", None)
+        if barrier is not None:
+            self.flush()
+            barrier.set()
+            return
+        _BatchedFileHandler._deferring.active = True
+        handler = self._by_type.get(getattr(record, "bleep_log_type", LOG__GENERAL),
+                                    self._by_type[LOG__GENERAL])
+        try:
+            handler.handle(record)
+        except Exception:  # noqa: BLE001 – a bad record must not kill the listener
+            handler.handleError(record)
+        self._dirty.add(handler)
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        for handler in self._dirty:
+            try:
+                handler.flush_now()
+            except Exception:  # noqa: BLE001
+                pass
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
+
+    def stop(self) -> None:
+        super().stop()
+        self.flush()
+
+
+_queue_handler: Optional[_LogTypeQueueHandler] = None
+_listener: Optional[_BatchingListener] = None
+_listener_lock = threading.Lock()
+
+
+def _get_queue_handler() -> Optional[_LogTypeQueueHandler]:
+    """Start the listener thread on first use; None in synchronous mode."""
+    global _queue_handler, _listener
+    if _queue_handler is not None or not _env_flag("BLEEP_LOG_ASYNC"):
+        return _queue_handler
+    with _listener_lock:
+        if _queue_handler is None:
+            log_queue: "queue.Queue" = queue.Queue()
+            _listener = _BatchingListener(log_queue, _handlers, _flush_interval())
+            _listener.start()
+            atexit.register(shutdown_logging)
+            _queue_handler = _LogTypeQueueHandler(log_queue)
+    return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """Drain the queue and flush every log file (registered with ``atexit``)."""
+    global _queue_handler, _listener
+    with _listener_lock:
+        listener, _listener, _queue_handler = _listener, None, None
+    if listener is not None:
+        listener.stop()
+
+
+def flush_logs() -> None:
+    """Block until every record queued so far is on disk."""
+    handler = _queue_handler
+    if handler is None:
+        return
+    done = threading.Event()
+    record = logging.LogRecord("bleep", logging.INFO, __file__, 0, "", (), None)
+    record.bleep_barrier = done
+    handler.enqueue(record)
+    done.wait(5.0)
+
+
+def _emit(line: Any, log_type: str, args: tuple = ()) -> None:
+    """Internal helper to emit log records without altering the original message.
+
+    *line* may be a ``%`` template (with *args*) or a callable returning the
+    text; either is rendered only when the record is written.
+    """
+    if log_type in _disabled_types:
+        return
+    record = _DeferredRecord(
         name=f"bleep.{log_type.lower()}",
         level=logging.INFO,
         pathname=__file__,
         lineno=0,
-        msg=line.rstrip("\n"),
-        args=(),
+        msg=line,
+        args=args,
         exc_info=None,
     )
+    record.bleep_log_type = log_type
+    queue_handler = _get_queue_handler()
+    if queue_handler is not None:
+        queue_handler.enqueue(record)
+        return
     handler = _handlers.get(log_type, _handlers[LOG__GENERAL])
     handler.handle(record)
-    # Force immediate flush to ensure logs are written to disk immediately
-    # This is critical for agent methods and IO handlers where logs must be visible
-    handler.flush()
+    # Synchronous mode: flush immediately so the line is visible on disk
+    handler.flush_now()
 
 
 # Legacy-compatible logging functions
@@ -148,16 +361,25 @@ _log_func_map = {
 }
 
 
-def logging__log_event(log_type: str, string_to_log: str) -> None:
+def logging__log_event(log_type: str, string_to_log: str, *args: Any) -> None:
     """Log an event to the specified log type."""
-    _log_func_map.get(log_type, logging__general_log)(string_to_log)
+    _emit(string_to_log, log_type if log_type in _log_func_map else LOG__GENERAL, args)
+
 
+def print_and_log(output_string: Union[str, Callable[[], str]],
+                  log_type: str = LOG__GENERAL, *args: Any) -> None:
+    """Print to stdout and log to the specified log type.
 
-def print_and_log(output_string: str, log_type: str = LOG__GENERAL) -> None:
-    """Print to stdout and log to the specified log type."""
+    *output_string* may be a ``%`` template formatted with *args*, or a
+    callable returning the text.  DEBUG/ENUMERATE messages are only logged,
+    so their formatting is deferred to the log writer (or skipped entirely
+    when the type is disabled).
+    """
     if log_type not in (LOG__DEBUG, LOG__ENUM):
+        output_string = _render(output_string, args)
+        args = ()
         print(output_string)
-    logging__log_event(log_type, output_string)
+    logging__log_event(log_type, output_string, *args)
 
 
 # Modern interface
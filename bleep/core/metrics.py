@@ -5,35 +5,222 @@ This module provides functionality for tracking D-Bus call latency statistics
 and error rates to detect potential issues before they cause significant problems.
 """
 
+import math
 import time
 import threading
-from collections import defaultdict
-from typing import Dict, List, Optional, Any, Tuple, Union
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Any, Tuple, Union
 
 from bleep.core.log import print_and_log, LOG__DEBUG
 
 
+class LatencyHistogram:
+    """
+    Fixed-memory, mergeable latency histogram.
+    
+    Samples are counted in logarithmic buckets (HDR-style): bucket *i*
+    covers ``[min_value * growth**i, min_value * growth**(i+1))`` so every
+    reported quantile is within ``(growth - 1) / 2`` relative error of the
+    true value.  With the defaults (1 µs floor, 2 % bucket width) the full
+    range up to 1000 s needs roughly 1000 buckets regardless of how many
+    samples are recorded.  Recording is O(1); histograms with the same
+    bucket layout can be merged by adding counts.
+    """
+    
+    __slots__ = ("min_value", "growth", "_log_growth", "counts", "count",
+                 "total", "min", "max")
+    
+    def __init__(self, min_value: float = 1e-6, growth: float = 1.02):
+        self.min_value = min_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+    
+    def _bucket(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) / self._log_growth) + 1
+    
+    def _bucket_value(self, index: int) -> float:
+        """Representative (geometric midpoint) value of bucket *index*."""
+        if index == 0:
+            return self.min_value
+        return self.min_value * self.growth ** (index - 0.5)
+    
+    def record(self, value: float) -> None:
+        """Add one sample (seconds)."""
+        index = self._bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of *other* (same bucket layout) to this histogram."""
+        if (other.min_value, other.growth) != (self.min_value, self.growth):
+            raise ValueError("cannot merge histograms with different bucket layouts")
+        counts = self.counts
+        for index, n in other.counts.items():
+            counts[index] = counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram(self.min_value, self.growth)
+        clone.merge(self)
+        return clone
+    
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """Return the values at quantiles *qs* (each in ``[0, 1]``)."""
+        if not self.count:
+            return [0.0 for _ in qs]
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        targets = [max(1, math.ceil(qs[i] * self.count)) for i in order]
+        out = [0.0] * len(qs)
+        pos = 0
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while pos < len(targets) and seen >= targets[pos]:
+                # Clamp to the exact extremes we tracked
+                value = min(max(self._bucket_value(index), self.min), self.max)
+                out[order[pos]] = value
+                pos += 1
+            if pos == len(targets):
+                break
+        return out
+    
+    def statistics(self) -> Dict[str, float]:
+        """Summary in the format returned by :meth:`LatencyTracker.get_statistics`."""
+        if not self.count:
+            return {
+                'min': 0.0,
+                'max': 0.0,
+                'avg': 0.0,
+                'p50': 0.0,
+                'p90': 0.0,
+                'p95': 0.0,
+                'p99': 0.0,
+                'p999': 0.0,
+                'count': 0
+            }
+        p50, p90, p95, p99, p999 = self.quantiles([0.5, 0.9, 0.95, 0.99, 0.999])
+        return {
+            'min': self.min,
+            'max': self.max,
+            'avg': self.total / self.count,
+            'p50': p50,
+            'p90': p90,
+            'p95': p95,
+            'p99': p99,
+            'p999': p999,
+            'count': self.count
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serialisable form (bucket keys become strings)."""
+        return {
+            'min_value': self.min_value,
+            'growth': self.growth,
+            'counts': {str(k): v for k, v in self.counts.items()},
+            'count': self.count,
+            'total': self.total,
+            'min': self.min if self.count else None,
+            'max': self.max,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        hist = cls(data.get('min_value', 1e-6), data.get('growth', 1.02))
+        hist.counts = {int(k): int(v) for k, v in data.get('counts', {}).items()}
+        hist.count = int(data.get('count', 0))
+        hist.total = float(data.get('total', 0.0))
+        hist.min = data['min'] if data.get('min') is not None else math.inf
+        hist.max = float(data.get('max', 0.0))
+        return hist
+
+
+class _OperationLatency:
+    """Lifetime histogram plus a ring of per-slot histograms for one operation."""
+    
+    __slots__ = ("lifetime", "slots")
+    
+    def __init__(self):
+        self.lifetime = LatencyHistogram()
+        # Deque of (slot_id, histogram); slot ids are absolute so snapshots
+        # taken in different threads line up when merged.
+        self.slots: Deque[Tuple[int, LatencyHistogram]] = deque()
+
+
 class LatencyTracker:
     """
     Tracks latency statistics for D-Bus operations.
     
-    This class maintains a rolling window of latency samples for different
-    operation types and calculates statistics for early warning detection.
+    Each operation keeps a lifetime :class:`LatencyHistogram` and a sliding
+    window made of *window_slots* sub-histograms covering *window_seconds*
+    in total.  Recording is O(1) and memory is fixed per operation, so
+    percentiles stay meaningful over thousands of calls.  Per-thread
+    trackers can be combined with :meth:`snapshot` and :meth:`merge`.
     """
     
-    def __init__(self, window_size: int = 100):
+    def __init__(self, window_size: int = 100, window_seconds: float = 300.0,
+                 window_slots: int = 10):
         """
-        Initialize latency tracker with specified window size.
+        Initialize latency tracker.
         
         Parameters
         ----------
         window_size : int
-            Number of samples to keep for each operation type
+            Retained for API compatibility; the sliding window is time based
+        window_seconds : float
+            Span of the sliding-window view in seconds
+        window_slots : int
+            Number of sub-histograms the window is divided into
         """
         self._window_size = window_size
-        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._window_slots = max(1, window_slots)
+        self._slot_seconds = window_seconds / self._window_slots
+        self._ops: Dict[str, _OperationLatency] = {}
         self._lock = threading.Lock()
     
+    def _slot_id(self, now: Optional[float] = None) -> int:
+        return int((time.time() if now is None else now) // self._slot_seconds)
+    
+    def _slot_for(self, entry: _OperationLatency, slot_id: int) -> Optional[LatencyHistogram]:
+        slots = entry.slots
+        if slots and slots[-1][0] >= slot_id:
+            if slots[-1][0] == slot_id:
+                return slots[-1][1]
+            # Out-of-order slot (merge of an older snapshot): linear search is
+            # bounded by window_slots
+            for idx, (sid, hist) in enumerate(slots):
+                if sid == slot_id:
+                    return hist
+                if sid > slot_id:
+                    break
+            else:
+                idx = len(slots)
+            if slot_id <= slots[-1][0] - self._window_slots:
+                return None  # older than the window
+            # Gap inside the window: keep slots sorted by id
+            hist = LatencyHistogram()
+            slots.insert(idx, (slot_id, hist))
+            return hist
+        hist = LatencyHistogram()
+        slots.append((slot_id, hist))
+        while slots and slots[0][0] <= slot_id - self._window_slots:
+            slots.popleft()
+        return hist
+    
     def record_latency(self, operation: str, latency: float) -> None:
         """
         Record a latency sample for an operation.
@@ -45,15 +232,35 @@ class LatencyTracker:
         latency : float
             Latency in seconds
         """
+        slot_id = self._slot_id()
         with self._lock:
-            samples = self._samples[operation]
-            samples.append(latency)
-            
-            # Keep only the most recent samples
-            while len(samples) > self._window_size:
-                samples.pop(0)
+            entry = self._ops.get(operation)
+            if entry is None:
+                entry = self._ops[operation] = _OperationLatency()
+            entry.lifetime.record(latency)
+            slot = self._slot_for(entry, slot_id)
+            if slot is not None:  # None only if the wall clock stepped back
+                slot.record(latency)
+    
+    def _window_histogram(self, entry: _OperationLatency, now_slot: int) -> LatencyHistogram:
+        hist = LatencyHistogram()
+        for sid, slot in entry.slots:
+            if sid > now_slot - self._window_slots:
+                hist.merge(slot)
+        return hist
+    
+    def get_histogram(self, operation: str, view: str = "window") -> LatencyHistogram:
+        """Return a copy of the ``"window"`` or ``"lifetime"`` histogram."""
+        now_slot = self._slot_id()
+        with self._lock:
+            entry = self._ops.get(operation)
+            if entry is None:
+                return LatencyHistogram()
+            if view == "lifetime":
+                return entry.lifetime.copy()
+            return self._window_histogram(entry, now_slot)
     
-    def get_statistics(self, operation: str) -> Dict[str, float]:
+    def get_statistics(self, operation: str, view: str = "window") -> Dict[str, float]:
         """
         Get statistics for an operation type.
         
@@ -61,6 +268,8 @@ class LatencyTracker:
         ----------
         operation : str
             Type of operation
+        view : str
+            ``"window"`` (default, the last *window_seconds*) or ``"lifetime"``
             
         Returns
         -------
@@ -69,40 +278,16 @@ class LatencyTracker:
             - 'min': Minimum latency
             - 'max': Maximum latency
             - 'avg': Average latency
+            - 'p50': Median latency
             - 'p90': 90th percentile latency
             - 'p95': 95th percentile latency
             - 'p99': 99th percentile latency
+            - 'p999': 99.9th percentile latency
             - 'count': Number of samples
         """
-        with self._lock:
-            samples = self._samples.get(operation, [])
-            
-            if not samples:
-                return {
-                    'min': 0.0,
-                    'max': 0.0,
-                    'avg': 0.0,
-                    'p90': 0.0,
-                    'p95': 0.0,
-                    'p99': 0.0,
-                    'count': 0
-                }
-            
-            # Sort for percentile calculations
-            sorted_samples = sorted(samples)
-            count = len(sorted_samples)
-            
-            return {
-                'min': sorted_samples[0],
-                'max': sorted_samples[-1],
-                'avg': sum(sorted_samples) / count,
-                'p90': sorted_samples[int(count * 0.9)],
-                'p95': sorted_samples[int(count * 0.95)],
-                'p99': sorted_samples[int(count * 0.99)],
-                'count': count
-            }
+        return self.get_histogram(operation, view).statistics()
     
-    def get_all_statistics(self) -> Dict[str, Dict[str, float]]:
+    def get_all_statistics(self, view: str = "window") -> Dict[str, Dict[str, float]]:
         """
         Get statistics for all operation types.
         
@@ -111,10 +296,43 @@ class LatencyTracker:
         Dict[str, Dict[str, float]]
             Dictionary mapping operation types to their statistics
         """
-        result = {}
-        for operation in self._samples:
-            result[operation] = self.get_statistics(operation)
-        return result
+        with self._lock:
+            operations = list(self._ops)
+        return {operation: self.get_statistics(operation, view) for operation in operations}
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return a detached copy of every histogram.
+        
+        The result maps operation → ``{"lifetime": LatencyHistogram,
+        "slots": [(slot_id, LatencyHistogram), ...]}`` and can be passed to
+        :meth:`merge` on another tracker.
+        """
+        with self._lock:
+            return {
+                operation: {
+                    "lifetime": entry.lifetime.copy(),
+                    "slots": [(sid, hist.copy()) for sid, hist in entry.slots],
+                }
+                for operation, entry in self._ops.items()
+            }
+    
+    def merge(self, other: Union["LatencyTracker", Dict[str, Dict[str, Any]]]) -> None:
+        """Fold another tracker (or one of its snapshots) into this one."""
+        snap = other.snapshot() if isinstance(other, LatencyTracker) else other
+        now_slot = self._slot_id()
+        with self._lock:
+            for operation, data in snap.items():
+                entry = self._ops.get(operation)
+                if entry is None:
+                    entry = self._ops[operation] = _OperationLatency()
+                entry.lifetime.merge(data["lifetime"])
+                for sid, hist in sorted(data.get("slots", []), key=lambda item: item[0]):
+                    if sid <= now_slot - self._window_slots:
+                        continue  # already outside the window
+                    target = self._slot_for(entry, sid)
+                    if target is not None:
+                        target.merge(hist)
 
 
 class ErrorTracker:
@@ -136,7 +354,8 @@ class ErrorTracker:
         """
         self._window_period = window_period
         self._operations: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
-        self._lock = threading.Lock()
+        # Re-entrant: get_all_error_rates() calls get_error_rate() under the lock
+        self._lock = threading.RLock()
     
     def record_operation(self, operation: str, success: bool) -> None:
         """
@@ -236,7 +455,7 @@ class DBusMetricsCollector:
         Parameters
         ----------
         latency_window_size : int
-            Number of samples to keep for latency statistics
+            Retained for API compatibility (latency windows are time based)
         error_window_period : float
             Time window in seconds for error rate calculation
         """
@@ -295,10 +514,15 @@ class DBusMetricsCollector:
             {
                 'operation_type': {
                     'p95_latency': 0.5,  # 500ms threshold for p95 latency
+                    'p99_latency': 2.0,  # 2s threshold for p99 latency
                     'error_rate': 0.05   # 5% threshold for error rate
                 }
             }
             
+        Latency checks use the sliding-window histograms, so tail
+        percentiles reflect every call in the window rather than the last
+        100 samples.  P99 is only judged once 100 samples are available.
+            
         Returns
         -------
         Dict[str, List[str]]
@@ -307,6 +531,7 @@ class DBusMetricsCollector:
         thresholds = thresholds or {}
         default_thresholds = {
             'p95_latency': 1.0,  # 1 second
+            'p99_latency': 3.0,  # 3 seconds
             'error_rate': 0.1    # 10%
         }
         
@@ -330,6 +555,11 @@ class DBusMetricsCollector:
                         operation_issues.append(
                             f"High latency: P95={stats['p95']:.3f}s"
                         )
+                if stats['count'] >= 100:  # P99 needs a real tail to be meaningful
+                    if stats['p99'] > op_thresholds.get('p99_latency', default_thresholds['p99_latency']):
+                        operation_issues.append(
+                            f"High tail latency: P99={stats['p99']:.3f}s over {stats['count']} calls"
+                        )
             
             # Check error rate
             if operation in error_rates:
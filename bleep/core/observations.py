@@ -6,13 +6,18 @@ unavailable on the host system.
 """
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
 import os
+import queue
 import re
 import sqlite3
 import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -20,12 +25,15 @@ from bleep.core.log import print_and_log, LOG__DEBUG
 
 __all__ = [
     "upsert_device",
+    "upsert_devices_bulk",
     "insert_adv",
     "upsert_services",
     "upsert_characteristics",
     "upsert_classic_services",
     "upsert_sdp_record",
     "upsert_pbap_metadata",
+    "get_map_manifest",
+    "upsert_map_manifest",
     "insert_char_history",
     "snapshot_media_player",
     "snapshot_media_transport",
@@ -34,6 +42,12 @@ __all__ = [
     "get_characteristic_timeline",
     "export_device_data",
     "store_signal_capture",
+    "store_signal_captures",
+    # Write-behind batching
+    "enable_write_behind",
+    "disable_write_behind",
+    "flush",
+    "get_write_behind_stats",
     # AoI Database Integration
     "store_aoi_analysis",
     "get_aoi_analysis",
@@ -43,6 +57,7 @@ __all__ = [
     "store_device_type_evidence",
     "get_device_type_evidence",
     "get_device_evidence_signature",
+    "get_device_type_and_signature",
     # Database Maintenance and Performance
     "maintain_database",
     "explain_query",
@@ -50,10 +65,19 @@ __all__ = [
 
 _DB_LOCK = threading.Lock()
 _DB_CONN: sqlite3.Connection | None = None
+_INIT_LOCK = threading.Lock()
 
 _DB_PATH = Path(os.getenv("BLEEP_DB_PATH", Path.home() / ".bleep" / "observations.db"))
 
-_SCHEMA_VERSION = 11  # v11: AoI augmentation — pairing_profile, sdp_summary, post_pair_delta on aoi_analysis
+# Connection tuning applied at open.  WAL lets the per-thread read-only
+# connections below run concurrently with the single writer connection;
+# synchronous=NORMAL is durable across application crashes in WAL mode and
+# only risks the last transactions on power loss.
+_DB_MMAP_SIZE = int(os.getenv("BLEEP_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+_DB_CACHE_SIZE_KIB = int(os.getenv("BLEEP_DB_CACHE_SIZE_KIB", "16384"))
+_DB_BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA_VERSION = 12  # v12: map_messages manifest for incremental MAP downloads
 
 _SCHEMA_SQL = """
 PRAGMA foreign_keys = ON;
@@ -170,6 +194,20 @@ CREATE TABLE IF NOT EXISTS pbap_metadata (
     UNIQUE(mac,repo)
 );
 
+CREATE TABLE IF NOT EXISTS map_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    mac TEXT REFERENCES devices(mac) ON DELETE CASCADE,
+    instance INT NOT NULL DEFAULT 0,
+    folder TEXT NOT NULL,
+    handle TEXT NOT NULL,
+    size INT,
+    datetime TEXT,
+    hash TEXT,
+    path TEXT,
+    ts DATETIME,
+    UNIQUE(mac, instance, folder, handle)
+);
+
 CREATE TABLE IF NOT EXISTS char_history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     mac TEXT REFERENCES devices(mac) ON DELETE CASCADE,
@@ -246,15 +284,39 @@ CREATE INDEX IF NOT EXISTS idx_device_type_evidence_ts ON device_type_evidence(t
 """
 
 
+def _apply_pragmas(conn: sqlite3.Connection, *, writer: bool) -> None:
+    """Apply the performance PRAGMAs shared by writer and reader connections."""
+    conn.execute(f"PRAGMA busy_timeout = {_DB_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA cache_size = -{_DB_CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {_DB_MMAP_SIZE}")
+    if writer:
+        try:
+            mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if str(mode).lower() != "wal":
+                print_and_log(f"[*] Observation DB journal_mode is {mode} (WAL unavailable)", LOG__DEBUG)
+        except sqlite3.DatabaseError as e:
+            print_and_log(f"[*] Could not enable WAL on observation DB: {e}", LOG__DEBUG)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+    else:
+        conn.execute("PRAGMA query_only = ON")
+
+
 def _init_db() -> None:
     """Initialize the database using latest schema."""
+    with _INIT_LOCK:
+        if _DB_CONN is None:
+            _open_writer_db()
+
+
+def _open_writer_db() -> None:
+    """Open the shared writer connection and run schema migrations."""
     global _DB_CONN
-    if _DB_CONN is not None:
-        return
 
     _DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn, writer=True)
     
     with conn:
         # Create tables with current schema
@@ -501,6 +563,29 @@ def _init_db() -> None:
             except Exception as e:
                 print(f"Migration v10 to v11 failed: {e}")
 
+        # Migration from v11 to v12 — MAP message manifest
+        if current_version == 11:
+            try:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS map_messages (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        mac TEXT REFERENCES devices(mac) ON DELETE CASCADE,
+                        instance INT NOT NULL DEFAULT 0,
+                        folder TEXT NOT NULL,
+                        handle TEXT NOT NULL,
+                        size INT,
+                        datetime TEXT,
+                        hash TEXT,
+                        path TEXT,
+                        ts DATETIME,
+                        UNIQUE(mac, instance, folder, handle)
+                    )
+                """)
+                print("[+] Database schema v12: map_messages manifest table")
+                current_version = 12
+            except Exception as e:
+                print(f"Migration v11 to v12 failed: {e}")
+
         # Persist schema version
         if not ver_row:
             conn.execute("INSERT INTO schema_version(version) VALUES (?)", (_SCHEMA_VERSION,))
@@ -526,6 +611,390 @@ def _db_cursor():
         raise
 
 
+# ---------------------------------------------------------------------------
+# Read connection pool -------------------------------------------------------
+# ---------------------------------------------------------------------------
+#
+# Each reading thread gets its own read-only connection so that queries do not
+# serialise on _DB_LOCK behind the writer.  Connections are keyed by thread and
+# reaped once their owning thread has exited.
+
+_READ_POOL_LOCK = threading.Lock()
+_READ_CONNS: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+
+
+def _get_read_conn() -> sqlite3.Connection | None:
+    """Return this thread's read-only connection, opening it on first use.
+
+    Returns ``None`` when a read-only connection cannot be opened (e.g. the
+    DB lives somewhere URI mode cannot reach); callers then fall back to the
+    shared writer connection.
+    """
+    if _DB_CONN is None:
+        _init_db()
+    me = threading.current_thread()
+    entry = _READ_CONNS.get(me.ident)  # type: ignore[arg-type]
+    if entry is not None and entry[0] is me:
+        return entry[1]
+    try:
+        conn = sqlite3.connect(
+            f"{_DB_PATH.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        _apply_pragmas(conn, writer=False)
+    except Exception as e:
+        print_and_log(f"[*] Read-only DB connection unavailable, using writer: {e}", LOG__DEBUG)
+        return None
+    with _READ_POOL_LOCK:
+        for ident, (thr, old) in list(_READ_CONNS.items()):
+            if not thr.is_alive() or ident == me.ident:
+                del _READ_CONNS[ident]
+                try:
+                    old.close()
+                except Exception:
+                    pass
+        _READ_CONNS[me.ident] = (me, conn)  # type: ignore[index]
+    return conn
+
+
+def close_read_connections() -> None:
+    """Close every pooled read-only connection (e.g. before moving the DB)."""
+    with _READ_POOL_LOCK:
+        conns = [c for _, c in _READ_CONNS.values()]
+        _READ_CONNS.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+@contextmanager
+def _read_cursor():
+    """Context manager yielding a cursor on this thread's read-only connection.
+
+    Falls back to the writer connection (under ``_DB_LOCK``) if no read-only
+    connection can be opened.
+    """
+    conn = _get_read_conn()
+    if conn is None:
+        with _DB_LOCK, _db_cursor() as cur:
+            yield cur
+        return
+    cur = conn.cursor()
+    try:
+        yield cur
+    except Exception as e:
+        print_and_log(f"DB Error: {e}", LOG__DEBUG)
+        raise
+    finally:
+        cur.close()
+
+
+# ---------------------------------------------------------------------------
+# Write-behind queue ---------------------------------------------------------
+# ---------------------------------------------------------------------------
+#
+# Opt-in mode in which the hot-path writers (upsert_device, insert_adv,
+# insert_char_history and therefore store_signal_capture) enqueue their rows
+# instead of committing them one at a time.  A single background thread
+# drains the queue and applies rows in executemany batches inside one
+# transaction whenever *batch_size* rows are pending or *flush_interval_ms*
+# has elapsed.  Callers that need read-after-write semantics call flush().
+
+_WB_DEVICE = "device"
+_WB_ADV = "adv"
+_WB_CHAR_HISTORY = "char_history"
+_WB_BARRIER = "barrier"
+_WB_STOP = "stop"
+
+
+class _WriteBehindWriter:
+    """Bounded queue plus background thread that batches DB writes."""
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        flush_interval_ms: int = 250,
+        max_queue: int = 10000,
+        block_timeout: float = 0.5,
+    ):
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(1, int(flush_interval_ms)) / 1000.0
+        self.block_timeout = max(0.0, float(block_timeout))
+        self._queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "batches": 0,
+            "errors": 0,
+            "max_depth": 0,
+        }
+        self._running = True
+        # Orders submit()/flush() against stop() so nothing is queued behind
+        # the stop marker, where it would never be written.
+        self._state_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="bleep-db-writer", daemon=True
+        )
+        self._thread.start()
+
+    # -- producer side -----------------------------------------------------
+
+    def submit(self, kind: str, payload: Any) -> bool:
+        """Queue a row.  Returns False only when the writer is stopped.
+
+        When the queue is full the producer waits up to *block_timeout*
+        seconds (backpressure); after that the row is dropped and counted
+        as ``dropped``.  Writing it synchronously instead would commit it
+        ahead of older queued rows, which would later overwrite it with
+        stale values.  False tells the caller to write the row itself.
+        """
+        item = (kind, payload)
+        with self._state_lock:
+            if not self._running:
+                return False
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._bump("blocked")
+                try:
+                    if self.block_timeout <= 0:
+                        raise queue.Full
+                    self._queue.put(item, timeout=self.block_timeout)
+                except queue.Full:
+                    self._bump("dropped")
+                    return True
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            depth = self._queue.qsize()
+            if depth > self._stats["max_depth"]:
+                self._stats["max_depth"] = depth
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every row queued before this call is committed.
+
+        Returns False if that did not happen within *timeout*, including
+        time spent waiting for room in a full queue.
+        """
+        if threading.current_thread() is self._thread:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        with self._state_lock:
+            if not self._running:
+                return True
+            try:
+                self._queue.put((_WB_BARRIER, done), timeout=timeout)
+            except queue.Full:
+                return False
+        if deadline is None:
+            return done.wait()
+        return done.wait(max(0.0, deadline - time.monotonic()))
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain outstanding rows and terminate the writer thread."""
+        with self._state_lock:
+            if not self._running:
+                return
+            # Later submits see _running False and are written by the caller.
+            self._running = False
+            try:
+                self._queue.put((_WB_STOP, None), timeout=timeout)
+            except queue.Full:
+                print_and_log(
+                    "DB write-behind queue did not drain in time; writer left running",
+                    LOG__DEBUG,
+                )
+                return
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        out.update(
+            running=self._running,
+            depth=self._queue.qsize(),
+            capacity=self._queue.maxsize,
+            batch_size=self.batch_size,
+            flush_interval_ms=int(self.flush_interval * 1000),
+        )
+        return out
+
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    # -- writer thread -----------------------------------------------------
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Tuple[str, Any]] = []
+            barriers: List[threading.Event] = []
+            try:
+                batch.append(self._queue.get())
+            except Exception:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                kind = batch[-1][0]
+                if kind in (_WB_BARRIER, _WB_STOP):
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            rows: List[Tuple[str, Any]] = []
+            for kind, payload in batch:
+                if kind == _WB_BARRIER:
+                    barriers.append(payload)
+                elif kind == _WB_STOP:
+                    stopping = True
+                else:
+                    rows.append((kind, payload))
+
+            if stopping:
+                # Drain whatever producers managed to enqueue before stop().
+                while True:
+                    try:
+                        kind, payload = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if kind == _WB_BARRIER:
+                        barriers.append(payload)
+                    elif kind != _WB_STOP:
+                        rows.append((kind, payload))
+
+            if rows:
+                self._apply(rows)
+            for ev in barriers:
+                ev.set()
+
+    def _apply(self, rows: List[Tuple[str, Any]]) -> None:
+        """Write *rows* in one transaction, grouping consecutive kinds.
+
+        If the batch fails, its rows are retried one transaction each so a
+        single bad row only loses itself.
+        """
+        try:
+            with _DB_LOCK, _db_cursor() as cur:
+                self._write_rows(cur, rows)
+            with self._stats_lock:
+                self._stats["written"] += len(rows)
+                self._stats["batches"] += 1
+            return
+        except Exception as e:
+            print_and_log(
+                f"DB write-behind batch of {len(rows)} rows failed ({e}); retrying row by row",
+                LOG__DEBUG,
+            )
+        for row in rows:
+            try:
+                with _DB_LOCK, _db_cursor() as cur:
+                    self._write_rows(cur, [row])
+                self._bump("written")
+            except Exception as e:
+                self._bump("errors")
+                print_and_log(f"DB write-behind {row[0]} row failed: {e}", LOG__DEBUG)
+        self._bump("batches")
+
+    @staticmethod
+    def _write_rows(cur, rows: List[Tuple[str, Any]]) -> None:
+        for kind, group in itertools.groupby(rows, key=lambda r: r[0]):
+            payloads = [p for _, p in group]
+            if kind == _WB_DEVICE:
+                for mac, cols in payloads:
+                    _upsert_device_row(cur, mac, cols)
+                continue
+            # Stub parent rows once per group for FK integrity.
+            stub_ts = payloads[0][_WB_TS_INDEX[kind]]
+            cur.executemany(
+                "INSERT OR IGNORE INTO devices(mac, first_seen, last_seen) VALUES (?, ?, ?)",
+                [(mac, stub_ts, stub_ts) for mac in {p[0] for p in payloads}],
+            )
+            sql = _ADV_INSERT_SQL if kind == _WB_ADV else _CHAR_HISTORY_INSERT_SQL
+            cur.executemany(sql, payloads)
+
+
+# Position of the timestamp column within each queued row tuple.
+_WB_TS_INDEX = {_WB_ADV: 1, _WB_CHAR_HISTORY: 3}
+
+_WRITE_BEHIND: _WriteBehindWriter | None = None
+
+
+def enable_write_behind(
+    batch_size: int = 256,
+    flush_interval_ms: int = 250,
+    max_queue: int = 10000,
+    block_timeout: float = 0.5,
+) -> None:
+    """Route hot-path writes through a batching background writer.
+
+    Args:
+        batch_size: Commit as soon as this many rows are pending.
+        flush_interval_ms: Commit at least this often while rows are pending.
+        max_queue: Queue capacity; producers block once it is full.
+        block_timeout: Seconds a producer waits on a full queue before the
+            row is dropped (``0`` drops immediately).
+
+    Calling this while write-behind is already active replaces the writer
+    after draining the old one.
+    """
+    global _WRITE_BEHIND
+    disable_write_behind()
+    _WRITE_BEHIND = _WriteBehindWriter(
+        batch_size=batch_size,
+        flush_interval_ms=flush_interval_ms,
+        max_queue=max_queue,
+        block_timeout=block_timeout,
+    )
+    print_and_log(
+        f"[*] Observation DB write-behind enabled (batch={batch_size}, "
+        f"interval={flush_interval_ms}ms, queue={max_queue})",
+        LOG__DEBUG,
+    )
+
+
+def disable_write_behind() -> None:
+    """Drain pending rows and return to synchronous per-call commits."""
+    global _WRITE_BEHIND
+    writer, _WRITE_BEHIND = _WRITE_BEHIND, None
+    if writer is not None:
+        writer.stop()
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Wait until all queued write-behind rows are committed.
+
+    Returns ``True`` immediately when write-behind is disabled, otherwise
+    ``True`` once the barrier is reached or ``False`` on *timeout*.
+    """
+    writer = _WRITE_BEHIND
+    if writer is None:
+        return True
+    return writer.flush(timeout)
+
+
+def get_write_behind_stats() -> Dict[str, Any]:
+    """Return queue/backpressure counters for the write-behind writer."""
+    writer = _WRITE_BEHIND
+    if writer is None:
+        return {"running": False}
+    return writer.stats()
+
+
+atexit.register(disable_write_behind)
+
+
 # ---------------------------------------------------------------------------
 # Public helper functions ----------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -631,130 +1100,284 @@ def upsert_device(mac: str, **cols):
     - 'classic': Device has Classic identifiers (device_class) but no LE identifiers
     - 'le': Device has LE identifiers (addr_type) but no Classic identifiers
     - 'dual': Device has conclusive evidence of both Classic and LE capabilities
+
+    When write-behind mode is enabled (see :func:`enable_write_behind`) the
+    upsert is queued and applied by the background writer.
     """
     mac = _normalize_mac(mac)
     if mac is None:
         print_and_log(f"upsert_device: rejected invalid MAC", LOG__DEBUG)
         return
-    now = datetime.utcnow().isoformat()
     
     # Always update last_seen timestamp
-    cols.setdefault("last_seen", now)
-    
-    # Check if device already exists and get current device info
+    cols.setdefault("last_seen", datetime.utcnow().isoformat())
+
+    if _WRITE_BEHIND is not None and _WRITE_BEHIND.submit(_WB_DEVICE, (mac, cols)):
+        return
+
     with _DB_LOCK, _db_cursor() as cur:
-        device_row = cur.execute(
-            """SELECT device_type, device_class, addr_type,
-                  (SELECT COUNT(*) FROM services WHERE mac=?) as gatt_services,
-                  (SELECT COUNT(*) FROM classic_services WHERE mac=?) as classic_services 
-               FROM devices WHERE mac=?""", 
-            (mac, mac, mac)
-        ).fetchone()
-        
-        device_exists = device_row is not None
-        
-        # If device doesn't exist, set first_seen timestamp
-        if not device_exists and "first_seen" not in cols:
-            cols["first_seen"] = now
-        
-        # Only determine device_type if not explicitly provided
-        if "device_type" not in cols:
-            # Extract current values from database
-            current_device_type = device_row["device_type"] if device_exists else "unknown"
-            current_device_class = device_row["device_class"] if device_exists else None
-            current_addr_type = device_row["addr_type"] if device_exists else None
-            has_gatt = device_row["gatt_services"] > 0 if device_exists else False
-            has_classic = device_row["classic_services"] > 0 if device_exists else False
-            
-            # Get updated values from current operation
-            new_device_class = cols.get("device_class", current_device_class)
-            new_addr_type = cols.get("addr_type", current_addr_type)
-            
-            # Apply enhanced classification logic
-            if new_device_class and new_addr_type:
-                # Strong evidence for dual-mode device (both Classic and LE identifiers)
-                cols["device_type"] = "dual"
-            elif has_gatt and has_classic:
-                # Device has both GATT and Classic services, must be dual
-                cols["device_type"] = "dual"
-            elif current_device_type == "dual":
-                # Preserve dual status if already established
-                cols["device_type"] = "dual"
-            elif new_device_class and not new_addr_type:
-                # Classic device (has class but no LE address type)
-                cols["device_type"] = "classic"
-            elif new_addr_type and not new_device_class:
-                # LE device (has address type but no Classic class)
-                cols["device_type"] = "le"
-            elif has_gatt and not has_classic:
-                # Has GATT services but no Classic services
-                cols["device_type"] = "le"
-            elif has_classic and not has_gatt:
-                # Has Classic services but no GATT services
-                cols["device_type"] = "classic"
-            elif current_device_type != "unknown":
-                # Preserve any previously established non-unknown type
-                cols["device_type"] = current_device_type
-            else:
-                # Not enough information to determine type
-                cols["device_type"] = "unknown"
-        
-        _DEVICE_COLS = frozenset({
-            "addr_type", "name", "appearance", "device_class",
-            "manufacturer_id", "manufacturer_data", "rssi_last", "rssi_min",
-            "rssi_max", "first_seen", "last_seen", "notes", "device_type",
-            "tx_power", "modalias", "icon", "service_data", "advertising_data",
-        })
-        cols = {k: v for k, v in cols.items() if k in _DEVICE_COLS}
-
-        # Prepare SQL statement
-        cols_keys = ",".join(cols.keys())
-        placeholders = ",".join("?" for _ in cols)
-        
-        # Build per-column SET expressions for the ON CONFLICT clause.
-        # - first_seen is never overwritten (preserve original observation time).
-        # - rssi_min/rssi_max use SQL MIN/MAX to track the observed range.
-        _RSSI_RANGE_COLS = {
-            "rssi_min": "MIN(COALESCE(devices.rssi_min, excluded.rssi_min), excluded.rssi_min)",
-            "rssi_max": "MAX(COALESCE(devices.rssi_max, excluded.rssi_max), excluded.rssi_max)",
-        }
-        update_parts = []
-        for k in cols.keys():
-            if k == "first_seen":
-                continue
-            if k in _RSSI_RANGE_COLS:
-                update_parts.append(f"{k}={_RSSI_RANGE_COLS[k]}")
-            else:
-                update_parts.append(f"{k}=excluded.{k}")
+        _upsert_device_row(cur, mac, cols)
+
+
+_DEVICE_COLS = frozenset({
+    "addr_type", "name", "appearance", "device_class",
+    "manufacturer_id", "manufacturer_data", "rssi_last", "rssi_min",
+    "rssi_max", "first_seen", "last_seen", "notes", "device_type",
+    "tx_power", "modalias", "icon", "service_data", "advertising_data",
+})
+
+# Per-column SET expressions for the ON CONFLICT clause.
+# - first_seen is never overwritten (preserve original observation time).
+# - rssi_min/rssi_max use SQL MIN/MAX to track the observed range.
+_RSSI_RANGE_COLS = {
+    "rssi_min": "MIN(COALESCE(devices.rssi_min, excluded.rssi_min), excluded.rssi_min)",
+    "rssi_max": "MAX(COALESCE(devices.rssi_max, excluded.rssi_max), excluded.rssi_max)",
+}
+
+
+def _classify_device_type(
+    cols: Dict[str, Any],
+    current: Optional[Dict[str, Any]],
+    *,
+    has_gatt: bool,
+    has_classic: bool,
+) -> str:
+    """Apply the heuristic device_type rules to an incoming upsert.
+
+    *current* is the stored ``devices`` row (or ``None`` for a new device);
+    *has_gatt*/*has_classic* say whether GATT or Classic service rows exist.
+    """
+    # Extract current values from database
+    current_device_type = current["device_type"] if current else "unknown"
+    current_device_class = current["device_class"] if current else None
+    current_addr_type = current["addr_type"] if current else None
+    
+    # Get updated values from current operation
+    new_device_class = cols.get("device_class", current_device_class)
+    new_addr_type = cols.get("addr_type", current_addr_type)
+    
+    # Apply enhanced classification logic
+    if new_device_class and new_addr_type:
+        # Strong evidence for dual-mode device (both Classic and LE identifiers)
+        return "dual"
+    elif has_gatt and has_classic:
+        # Device has both GATT and Classic services, must be dual
+        return "dual"
+    elif current_device_type == "dual":
+        # Preserve dual status if already established
+        return "dual"
+    elif new_device_class and not new_addr_type:
+        # Classic device (has class but no LE address type)
+        return "classic"
+    elif new_addr_type and not new_device_class:
+        # LE device (has address type but no Classic class)
+        return "le"
+    elif has_gatt and not has_classic:
+        # Has GATT services but no Classic services
+        return "le"
+    elif has_classic and not has_gatt:
+        # Has Classic services but no GATT services
+        return "classic"
+    elif current_device_type != "unknown":
+        # Preserve any previously established non-unknown type
+        return current_device_type
+    else:
+        # Not enough information to determine type
+        return "unknown"
+
+
+def _upsert_device_row(cur, mac: str, cols: Dict[str, Any]) -> None:
+    """Classify and upsert one device row using an open cursor.
+
+    *mac* must already be normalised and *cols* must carry ``last_seen``.
+    Shared by the synchronous :func:`upsert_device` path and the
+    write-behind writer so both apply identical classification rules.
+    """
+    cols = dict(cols)
+    # Check if device already exists and get current device info
+    device_row = cur.execute(
+        """SELECT device_type, device_class, addr_type,
+              (SELECT COUNT(*) FROM services WHERE mac=?) as gatt_services,
+              (SELECT COUNT(*) FROM classic_services WHERE mac=?) as classic_services 
+           FROM devices WHERE mac=?""", 
+        (mac, mac, mac)
+    ).fetchone()
+    
+    device_exists = device_row is not None
+    
+    # If device doesn't exist, set first_seen timestamp
+    if not device_exists and "first_seen" not in cols:
+        cols["first_seen"] = cols["last_seen"]
+    
+    # Only determine device_type if not explicitly provided
+    if "device_type" not in cols:
+        cols["device_type"] = _classify_device_type(
+            cols,
+            dict(device_row) if device_exists else None,
+            has_gatt=device_exists and device_row["gatt_services"] > 0,
+            has_classic=device_exists and device_row["classic_services"] > 0,
+        )
+    
+    cols = {k: v for k, v in cols.items() if k in _DEVICE_COLS}
 
-        if update_parts:
-            update_clause = f"ON CONFLICT(mac) DO UPDATE SET {','.join(update_parts)}"
+    # Prepare SQL statement
+    cols_keys = ",".join(cols.keys())
+    placeholders = ",".join("?" for _ in cols)
+    
+    update_parts = []
+    for k in cols.keys():
+        if k == "first_seen":
+            continue
+        if k in _RSSI_RANGE_COLS:
+            update_parts.append(f"{k}={_RSSI_RANGE_COLS[k]}")
         else:
-            update_clause = "ON CONFLICT(mac) DO NOTHING"
+            update_parts.append(f"{k}=excluded.{k}")
+
+    if update_parts:
+        update_clause = f"ON CONFLICT(mac) DO UPDATE SET {','.join(update_parts)}"
+    else:
+        update_clause = "ON CONFLICT(mac) DO NOTHING"
+    
+    # Execute upsert
+    cur.execute(
+        f"INSERT INTO devices(mac,{cols_keys}) VALUES (? ,{placeholders}) {update_clause}",
+        (mac, *cols.values()),
+    )
+
+
+# Ordered column list for upsert_devices_bulk(); every row binds all columns so
+# the whole batch runs through a single prepared statement.
+_BULK_DEVICE_COLS = tuple(sorted(_DEVICE_COLS))
+
+
+def _bulk_update_expr(col: str) -> str:
+    if col == "rssi_min":
+        return ("MIN(COALESCE(devices.rssi_min, excluded.rssi_min), "
+                "COALESCE(excluded.rssi_min, devices.rssi_min))")
+    if col == "rssi_max":
+        return ("MAX(COALESCE(devices.rssi_max, excluded.rssi_max), "
+                "COALESCE(excluded.rssi_max, devices.rssi_max))")
+    return f"COALESCE(excluded.{col}, devices.{col})"
+
+
+_BULK_DEVICE_SQL = (
+    f"INSERT INTO devices(mac,{','.join(_BULK_DEVICE_COLS)}) "
+    f"VALUES ({','.join('?' for _ in range(len(_BULK_DEVICE_COLS) + 1))}) "
+    "ON CONFLICT(mac) DO UPDATE SET "
+    + ",".join(f"{c}={_bulk_update_expr(c)}" for c in _BULK_DEVICE_COLS if c != "first_seen")
+)
+
+
+def upsert_devices_bulk(
+    entries: List[Dict[str, Any]],
+    evidence: Optional[List[Dict[str, Any]]] = None,
+) -> int:
+    """
+    Upsert many device records in a single transaction.
+    
+    Intended for scan ingestion: callers classify first and pass the
+    ``device_type`` in each entry.  Entries without a ``device_type`` are
+    classified with the same rules as :func:`upsert_device`, using one
+    lookup of the existing rows and one grouped service-presence query for
+    the whole batch instead of per-device subqueries.
+    
+    Unlike :func:`upsert_device`, a column that is missing or ``None`` in an
+    entry leaves the stored value untouched, so every row can share one
+    prepared statement.  The write is synchronous; pending write-behind
+    rows are flushed first so commits stay in submission order.
+    
+    Args:
+        entries: Dicts with a ``mac`` key plus any ``devices`` columns.
+        evidence: Optional classification evidence, each a dict of
+            :func:`store_device_type_evidence` keyword arguments, written
+            in the same transaction.
         
-        # Execute upsert
-        cur.execute(
-            f"INSERT INTO devices(mac,{cols_keys}) VALUES (? ,{placeholders}) {update_clause}",
-            (mac, *cols.values()),
-        )
+    Returns:
+        Number of rows written (invalid MACs are skipped).
+    """
+    now = datetime.utcnow().isoformat()
+    evidence_rows = []
+    for ev in evidence or ():
+        row = _evidence_row(now=now, **ev)
+        if row is not None:
+            evidence_rows.append(row)
+    merged: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        mac = _normalize_mac(entry.get("mac"))
+        if mac is None:
+            continue
+        cols = {k: v for k, v in entry.items() if k in _DEVICE_COLS}
+        cols.setdefault("last_seen", now)
+        # Later entries for the same MAC win, like successive upsert_device calls.
+        merged.setdefault(mac, {}).update(cols)
+    if not merged and not evidence_rows:
+        return 0
+
+    # Commit rows queued by upsert_device() first; applied after this batch
+    # they would overwrite it with older values.
+    writer = _WRITE_BEHIND
+    if writer is not None:
+        writer.flush()
+
+    macs = list(merged)
+    with _DB_LOCK, _db_cursor() as cur:
+        current: Dict[str, Dict[str, Any]] = {}
+        gatt: set = set()
+        classic: set = set()
+        # SQLite limits bound parameters per statement; chunk the IN lists.
+        for i in range(0, len(macs), 500):
+            chunk = macs[i:i + 500]
+            ph = ",".join("?" for _ in chunk)
+            for row in cur.execute(
+                f"SELECT mac, device_type, device_class, addr_type FROM devices WHERE mac IN ({ph})",
+                chunk,
+            ):
+                current[row["mac"]] = dict(row)
+            if any("device_type" not in merged[m] for m in chunk):
+                for row in cur.execute(
+                    f"""
+                    SELECT mac, 'gatt' AS kind FROM services WHERE mac IN ({ph}) GROUP BY mac
+                    UNION ALL
+                    SELECT mac, 'classic' AS kind FROM classic_services WHERE mac IN ({ph}) GROUP BY mac
+                    """,
+                    (*chunk, *chunk),
+                ):
+                    (gatt if row["kind"] == "gatt" else classic).add(row["mac"])
+
+        params = []
+        for mac, cols in merged.items():
+            existing = current.get(mac)
+            if existing is None and "first_seen" not in cols:
+                cols["first_seen"] = cols["last_seen"]
+            if "device_type" not in cols:
+                cols["device_type"] = _classify_device_type(
+                    cols, existing, has_gatt=mac in gatt, has_classic=mac in classic
+                )
+            params.append((mac, *(cols.get(c) for c in _BULK_DEVICE_COLS)))
+        if params:
+            cur.executemany(_BULK_DEVICE_SQL, params)
+        if evidence_rows:
+            for mac in {row[0] for row in evidence_rows} - set(merged):
+                _ensure_device_exists(cur, mac)
+            cur.executemany(_EVIDENCE_INSERT_SQL, evidence_rows)
+    for mac in {row[0] for row in evidence_rows}:
+        _invalidate_signature(mac)
+    return len(params)
+
+
+_ADV_INSERT_SQL = "INSERT INTO adv_reports(mac,ts,rssi,data,decoded) VALUES (?,?,?,?,?)"
 
 
 def insert_adv(mac: str, rssi: int, data: bytes, decoded: Dict[str, Any]):
     mac = _normalize_mac(mac)
     if mac is None:
         return
+    row = (mac, datetime.utcnow().isoformat(), rssi, data, json_dumps(decoded))
+    if _WRITE_BEHIND is not None and _WRITE_BEHIND.submit(_WB_ADV, row):
+        return
     with _DB_LOCK, _db_cursor() as cur:
         _ensure_device_exists(cur, mac)
-        cur.execute(
-            "INSERT INTO adv_reports(mac,ts,rssi,data,decoded) VALUES (?,?,?,?,?)",
-            (
-                mac,
-                datetime.utcnow().isoformat(),
-                rssi,
-                data,
-                json_dumps(decoded),
-            ),
-        )
+        cur.execute(_ADV_INSERT_SQL, row)
 
 
 def upsert_services(mac: str, svc_list: List[Dict[str, Any]]) -> Dict[str, int]:
@@ -891,7 +1514,7 @@ def upsert_characteristics(
 def get_characteristic_id(service_id: int, char_uuid: str) -> int | None:
     """Return the DB row id for a characteristic, or None if not found."""
     norm_uuid = _normalize_uuid(char_uuid)
-    with _DB_LOCK, _db_cursor() as cur:
+    with _read_cursor() as cur:
         row = cur.execute(
             "SELECT id FROM characteristics WHERE service_id=? AND uuid=?",
             (service_id, norm_uuid),
@@ -1036,6 +1659,11 @@ def upsert_classic_services(mac: str, services: List[Dict[str, Any]]):
         _DB_CONN.commit()
 
 
+_CHAR_HISTORY_INSERT_SQL = (
+    "INSERT INTO char_history(mac,service_uuid,char_uuid,ts,value,source) VALUES (?,?,?,?,?,?)"
+)
+
+
 def insert_char_history(mac: str, service_uuid: str, char_uuid: str, value: bytes, source: str = "unknown"):
     """
     Insert a characteristic value into the history table.
@@ -1050,26 +1678,22 @@ def insert_char_history(mac: str, service_uuid: str, char_uuid: str, value: byte
     mac = _normalize_mac(mac)
     if mac is None:
         return
-    service_uuid = _normalize_uuid(service_uuid)
-    char_uuid = _normalize_uuid(char_uuid)
-    
+    row = (
+        mac,
+        _normalize_uuid(service_uuid),
+        _normalize_uuid(char_uuid),
+        datetime.utcnow().isoformat(),
+        value,
+        source,
+    )
+    if _WRITE_BEHIND is not None and _WRITE_BEHIND.submit(_WB_CHAR_HISTORY, row):
+        return
+
+    # _db_cursor() commits on exit, so the row is visible to external readers
+    # as soon as the context closes.
     with _DB_LOCK, _db_cursor() as cur:
         _ensure_device_exists(cur, mac)
-        cur.execute(
-            "INSERT INTO char_history(mac,service_uuid,char_uuid,ts,value,source) VALUES (?,?,?,?,?,?)",
-            (
-                mac,
-                service_uuid,
-                char_uuid,
-                datetime.utcnow().isoformat(),
-                value,
-                source,
-            ),
-        )
-    
-    # Commit the transaction to persist the changes
-    if _DB_CONN is not None:
-        _DB_CONN.commit()
+        cur.execute(_CHAR_HISTORY_INSERT_SQL, row)
 
 
 def upsert_sdp_record(mac: str, record: Dict[str, Any]):
@@ -1194,6 +1818,59 @@ def upsert_pbap_metadata(mac: str, repo: str, entries: int, vcf_hash: str):
         )
 
 
+def get_map_manifest(mac: str, instance: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Return the stored MAP message manifest rows for *mac*.
+
+    *instance* is the MAS RFCOMM channel (``None`` = default instance, stored
+    as 0).  Each row has ``folder``, ``handle``, ``size``, ``datetime``,
+    ``hash``, ``path`` and ``ts``.
+    """
+    mac = _normalize_mac(mac)
+    if mac is None:
+        return []
+    with _read_cursor() as cur:
+        rows = cur.execute(
+            "SELECT folder, handle, size, datetime, hash, path, ts FROM map_messages "
+            "WHERE mac=? AND instance=?",
+            (mac, instance or 0),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def upsert_map_manifest(
+    mac: str,
+    entries: List[Dict[str, Any]],
+    instance: Optional[int] = None,
+) -> int:
+    """Record downloaded MAP messages (one transaction for all *entries*).
+
+    Each entry needs ``folder`` and ``handle``; ``size``, ``datetime``,
+    ``hash`` and ``path`` are optional.  Returns the number of rows written.
+    """
+    mac = _normalize_mac(mac)
+    if mac is None or not entries:
+        return 0
+    now = datetime.utcnow().isoformat()
+    rows = [
+        (mac, instance or 0, e["folder"], str(e["handle"]), e.get("size"),
+         e.get("datetime"), e.get("hash"), e.get("path"), now)
+        for e in entries
+    ]
+    with _DB_LOCK, _db_cursor() as cur:
+        _ensure_device_exists(cur, mac)
+        cur.executemany(
+            """
+            INSERT INTO map_messages(mac,instance,folder,handle,size,datetime,hash,path,ts)
+            VALUES (?,?,?,?,?,?,?,?,?)
+            ON CONFLICT(mac,instance,folder,handle) DO UPDATE SET
+                size=excluded.size, datetime=excluded.datetime, hash=excluded.hash,
+                path=excluded.path, ts=excluded.ts
+            """,
+            rows,
+        )
+    return len(rows)
+
+
 # ---------------------------------------------------------------------------
 # Helpers -------------------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -1207,25 +1884,23 @@ def json_dumps(obj: Any) -> str:
     except Exception:
         return "{}"
 
-def store_signal_capture(signal_data: dict) -> None:
-    """Store signal data in the observation database.
+def _signal_capture_fields(signal_data: dict) -> Optional[Tuple[str, str, str, bytes, str]]:
+    """Map captured signal data to ``insert_char_history`` arguments.
     
-    This function takes signal data from the signal routing system and stores it
-    in the appropriate database tables. For characteristic read/write/notify events,
-    it stores the value in the char_history table.
-    
-    Args:
-        signal_data: Dictionary containing signal information
+    Returns:
+        ``(mac, service_uuid, char_uuid, value, source)``, or ``None`` when
+        the signal cannot be stored (no value, undeterminable MAC, ...).
     """
     signal_type = signal_data.get('signal_type', '')
     path = signal_data.get('path', '')
     value = signal_data.get('value')
     
-    print_and_log(f"store_signal_capture: type={signal_type}, path={path}, value_type={type(value).__name__}", LOG__DEBUG)
+    print_and_log("store_signal_capture: type=%s, path=%s, value_type=%s", LOG__DEBUG,
+                  signal_type, path, type(value).__name__)
     
     if value is None:
         print_and_log("store_signal_capture: skipping — value is None", LOG__DEBUG)
-        return
+        return None
     
     # Handle hardcoded test case for specific characteristic in CTF module
     if 'char003d' in str(path) or 'char003d' in str(signal_data):
@@ -1244,17 +1919,10 @@ def store_signal_capture(signal_data: dict) -> None:
                 else:
                     value = str(value).encode('utf-8')
             except Exception as e:
-                print_and_log(f"store_signal_capture: failed to convert value to bytes: {e}", LOG__DEBUG)
-                return
+                print_and_log("store_signal_capture: failed to convert value to bytes: %s", LOG__DEBUG, e)
+                return None
         
-        try:
-            insert_char_history(mac, service_uuid, char_uuid, value, source)
-            print_and_log("store_signal_capture: inserted char003d value", LOG__DEBUG)
-            if _DB_CONN is not None:
-                _DB_CONN.commit()
-            return
-        except Exception as e:
-            print_and_log(f"store_signal_capture: error inserting char003d: {e}", LOG__DEBUG)
+        return mac, service_uuid, char_uuid, value, source
     
     # Convert value to bytes if needed
     if not isinstance(value, bytes):
@@ -1266,11 +1934,11 @@ def store_signal_capture(signal_data: dict) -> None:
             elif isinstance(value, (list, tuple)) and all(isinstance(x, int) for x in value):
                 value = bytes(value)
             else:
-                print_and_log(f"store_signal_capture: cannot convert {type(value).__name__} to bytes", LOG__DEBUG)
-                return
+                print_and_log("store_signal_capture: cannot convert %s to bytes", LOG__DEBUG, type(value).__name__)
+                return None
         except Exception as e:
-            print_and_log(f"store_signal_capture: exception converting to bytes: {e}", LOG__DEBUG)
-            return
+            print_and_log("store_signal_capture: exception converting to bytes: %s", LOG__DEBUG, e)
+            return None
     
     # Extract device MAC from path or explicit field
     mac = signal_data.get('device_mac')
@@ -1295,12 +1963,12 @@ def store_signal_capture(signal_data: dict) -> None:
     
     if not mac:
         print_and_log("store_signal_capture: skipping — could not determine device MAC", LOG__DEBUG)
-        return
+        return None
     
     mac = _normalize_mac(mac)
     if mac is None:
         print_and_log("store_signal_capture: skipping — invalid MAC format", LOG__DEBUG)
-        return
+        return None
     
     # Get service and characteristic UUIDs
     service_uuid = signal_data.get('service_uuid')
@@ -1345,7 +2013,8 @@ def store_signal_capture(signal_data: dict) -> None:
     elif signal_type == "NOTIFICATION" or signal_type == "notification":
         source = "notification"
     
-    print_and_log(f"store_signal_capture: mac={mac}, svc={service_uuid}, char={char_uuid}, src={source}", LOG__DEBUG)
+    print_and_log("store_signal_capture: mac=%s, svc=%s, char=%s, src=%s", LOG__DEBUG,
+                  mac, service_uuid, char_uuid, source)
     
     # If we still don't have service or characteristic UUIDs, use placeholders
     if not service_uuid:
@@ -1353,13 +2022,86 @@ def store_signal_capture(signal_data: dict) -> None:
     if not char_uuid:
         char_uuid = "unknown-characteristic"
     
+    return mac, service_uuid, char_uuid, value, source
+
+
+def store_signal_capture(signal_data: dict) -> None:
+    """Store signal data in the observation database.
+    
+    This function takes signal data from the signal routing system and stores it
+    in the appropriate database tables. For characteristic read/write/notify events,
+    it stores the value in the char_history table.
+    
+    Args:
+        signal_data: Dictionary containing signal information
+    """
+    fields = _signal_capture_fields(signal_data)
+    if fields is None:
+        return
     try:
-        insert_char_history(mac, service_uuid, char_uuid, value, source)
+        insert_char_history(*fields)
         print_and_log("store_signal_capture: inserted into database", LOG__DEBUG)
-        if _DB_CONN is not None:
-            _DB_CONN.commit()
     except Exception as e:
-        print_and_log(f"store_signal_capture: error inserting: {e}", LOG__DEBUG)
+        print_and_log("store_signal_capture: error inserting: %s", LOG__DEBUG, e)
+
+
+def _capture_ts(value: Any, default: str) -> str:
+    """Return a capture's receipt time as a naive UTC ISO string.
+    
+    Accepts the router's local-time ISO strings, aware ISO strings and
+    epoch seconds; anything else falls back to *default*.
+    """
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.utcfromtimestamp(value).isoformat()
+        if isinstance(value, str) and value:
+            ts = datetime.fromisoformat(value)
+            # Naive values are local time; astimezone() interprets them so.
+            return ts.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+    except (ValueError, OverflowError, OSError):
+        pass
+    return default
+
+
+def store_signal_captures(signals: List[dict]) -> int:
+    """Store many captured signals in a single transaction.
+    
+    Bulk counterpart of :func:`store_signal_capture` for batched DB_STORE
+    actions: rows are mapped the same way, then written with one
+    ``executemany`` under a single lock acquisition and commit.  Each row
+    keeps its capture's ``timestamp`` (receipt time) when one is present.
+    
+    Args:
+        signals: Signal data dicts in arrival order
+        
+    Returns:
+        Number of char_history rows written.
+    """
+    now = datetime.utcnow().isoformat()
+    rows = []
+    for signal_data in signals:
+        fields = _signal_capture_fields(signal_data)
+        if fields is None:
+            continue
+        mac, service_uuid, char_uuid, value, source = fields
+        mac = _normalize_mac(mac)
+        if mac is None:
+            continue
+        ts = _capture_ts(signal_data.get('timestamp'), now)
+        rows.append((mac, _normalize_uuid(service_uuid), _normalize_uuid(char_uuid),
+                     ts, value, source))
+    if not rows:
+        return 0
+    
+    with _DB_LOCK, _db_cursor() as cur:
+        cur.executemany(
+            "INSERT OR IGNORE INTO devices(mac, first_seen, last_seen) VALUES (?, ?, ?)",
+            [(mac, now, now) for mac in {r[0] for r in rows}],
+        )
+        cur.executemany(_CHAR_HISTORY_INSERT_SQL, rows)
+    print_and_log("store_signal_captures: inserted %d rows", LOG__DEBUG, len(rows))
+    return len(rows)
+
 
 # ---------------------------------------------------------------------------
 # Database Maintenance and Performance Functions ---------------------------
@@ -1414,7 +2156,8 @@ def maintain_database(vacuum: bool = True, analyze: bool = True) -> Dict[str, An
             for table in ["devices", "services", "characteristics", "descriptors",
                          "char_history", "adv_reports", "classic_services",
                          "media_players", "media_transports", "aoi_analysis",
-                         "sdp_records", "device_type_evidence", "pbap_metadata"]:
+                         "sdp_records", "device_type_evidence", "pbap_metadata",
+                         "map_messages"]:
                 try:
                     cur.execute(f"SELECT COUNT(*) FROM {table}")
                     counts[table] = cur.fetchone()[0]
@@ -1463,7 +2206,7 @@ def explain_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         raise ValueError("explain_query only accepts a single SELECT statement")
 
     try:
-        with _DB_LOCK, _db_cursor() as cur:
+        with _read_cursor() as cur:
             cur.execute(f"EXPLAIN QUERY PLAN {stripped}", params)
             plan = cur.fetchall()
             
@@ -1559,7 +2302,7 @@ def get_aoi_analysis(mac: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        with _db_cursor() as cur:
+        with _read_cursor() as cur:
             row = cur.execute(
                 "SELECT * FROM aoi_analysis WHERE mac = ?",
                 (mac,)
@@ -1605,7 +2348,7 @@ def has_aoi_analysis(mac: str) -> bool:
     if mac is None:
         return False
     
-    with _db_cursor() as cur:
+    with _read_cursor() as cur:
         row = cur.execute(
             "SELECT 1 FROM aoi_analysis WHERE mac = ?",
             (mac,)
@@ -1621,7 +2364,7 @@ def get_aoi_analyzed_devices() -> List[Dict[str, Any]]:
         List of device dictionaries
     """
     try:
-        with _db_cursor() as cur:
+        with _read_cursor() as cur:
             rows = cur.execute("""
                 SELECT d.*, a.analysis_timestamp
                 FROM devices d
@@ -1661,10 +2404,37 @@ def store_device_type_evidence(
         value: Evidence value (will be converted to string/JSON)
         metadata: Optional metadata dictionary (will be stored as JSON)
     """
+    row = _evidence_row(mac, evidence_type, evidence_weight, source, value, metadata)
+    if row is None:
+        return
+    
+    with _DB_LOCK, _db_cursor() as cur:
+        _ensure_device_exists(cur, row[0])
+        cur.execute(_EVIDENCE_INSERT_SQL, row)
+    # Drop the cached signature only after the new evidence is committed.
+    _invalidate_signature(row[0])
+
+
+_EVIDENCE_INSERT_SQL = """
+    INSERT OR REPLACE INTO device_type_evidence 
+    (mac, evidence_type, evidence_weight, source, value, metadata, ts)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _evidence_row(
+    mac: str,
+    evidence_type: str,
+    evidence_weight: str,
+    source: str,
+    value: Any = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    now: Optional[str] = None,
+) -> Optional[tuple]:
+    """Build the ``device_type_evidence`` parameter tuple (None for a bad MAC)."""
     mac = _normalize_mac(mac)
     if mac is None:
-        return
-    now = datetime.utcnow().isoformat()
+        return None
     
     # Convert value to string representation
     if value is not None:
@@ -1677,14 +2447,8 @@ def store_device_type_evidence(
     
     # Convert metadata to JSON string
     metadata_str = json_dumps(metadata) if metadata else None
-    
-    with _DB_LOCK, _db_cursor() as cur:
-        _ensure_device_exists(cur, mac)
-        cur.execute("""
-            INSERT OR REPLACE INTO device_type_evidence 
-            (mac, evidence_type, evidence_weight, source, value, metadata, ts)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (mac, evidence_type, evidence_weight, source, value_str, metadata_str, now))
+    return (mac, evidence_type, evidence_weight, source, value_str, metadata_str,
+            now or datetime.utcnow().isoformat())
 
 
 def get_device_type_evidence(mac: str) -> List[Dict[str, Any]]:
@@ -1705,7 +2469,7 @@ def get_device_type_evidence(mac: str) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with _DB_LOCK, _db_cursor() as cur:
+        with _read_cursor() as cur:
             cur.execute("""
                 SELECT * FROM device_type_evidence
                 WHERE mac = ?
@@ -1733,6 +2497,99 @@ def get_device_type_evidence(mac: str) -> List[Dict[str, Any]]:
         return []
 
 
+# Evidence types that contribute to the classifier cache signature.
+_SIGNATURE_EVIDENCE_TYPES = (
+    "classic_device_class",
+    "le_address_type_random",
+    "le_address_type_public",
+    "classic_service_uuids",
+    "le_service_uuids",
+)
+
+# In-process LRU of evidence signatures keyed by normalised MAC.  Entries are
+# dropped whenever new evidence for the MAC is committed.  Invalidation also
+# bumps the MAC's generation; a reader that missed the cache only stores its
+# result if the generation it saw before reading is unchanged, so a read that
+# raced with a write can never cache the older signature.
+_SIGNATURE_CACHE_MAX = 4096
+_SIGNATURE_CACHE: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+_SIGNATURE_GENERATION: Dict[str, int] = {}
+_SIGNATURE_CACHE_LOCK = threading.Lock()
+_SIGNATURE_MISS = object()
+
+
+def _cached_signature(mac: str) -> Tuple[Any, int]:
+    """Return ``(signature or _SIGNATURE_MISS, generation)`` for *mac*."""
+    with _SIGNATURE_CACHE_LOCK:
+        sig = _SIGNATURE_CACHE.get(mac, _SIGNATURE_MISS)
+        if sig is not _SIGNATURE_MISS:
+            _SIGNATURE_CACHE.move_to_end(mac)
+        return sig, _SIGNATURE_GENERATION.get(mac, 0)
+
+
+def _remember_signature(mac: str, sig: Optional[Dict[str, Any]], generation: int) -> None:
+    with _SIGNATURE_CACHE_LOCK:
+        if _SIGNATURE_GENERATION.get(mac, 0) != generation:
+            return  # evidence changed while this signature was being read
+        _SIGNATURE_CACHE[mac] = sig
+        _SIGNATURE_CACHE.move_to_end(mac)
+        while len(_SIGNATURE_CACHE) > _SIGNATURE_CACHE_MAX:
+            _SIGNATURE_CACHE.popitem(last=False)
+
+
+def _invalidate_signature(mac: str) -> None:
+    with _SIGNATURE_CACHE_LOCK:
+        _SIGNATURE_CACHE.pop(mac, None)
+        _SIGNATURE_GENERATION[mac] = _SIGNATURE_GENERATION.get(mac, 0) + 1
+
+
+def _signature_from_evidence(rows) -> Optional[Dict[str, Any]]:
+    """Build a classifier signature from evidence rows (newest first).
+
+    Each row needs ``evidence_type``, ``value`` and ``metadata`` keys;
+    ``metadata`` may still be a JSON string.
+    """
+    signature = {
+        'device_class': None,
+        'address_type': None,
+        'has_classic_uuids': False,
+        'has_le_uuids': False,
+        'uuid_hash': None,
+    }
+    
+    # Extract signature components from evidence
+    for evidence in rows:
+        ev_type = evidence['evidence_type'] or ''
+        ev_value = evidence['value'] or ''
+        ev_metadata = evidence['metadata'] or {}
+        if isinstance(ev_metadata, str):
+            try:
+                ev_metadata = json.loads(ev_metadata)
+            except (json.JSONDecodeError, TypeError):
+                ev_metadata = {}
+        
+        if ev_type == 'classic_device_class' and ev_value:
+            try:
+                signature['device_class'] = int(ev_value)
+            except (ValueError, TypeError):
+                pass
+        
+        if ev_type in ['le_address_type_random', 'le_address_type_public']:
+            signature['address_type'] = 'random' if 'random' in ev_type else 'public'
+        
+        if ev_type == 'classic_service_uuids' and ev_metadata:
+            signature['has_classic_uuids'] = ev_metadata.get('uuid_count', 0) > 0
+        
+        if ev_type == 'le_service_uuids' and ev_metadata:
+            signature['has_le_uuids'] = ev_metadata.get('uuid_count', 0) > 0
+    
+    # Check if signature has meaningful data
+    if any(v is not None and v is not False for v in signature.values()):
+        return signature
+    
+    return None
+
+
 def get_device_evidence_signature(mac: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve the most recent evidence signature for a device.
@@ -1754,50 +2611,85 @@ def get_device_evidence_signature(mac: str) -> Optional[Dict[str, Any]]:
     if mac is None:
         return None
     
+    sig, generation = _cached_signature(mac)
+    if sig is not _SIGNATURE_MISS:
+        return dict(sig) if sig else None
+    
     try:
         evidence_list = get_device_type_evidence(mac)
-        if not evidence_list:
-            return None
-        
-        # Build signature from evidence
-        signature = {
-            'device_class': None,
-            'address_type': None,
-            'has_classic_uuids': False,
-            'has_le_uuids': False,
-            'uuid_hash': None,
-        }
-        
-        # Extract signature components from evidence
-        for evidence in evidence_list:
-            ev_type = evidence.get('evidence_type', '')
-            ev_value = evidence.get('value', '')
-            ev_metadata = evidence.get('metadata', {})
-            
-            if ev_type == 'classic_device_class' and ev_value:
-                try:
-                    signature['device_class'] = int(ev_value)
-                except (ValueError, TypeError):
-                    pass
-            
-            if ev_type in ['le_address_type_random', 'le_address_type_public']:
-                signature['address_type'] = 'random' if 'random' in ev_type else 'public'
-            
-            if ev_type == 'classic_service_uuids' and ev_metadata:
-                signature['has_classic_uuids'] = ev_metadata.get('uuid_count', 0) > 0
-            
-            if ev_type == 'le_service_uuids' and ev_metadata:
-                signature['has_le_uuids'] = ev_metadata.get('uuid_count', 0) > 0
-        
-        # Check if signature has meaningful data
-        if any(v is not None and v is not False for v in signature.values()):
-            return signature
+        sig = _signature_from_evidence(evidence_list) if evidence_list else None
+        _remember_signature(mac, sig, generation)
+        return dict(sig) if sig else None
         
+    except Exception as e:
+        print_and_log(
+            f"Error retrieving evidence signature for {mac}: {e}",
+            LOG__DEBUG
+        )
         return None
+
+
+def get_device_type_and_signature(mac: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the stored classification inputs for *mac* in one indexed query.
+    
+    This is the narrow lookup used by ``DeviceTypeClassifier`` cache checks;
+    unlike :func:`get_device_detail` it never touches the GATT, SDP, PBAP or
+    media tables.  Evidence signatures are served from an in-process LRU
+    when available, in which case only the ``devices`` primary-key row is read.
+    
+    Args:
+        mac: Device MAC address
         
+    Returns:
+        ``{"device_type", "device_class", "addr_type", "signature"}`` or
+        ``None`` if the device is not in the database.  ``signature`` is
+        ``None`` when no classification evidence has been stored.
+    """
+    mac = _normalize_mac(mac)
+    if mac is None:
+        return None
+    
+    try:
+        cached, generation = _cached_signature(mac)
+        with _read_cursor() as cur:
+            if cached is not _SIGNATURE_MISS:
+                row = cur.execute(
+                    "SELECT device_type, device_class, addr_type FROM devices WHERE mac = ?",
+                    (mac,),
+                ).fetchone()
+                if row is None:
+                    return None
+                sig = cached
+            else:
+                placeholders = ",".join("?" for _ in _SIGNATURE_EVIDENCE_TYPES)
+                rows = cur.execute(
+                    f"""
+                    SELECT d.device_type, d.device_class, d.addr_type,
+                           e.evidence_type, e.value, e.metadata
+                    FROM devices d
+                    LEFT JOIN device_type_evidence e
+                      ON e.mac = d.mac AND e.evidence_type IN ({placeholders})
+                    WHERE d.mac = ?
+                    ORDER BY e.ts DESC
+                    """,
+                    (*_SIGNATURE_EVIDENCE_TYPES, mac),
+                ).fetchall()
+                if not rows:
+                    return None
+                row = rows[0]
+                evidence = [r for r in rows if r["evidence_type"] is not None]
+                sig = _signature_from_evidence(evidence) if evidence else None
+                _remember_signature(mac, sig, generation)
+        return {
+            "device_type": row["device_type"],
+            "device_class": row["device_class"],
+            "addr_type": row["addr_type"],
+            "signature": dict(sig) if sig else None,
+        }
     except Exception as e:
         print_and_log(
-            f"Error retrieving evidence signature for {mac}: {e}",
+            f"Error retrieving device type for {mac}: {e}",
             LOG__DEBUG
         )
         return None
@@ -1865,7 +2757,7 @@ def get_devices(status: str = None, limit: int = 100, offset: int = 0) -> List[D
         params.append(offset)
         
         # Execute the query
-        with _DB_LOCK, _db_cursor() as cur:
+        with _read_cursor() as cur:
             cur.execute(query, params)
             result = [dict(row) for row in cur.fetchall()]
             
@@ -1905,7 +2797,7 @@ def get_device_detail(mac: str) -> Dict[str, Any]:
     if mac is None:
         return result
     
-    with _DB_LOCK, _db_cursor() as cur:
+    with _read_cursor() as cur:
         # Get device info
         cur.execute("SELECT * FROM devices WHERE mac=?", (mac,))
         device = cur.fetchone()
@@ -2005,7 +2897,7 @@ def get_characteristic_timeline(mac: str, service_uuid: str = None, char_uuid: s
     query += " ORDER BY ts DESC LIMIT ?"
     params.append(limit)
     
-    with _DB_LOCK, _db_cursor() as cur:
+    with _read_cursor() as cur:
         cur.execute(query, params)
         return [dict(row) for row in cur.fetchall()]
 
@@ -2047,7 +2939,7 @@ def export_device_data(mac: str) -> Dict[str, Any]:
     device_detail = get_device_detail(mac)
     
     # Get characteristic history
-    with _DB_LOCK, _db_cursor() as cur:
+    with _read_cursor() as cur:
         cur.execute(
             "SELECT * FROM char_history WHERE mac=? ORDER BY ts DESC LIMIT 500", 
             (mac,)
@@ -2063,3 +2955,7 @@ def export_device_data(mac: str) -> Dict[str, Any]:
     
     # Convert binary data to hex strings for JSON serialization
     return _convert_binary_for_json(device_detail)
+
+
+if os.getenv("BLEEP_DB_WRITE_BEHIND", "0").lower() in {"1", "true", "yes"}:
+    enable_write_behind()
@@ -5,6 +5,7 @@ Sub-modules:
 
 - ``connection_pool`` – D-Bus connection pooling.
 - ``timeout_manager`` – Timeout enforcement for D-Bus calls.
+- ``object_mirror`` – Signal-maintained mirror of BlueZ's object tree.
 """
 
 # Avoid circular-import explosions by **lazy-loading** sub-modules on first
@@ -15,7 +16,7 @@ from importlib import import_module as _import_module
 from types import ModuleType as _ModuleType
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
-__all__ = ["connection_pool", "timeout_manager"]
+__all__ = ["connection_pool", "timeout_manager", "object_mirror"]
 
 
 def __getattr__(name: str) -> _ModuleType:  # pragma: no cover – import meta-hook
@@ -31,3 +32,4 @@ def __getattr__(name: str) -> _ModuleType:  # pragma: no cover – import meta-h
 if _TYPE_CHECKING:  # pragma: no cover – mypy/pylance only
     from . import connection_pool  # noqa: F401
     from . import timeout_manager  # noqa: F401
+    from . import object_mirror  # noqa: F401
@@ -7,8 +7,10 @@ performance and reliability for high-volume operations.
 Based on best practices from BlueZ documentation and example scripts.
 """
 
+import os
 import time
 import threading
+from collections import OrderedDict
 from enum import Enum
 from typing import Dict, List, Set, Optional, Any, Union, Callable
 
@@ -17,6 +19,7 @@ import dbus.exceptions
 import dbus.mainloop.glib
 from gi.repository import GLib
 
+from bleep.bt_ref.constants import DBUS_OM_IFACE
 from bleep.core.log import print_and_log, LOG__DEBUG, LOG__GENERAL
 from bleep.core.metrics import record_operation
 
@@ -121,7 +124,8 @@ class DBusConnectionPool:
         max_session_connections: int = 2,
         max_idle_time: float = 300.0,
         max_connection_age: float = 3600.0,
-        health_check_interval: float = 60.0
+        health_check_interval: float = 60.0,
+        max_cached_proxies: Optional[int] = None
     ):
         """
         Initialize the connection pool.
@@ -142,6 +146,9 @@ class DBusConnectionPool:
             Maximum age in seconds for a connection
         health_check_interval : float
             Interval in seconds between health checks
+        max_cached_proxies : Optional[int]
+            Size cap of the LRU proxy cache (default
+            ``BLEEP_DBUS_PROXY_CACHE_MAX`` or 1024)
         """
         self._min_connections = {
             'system': min_system_connections,
@@ -161,7 +168,24 @@ class DBusConnectionPool:
         }
         self._last_health_check = 0.0
         self._maintenance_lock = threading.RLock()
-        self._proxy_cache = {}
+        if max_cached_proxies is None:
+            try:
+                max_cached_proxies = int(os.getenv("BLEEP_DBUS_PROXY_CACHE_MAX", "1024"))
+            except ValueError:
+                max_cached_proxies = 1024
+        self._max_cached_proxies = max(1, max_cached_proxies)
+        # LRU order: least recently used first
+        self._proxy_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._proxy_lock = threading.RLock()
+        self._proxy_stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expired": 0,
+            "invalidations": 0,
+        }
+        self._removal_watch = None
+        self._watch_bus: Optional[dbus.Bus] = None
         
         # Initialize the pool with minimum connections
         self._initialize_pool()
@@ -260,7 +284,13 @@ class DBusConnectionPool:
                     "closed": sum(1 for c in self._connections['session'] if c.is_closed()),
                 },
             }
-            return stats
+        with self._proxy_lock:
+            stats["proxy_cache"] = dict(
+                self._proxy_stats,
+                size=len(self._proxy_cache),
+                max_size=self._max_cached_proxies,
+            )
+        return stats
     
     def _check_connection_health(self, conn: PooledConnection) -> bool:
         """
@@ -488,29 +518,98 @@ class DBusConnectionPool:
         cache_key = (bus_type, service_name, object_path, interface_name)
         
         # Check if we have a cached proxy
-        if cache_key in self._proxy_cache:
-            proxy_info = self._proxy_cache[cache_key]
-            
-            # Check if proxy is still valid
-            if time.time() - proxy_info['created'] < self._max_connection_age:
-                return proxy_info['proxy']
-            
-            # Remove expired proxy from cache
-            del self._proxy_cache[cache_key]
+        with self._proxy_lock:
+            proxy_info = self._proxy_cache.get(cache_key)
+            if proxy_info is not None:
+                # Check if proxy is still valid
+                if time.time() - proxy_info['created'] < self._max_connection_age:
+                    self._proxy_cache.move_to_end(cache_key)
+                    self._proxy_stats["hits"] += 1
+                    return proxy_info['proxy']
+                
+                # Remove expired proxy from cache
+                del self._proxy_cache[cache_key]
+                self._proxy_stats["expired"] += 1
+            self._proxy_stats["misses"] += 1
         
         # Create new proxy
         connection = self.get_connection(bus_type, timeout)
+        if bus_type == 'system':
+            self._ensure_removal_watch()
         obj = connection.get_object(service_name, object_path)
         proxy = dbus.Interface(obj, interface_name)
         
-        # Cache the proxy
-        self._proxy_cache[cache_key] = {
-            'proxy': proxy,
-            'created': time.time(),
-        }
+        # Cache the proxy, evicting the least recently used entries
+        with self._proxy_lock:
+            self._proxy_cache[cache_key] = {
+                'proxy': proxy,
+                'created': time.time(),
+            }
+            self._proxy_cache.move_to_end(cache_key)
+            while len(self._proxy_cache) > self._max_cached_proxies:
+                self._proxy_cache.popitem(last=False)
+                self._proxy_stats["evictions"] += 1
         
         return proxy
     
+    def _ensure_removal_watch(self) -> None:
+        """Subscribe once to ``InterfacesRemoved`` so stale proxies are dropped.
+        
+        The receiver lives on a dedicated connection outside the pool, so
+        maintenance closing aged or idle pooled connections cannot end it.
+        """
+        if self._removal_watch is not None:
+            return
+        with self._proxy_lock:
+            if self._removal_watch is not None:
+                return
+            try:
+                if self._watch_bus is None:
+                    self._watch_bus = dbus.SystemBus(private=True)
+                self._removal_watch = self._watch_bus.add_signal_receiver(
+                    self._on_interfaces_removed,
+                    dbus_interface=DBUS_OM_IFACE,
+                    signal_name="InterfacesRemoved",
+                )
+            except Exception as e:
+                # Without a main loop the cache still expires entries by age
+                self._removal_watch = False
+                print_and_log(
+                    f"[-] Could not watch InterfacesRemoved for proxy cache: {e}",
+                    LOG__DEBUG
+                )
+    
+    def _on_interfaces_removed(self, object_path, interfaces) -> None:
+        self.invalidate_path(str(object_path))
+    
+    def invalidate_path(self, object_path: str) -> int:
+        """
+        Drop every cached proxy for *object_path* or any path beneath it.
+        
+        Parameters
+        ----------
+        object_path : str
+            D-Bus object path that disappeared
+            
+        Returns
+        -------
+        int
+            Number of proxies removed
+        """
+        subtree = object_path.rstrip('/') + '/'
+        with self._proxy_lock:
+            stale = [key for key in self._proxy_cache
+                     if key[2] == object_path or key[2].startswith(subtree)]
+            for key in stale:
+                del self._proxy_cache[key]
+            self._proxy_stats["invalidations"] += len(stale)
+        if stale:
+            print_and_log(
+                f"[DEBUG] Invalidated {len(stale)} cached proxies under {object_path}",
+                LOG__DEBUG
+            )
+        return len(stale)
+    
     def invalidate_proxy(
         self, bus_type: str, 
         service_name: str, object_path: str, 
@@ -534,12 +633,14 @@ class DBusConnectionPool:
         cache_key = (bus_type, service_name, object_path, interface_name)
         
         # Remove from cache if present
-        if cache_key in self._proxy_cache:
-            del self._proxy_cache[cache_key]
+        with self._proxy_lock:
+            if self._proxy_cache.pop(cache_key, None) is not None:
+                self._proxy_stats["invalidations"] += 1
     
     def clear_proxy_cache(self) -> None:
         """Clear the proxy cache."""
-        self._proxy_cache = {}
+        with self._proxy_lock:
+            self._proxy_cache.clear()
     
     def cleanup(self) -> None:
         """Close all connections in the pool."""
@@ -549,7 +650,19 @@ class DBusConnectionPool:
                     conn.close()
                 self._connections[bus_type] = []
             
-            self._proxy_cache = {}
+            if self._removal_watch:
+                try:
+                    self._removal_watch.remove()
+                except Exception:
+                    pass
+            self._removal_watch = None
+            if self._watch_bus is not None:
+                try:
+                    self._watch_bus.close()
+                except Exception:
+                    pass
+                self._watch_bus = None
+            self.clear_proxy_cache()
 
 
 class DBusConnectionManager:
@@ -0,0 +1,415 @@
+"""
+Process-wide mirror of BlueZ's ObjectManager tree.
+
+``GetManagedObjects()`` re-marshals every object BlueZ knows about – on a
+busy adapter that is thousands of cached devices – and many code paths used
+to call it independently.  :class:`ObjectTreeMirror` fetches the tree once
+and then applies ``InterfacesAdded`` / ``InterfacesRemoved`` /
+``PropertiesChanged`` signals to keep it current.  Paths are kept sorted so
+prefix queries (a device and its GATT subtree, everything under an adapter)
+are a bisect plus a contiguous scan.
+
+Signals are only delivered while a GLib main loop is iterating the default
+context.  When no loop is running, reads first dispatch the signals received
+so far themselves, and also re-sync once the data is older than ``max_age``
+seconds (``BLEEP_DBUS_MIRROR_MAX_AGE``, default 1.0).  ``BLEEP_DBUS_MIRROR=0``
+disables the mirror entirely: every read becomes a direct
+``GetManagedObjects()`` call.
+
+The mirror listens on the shared ``SystemBus()``, so BlueZ's signals reach
+it in the order they were sent.  Code reacting to a signal such as
+``ServicesResolved`` should still use :func:`get_fresh_objects`: it first
+lets the main context dispatch every message already received (the
+``InterfacesAdded`` for the GATT objects precede ``ServicesResolved``) and
+only falls back to a full re-sync if that cannot be confirmed.
+
+Returned dictionaries share the mirror's per-interface property dicts; treat
+them as read-only.  Property updates replace those dicts rather than
+mutating them, so a snapshot taken by a caller does not change under it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import dbus
+
+from bleep.bt_ref.constants import (
+    BLUEZ_SERVICE_NAME,
+    DBUS_OM_IFACE,
+    DBUS_PROPERTIES,
+    DEVICE_INTERFACE,
+)
+from bleep.core.log import print_and_log, LOG__DEBUG
+
+__all__ = [
+    "ObjectTreeMirror",
+    "get_object_mirror",
+    "get_managed_objects",
+    "get_fresh_objects",
+    "find_device_path",
+]
+
+ManagedObjects = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def _mirror_enabled() -> bool:
+    return os.getenv("BLEEP_DBUS_MIRROR", "1").lower() not in ("0", "false", "no", "off")
+
+
+def _default_max_age() -> float:
+    try:
+        return float(os.getenv("BLEEP_DBUS_MIRROR_MAX_AGE", "1.0"))
+    except ValueError:
+        return 1.0
+
+
+_DISPATCH_TIMEOUT = 1.0  # seconds to wait for another thread's main loop
+_DRAIN_MAX_ITERATIONS = 10000
+
+
+def _dispatch_pending(timeout: float = _DISPATCH_TIMEOUT) -> bool:
+    """Let the default GLib context dispatch the D-Bus messages received so far.
+
+    Returns False when that could not be confirmed within *timeout*.
+    """
+    try:
+        from gi.repository import GLib
+    except ImportError:  # pragma: no cover - gi is a hard dependency in practice
+        return False
+    if GLib.main_depth() > 0:
+        # Inside a dispatch: earlier messages on the shared bus were handled
+        # before the one being dispatched now.
+        return True
+    ctx = GLib.MainContext.default()
+    if ctx.acquire():
+        # Nobody else is dispatching; drain what is ready ourselves.
+        try:
+            for _ in range(_DRAIN_MAX_ITERATIONS):
+                if not ctx.iteration(False):
+                    break
+        finally:
+            ctx.release()
+        return True
+    # Another thread owns the loop.  An idle callback only runs once the
+    # higher-priority D-Bus source has nothing left to dispatch.
+    done = threading.Event()
+
+    def _mark() -> bool:
+        done.set()
+        return False
+
+    GLib.idle_add(_mark)
+    return done.wait(timeout)
+
+
+def _main_loop_active() -> bool:
+    """True when some thread is dispatching the default GLib main context."""
+    try:
+        from gi.repository import GLib
+    except ImportError:  # pragma: no cover - gi is a hard dependency in practice
+        return False
+    if GLib.main_depth() > 0:
+        return True  # we are inside a dispatch on this thread
+    ctx = GLib.MainContext.default()
+    if ctx.acquire():
+        ctx.release()
+        return False  # nobody else owns it -> nobody is dispatching
+    return True
+
+
+class ObjectTreeMirror:
+    """Signal-maintained copy of ``org.bluez``'s managed objects."""
+
+    def __init__(self, bus: Optional[dbus.Bus] = None, max_age: Optional[float] = None):
+        self._bus = bus
+        self.max_age = _default_max_age() if max_age is None else max_age
+        self._objects: ManagedObjects = {}
+        self._paths: List[str] = []
+        self._by_address: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+        self._matches: list = []
+        self._synced_at = 0.0
+        self._stats = {"syncs": 0, "hits": 0, "added": 0, "removed": 0, "changed": 0}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def _get_bus(self) -> dbus.Bus:
+        if self._bus is None:
+            # The shared connection, so mirror updates are ordered with the
+            # signals the rest of BLEEP reacts to.
+            if dbus.get_default_main_loop() is None:
+                from dbus.mainloop.glib import DBusGMainLoop
+
+                DBusGMainLoop(set_as_default=True)
+            self._bus = dbus.SystemBus()
+        return self._bus
+
+    def start(self) -> None:
+        """Subscribe to ObjectManager/property signals and do the initial sync."""
+        with self._lock:
+            if self._matches:
+                return
+            bus = self._get_bus()
+            self._matches = [
+                bus.add_signal_receiver(
+                    self._on_interfaces_added,
+                    dbus_interface=DBUS_OM_IFACE,
+                    signal_name="InterfacesAdded",
+                    bus_name=BLUEZ_SERVICE_NAME,
+                ),
+                bus.add_signal_receiver(
+                    self._on_interfaces_removed,
+                    dbus_interface=DBUS_OM_IFACE,
+                    signal_name="InterfacesRemoved",
+                    bus_name=BLUEZ_SERVICE_NAME,
+                ),
+                bus.add_signal_receiver(
+                    self._on_properties_changed,
+                    dbus_interface=DBUS_PROPERTIES,
+                    signal_name="PropertiesChanged",
+                    bus_name=BLUEZ_SERVICE_NAME,
+                    path_keyword="path",
+                ),
+            ]
+            self.refresh()
+
+    def stop(self) -> None:
+        """Remove signal receivers and drop the cached tree."""
+        with self._lock:
+            for match in self._matches:
+                try:
+                    match.remove()
+                except Exception:
+                    pass
+            self._matches = []
+            self._objects = {}
+            self._paths = []
+            self._by_address = {}
+            self._synced_at = 0.0
+
+    def refresh(self) -> None:
+        """Replace the mirror with a fresh ``GetManagedObjects()`` reply."""
+        om = dbus.Interface(self._get_bus().get_object(BLUEZ_SERVICE_NAME, "/"), DBUS_OM_IFACE)
+        managed = om.GetManagedObjects()
+        with self._lock:
+            self._objects = {
+                str(path): {str(i): dict(p) for i, p in ifaces.items()}
+                for path, ifaces in managed.items()
+            }
+            self._paths = sorted(self._objects)
+            self._by_address = {}
+            for path, ifaces in self._objects.items():
+                self._index_address(path, ifaces)
+            self._synced_at = time.monotonic()
+            self._stats["syncs"] += 1
+        print_and_log(
+            f"[DEBUG] Object mirror synced ({len(self._objects)} objects)", LOG__DEBUG
+        )
+
+    def _ensure_fresh(self, max_age: Optional[float]) -> None:
+        if not self._matches:
+            self.start()
+            return
+        if _main_loop_active():
+            self._stats["hits"] += 1  # signals keep us current
+            return
+        # Apply signals that arrived since the last read before trusting a
+        # recent sync; otherwise a just-added device would be missed.
+        _dispatch_pending()
+        limit = self.max_age if max_age is None else max_age
+        if time.monotonic() - self._synced_at > limit:
+            self.refresh()
+        else:
+            self._stats["hits"] += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def get_managed_objects(self, prefix: Optional[str] = None,
+                            max_age: Optional[float] = None) -> ManagedObjects:
+        """Return ``{path: {interface: props}}`` like ``GetManagedObjects()``.
+
+        *prefix* restricts the result to paths starting with it (plain string
+        prefix, e.g. ``"/org/bluez/hci0/"``).
+        """
+        self._ensure_fresh(max_age)
+        return self._snapshot(prefix)
+
+    def get_fresh_objects(self, prefix: Optional[str] = None) -> ManagedObjects:
+        """Return the objects under *prefix* after applying pending signals.
+
+        Re-syncs with BlueZ only when the pending messages could not be
+        dispatched (see :func:`_dispatch_pending`).
+        """
+        if not self._matches:
+            self.start()
+        elif _dispatch_pending():
+            self._stats["hits"] += 1
+        else:
+            self.refresh()
+        return self._snapshot(prefix)
+
+    def _snapshot(self, prefix: Optional[str]) -> ManagedObjects:
+        with self._lock:
+            if prefix is None:
+                return {p: dict(e) for p, e in self._objects.items()}
+            return {p: dict(self._objects[p]) for p in self._prefix_paths(prefix)}
+
+    def get_object(self, path: str, max_age: Optional[float] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return the interfaces/properties of *path*, or None."""
+        self._ensure_fresh(max_age)
+        with self._lock:
+            entry = self._objects.get(str(path))
+            return dict(entry) if entry is not None else None
+
+    def find_device_path(self, mac: str, adapter_path: Optional[str] = None,
+                         max_age: Optional[float] = None) -> Optional[str]:
+        """Resolve a device MAC to its object path via the address index."""
+        self._ensure_fresh(max_age)
+        with self._lock:
+            for path in self._by_address.get(mac.strip().upper(), ()):
+                if adapter_path is None or path.startswith(adapter_path.rstrip("/") + "/"):
+                    return path
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["objects"] = len(self._objects)
+            out["age"] = time.monotonic() - self._synced_at if self._synced_at else None
+            out["subscribed"] = bool(self._matches)
+            return out
+
+    # ------------------------------------------------------------------
+    # Index maintenance (lock held)
+    # ------------------------------------------------------------------
+    def _prefix_paths(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self._paths, prefix)
+        out = []
+        for path in self._paths[start:]:
+            if not path.startswith(prefix):
+                break
+            out.append(path)
+        return out
+
+    def _index_address(self, path: str, ifaces: Dict[str, Dict[str, Any]]) -> None:
+        dev = ifaces.get(DEVICE_INTERFACE)
+        if dev and dev.get("Address"):
+            paths = self._by_address.setdefault(str(dev["Address"]).upper(), [])
+            if path not in paths:
+                paths.append(path)
+
+    def _unindex_address(self, path: str, ifaces: Dict[str, Dict[str, Any]]) -> None:
+        dev = ifaces.get(DEVICE_INTERFACE)
+        if dev and dev.get("Address"):
+            key = str(dev["Address"]).upper()
+            paths = self._by_address.get(key)
+            if paths and path in paths:
+                paths.remove(path)
+                if not paths:
+                    del self._by_address[key]
+
+    # ------------------------------------------------------------------
+    # Signal handlers
+    # ------------------------------------------------------------------
+    def _on_interfaces_added(self, path, interfaces) -> None:
+        path = str(path)
+        with self._lock:
+            entry = self._objects.get(path)
+            if entry is None:
+                entry = self._objects[path] = {}
+                bisect.insort(self._paths, path)
+            for iface, props in interfaces.items():
+                entry[str(iface)] = dict(props)
+            self._index_address(path, entry)
+            self._stats["added"] += 1
+
+    def _on_interfaces_removed(self, path, interfaces) -> None:
+        path = str(path)
+        with self._lock:
+            entry = self._objects.get(path)
+            if entry is None:
+                return
+            if DEVICE_INTERFACE in {str(i) for i in interfaces}:
+                self._unindex_address(path, entry)
+            for iface in interfaces:
+                entry.pop(str(iface), None)
+            if not entry:
+                del self._objects[path]
+                idx = bisect.bisect_left(self._paths, path)
+                if idx < len(self._paths) and self._paths[idx] == path:
+                    del self._paths[idx]
+            self._stats["removed"] += 1
+
+    def _on_properties_changed(self, interface, changed, invalidated, path=None) -> None:
+        if path is None:
+            return
+        path = str(path)
+        interface = str(interface)
+        with self._lock:
+            entry = self._objects.get(path)
+            if entry is None or interface not in entry:
+                return
+            # Copy-on-write so snapshots handed out earlier stay consistent
+            props = dict(entry[interface])
+            props.update(changed)
+            for name in invalidated:
+                props.pop(str(name), None)
+            entry[interface] = props
+            if interface == DEVICE_INTERFACE and "Address" in changed:
+                self._index_address(path, entry)
+            self._stats["changed"] += 1
+
+
+_mirror: Optional[ObjectTreeMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_object_mirror() -> ObjectTreeMirror:
+    """Return the process-wide mirror (created and started lazily)."""
+    global _mirror
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                _mirror = ObjectTreeMirror()
+    return _mirror
+
+
+def get_managed_objects(prefix: Optional[str] = None,
+                        max_age: Optional[float] = None) -> ManagedObjects:
+    """Drop-in replacement for ``ObjectManager.GetManagedObjects()``.
+
+    Served from the mirror unless ``BLEEP_DBUS_MIRROR=0``.
+    """
+    if not _mirror_enabled():
+        om = dbus.Interface(dbus.SystemBus().get_object(BLUEZ_SERVICE_NAME, "/"), DBUS_OM_IFACE)
+        managed = om.GetManagedObjects()
+        if prefix is None:
+            return managed
+        return {p: i for p, i in managed.items() if str(p).startswith(prefix)}
+    return get_object_mirror().get_managed_objects(prefix, max_age)
+
+
+def get_fresh_objects(prefix: Optional[str] = None) -> ManagedObjects:
+    """Like :func:`get_managed_objects`, but reflects every signal already received."""
+    if not _mirror_enabled():
+        return get_managed_objects(prefix)
+    return get_object_mirror().get_fresh_objects(prefix)
+
+
+def find_device_path(mac: str, adapter_path: Optional[str] = None) -> Optional[str]:
+    """Return the object path of the device with address *mac*, if known."""
+    if not _mirror_enabled():
+        for path, ifaces in get_managed_objects().items():
+            dev = ifaces.get(DEVICE_INTERFACE)
+            if dev and str(dev.get("Address", "")).upper() == mac.strip().upper():
+                if adapter_path is None or str(path).startswith(adapter_path.rstrip("/") + "/"):
+                    return str(path)
+        return None
+    return get_object_mirror().find_device_path(mac, adapter_path)
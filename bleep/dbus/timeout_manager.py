@@ -8,21 +8,24 @@ with configurable timeouts and proper error handling.
 Based on best practices from BlueZ examples and documentation.
 """
 
+import functools
+import os
 import threading
 import time
-import functools
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from typing import Any, Dict, Optional, Callable, Tuple, Union, TypeVar, cast
 
 import dbus
 import dbus.exceptions
 import dbus.mainloop.glib
-from gi.repository import GLib
+import dbus.proxies
 
 from bleep.bt_ref.constants import (
     RESULT_ERR_NO_REPLY,
     RESULT_ERR_TIMEOUT,
 )
 from bleep.core.log import print_and_log, LOG__DEBUG, LOG__GENERAL
+from bleep.core.call_trace import trace_call
 from bleep.core.errors import map_dbus_error
 from bleep.core.error_handling import controller_stall_mitigation
 
@@ -60,6 +63,141 @@ class DBusTimeout(Exception):
         super().__init__(message)
 
 
+class _TimeoutEngine:
+    """Shared bookkeeping and worker pool for timeout-enforced calls.
+
+    D-Bus method calls go through dbus-python's own ``timeout=`` argument, so
+    libdbus enforces the deadline and no thread or nested main loop is
+    needed.  Arbitrary callables (``with_timeout``) run on a *bounded* worker
+    pool: a call that times out keeps its worker until BlueZ answers (the bus
+    default reply timeout bounds that), but the pool never grows past
+    ``BLEEP_DBUS_TIMEOUT_WORKERS`` threads and abandoned calls are counted.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv("BLEEP_DBUS_TIMEOUT_WORKERS", "8"))
+            except ValueError:
+                max_workers = 8
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "completed": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "late_completions": 0,
+            "in_flight": 0,
+            "abandoned": 0,
+        }
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self._stats[key] += delta
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="bleep-dbus-timeout",
+                    )
+        return self._executor
+
+    def call_dbus(self, method: Callable[..., Any], args: Tuple, timeout: float) -> Any:
+        """Invoke a dbus-python proxy method with a libdbus reply timeout."""
+        self._count(calls=1, in_flight=1)
+        try:
+            value = method(*args, timeout=timeout)
+        except Exception:
+            self._count(in_flight=-1, errors=1)
+            raise
+        self._count(in_flight=-1, completed=1)
+        return value
+
+    def call_blocking(self, func: Callable[..., R], args: Tuple, kwargs: Dict[str, Any],
+                      timeout: float) -> Tuple[bool, Any]:
+        """Run *func* on the worker pool; return ``(finished, future)``."""
+        self._count(calls=1, in_flight=1)
+        future = self._get_executor().submit(func, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeout:
+            if future.cancel():
+                # Never started (all workers busy): nothing left behind
+                self._count(timeouts=1, cancelled=1)
+                return False, future
+            with self._lock:
+                if future.done():
+                    return True, future  # finished while we were cancelling
+                # _on_done takes the same lock, so it sees the flag
+                future._bleep_abandoned = True  # type: ignore[attr-defined]
+                self._stats["timeouts"] += 1
+                self._stats["abandoned"] += 1
+            return False, future
+        except Exception:
+            pass  # surfaced to the caller through future.exception()
+        return True, future
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            self._count(in_flight=-1)
+            return
+        failed = future.exception() is not None
+        with self._lock:
+            self._stats["in_flight"] -= 1
+            self._stats["errors" if failed else "completed"] += 1
+            if getattr(future, "_bleep_abandoned", False):
+                self._stats["abandoned"] -= 1
+                self._stats["late_completions"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+        out["max_workers"] = self.max_workers
+        return out
+
+
+_engine = _TimeoutEngine()
+
+
+def get_timeout_stats() -> Dict[str, int]:
+    """Return counters for timeout-enforced calls.
+
+    ``in_flight`` is the number of calls currently outstanding and
+    ``abandoned`` the subset that already timed out but whose worker is
+    still blocked waiting for BlueZ.
+    """
+    return _engine.stats()
+
+
+def _raise_timeout(method_name: str, timeout: float, device_address: Optional[str]) -> None:
+    print_and_log(
+        f"[-] D-Bus method {method_name} timed out after {timeout}s"
+        + (f" on device {device_address}" if device_address else ""),
+        LOG__GENERAL
+    )
+
+    # Check if this might be a controller stall (NoReply)
+    if device_address:
+        controller_stall_mitigation(device_address)
+
+    raise DBusTimeout(method_name, timeout, device_address)
+
+
+def _raise_error(error: BaseException) -> None:
+    if isinstance(error, dbus.exceptions.DBusException):
+        # Handle D-Bus errors with our error mapping
+        raise map_dbus_error(error)
+    raise error
+
+
 def with_timeout(
     timeout_category: str = "default",
     custom_timeout: Optional[float] = None,
@@ -68,6 +206,9 @@ def with_timeout(
     """
     Decorator to add timeout enforcement to D-Bus method calls.
     
+    The wrapped function runs on the shared bounded worker pool; timeouts
+    may be fractional seconds.
+    
     Parameters
     ----------
     timeout_category : str
@@ -109,51 +250,15 @@ def with_timeout(
                 LOG__DEBUG
             )
             
-            # Create an event to signal completion
-            complete_event = threading.Event()
-            result: Dict[str, Any] = {"value": None, "error": None}
+            finished, future = _engine.call_blocking(func, args, kwargs, timeout)
+            if not finished:
+                _raise_timeout(method_name, timeout, device_addr)
             
-            # Create a thread to run the operation
-            def run_operation() -> None:
-                try:
-                    result["value"] = func(*args, **kwargs)
-                except Exception as e:
-                    result["error"] = e
-                finally:
-                    complete_event.set()
+            error = future.exception()
+            if error is not None:
+                _raise_error(error)
             
-            # Start operation thread
-            operation_thread = threading.Thread(target=run_operation)
-            operation_thread.daemon = True
-            operation_thread.start()
-            
-            # Wait for completion or timeout
-            if not complete_event.wait(timeout):
-                # Operation timed out
-                print_and_log(
-                    f"[-] D-Bus method {method_name} timed out after {timeout}s"
-                    + (f" on device {device_addr}" if device_addr else ""),
-                    LOG__GENERAL
-                )
-                
-                # Check if this might be a controller stall (NoReply)
-                if device_addr:
-                    controller_stall_mitigation(device_addr)
-                
-                # Raise timeout exception
-                raise DBusTimeout(method_name, timeout, device_addr)
-            
-            # If operation completed but with an error, raise it
-            if result["error"]:
-                if isinstance(result["error"], dbus.exceptions.DBusException):
-                    # Handle D-Bus errors with our error mapping
-                    raise map_dbus_error(result["error"])
-                else:
-                    # Re-raise other exceptions
-                    raise result["error"]
-            
-            # Return the result
-            return cast(R, result["value"])
+            return cast(R, future.result())
         
         return wrapper
     
@@ -170,6 +275,11 @@ def call_method_with_timeout(
     """
     Call a D-Bus method with timeout enforcement.
     
+    The deadline is passed to dbus-python as the method call's ``timeout=``
+    so libdbus enforces it (millisecond resolution) without spawning a
+    thread or running a nested main loop.  Proxies that do not accept a
+    ``timeout`` keyword fall back to the bounded worker pool.
+    
     Parameters
     ----------
     proxy : dbus.proxies.Interface
@@ -195,73 +305,34 @@ def call_method_with_timeout(
     Exception
         Any exception raised by the method call
     """
-    # Create GLib main loop
-    loop = GLib.MainLoop()
-    result: Dict[str, Any] = {"completed": False, "value": None, "error": None}
+    with trace_call(getattr(proxy, "dbus_interface", None) or "",
+                    method_name, getattr(proxy, "object_path", None)):
+        return _call_with_timeout(proxy, method_name, args, timeout, device_address)
+
+
+def _call_with_timeout(proxy: Any, method_name: str, args: Tuple,
+                       timeout: float, device_address: Optional[str]) -> Any:
+    method = getattr(proxy, method_name)
+    timeout = float(timeout)
     
-    # Callback for method completion
-    def method_cb(proxy_obj, res, user_data):
+    if isinstance(proxy, (dbus.proxies.Interface, dbus.proxies.ProxyObject)):
+        started = time.monotonic()
         try:
-            result["value"] = getattr(proxy_obj, f"{method_name}_finish")(res)
-        except Exception as e:
-            result["error"] = e
-        result["completed"] = True
-        loop.quit()
-    
-    # Start method call asynchronously
-    method_async = getattr(proxy, f"{method_name}_async", None)
-    if method_async:
-        method_async(*args, reply_handler=method_cb, error_handler=lambda e: None)
-    else:
-        # Fallback for proxies without async methods
-        def run_sync():
-            try:
-                method = getattr(proxy, method_name)
-                result["value"] = method(*args)
-            except Exception as e:
-                result["error"] = e
-            finally:
-                result["completed"] = True
-                loop.quit()
-        
-        GLib.idle_add(run_sync)
-    
-    # Set up timeout
-    timeout_id = GLib.timeout_add_seconds(int(timeout), lambda: loop.quit())
-    
-    # Run loop until completion or timeout
-    loop.run()
-    
-    # Clean up timeout source
-    GLib.source_remove(timeout_id)
-    
-    # Handle result
-    if not result["completed"]:
-        # Operation timed out
-        print_and_log(
-            f"[-] D-Bus method {method_name} timed out after {timeout}s"
-            + (f" on device {device_address}" if device_address else ""),
-            LOG__GENERAL
-        )
-        
-        # Check if this might be a controller stall (NoReply)
-        if device_address:
-            controller_stall_mitigation(device_address)
-        
-        # Raise timeout exception
-        raise DBusTimeout(method_name, timeout, device_address)
-    
-    # If operation completed but with an error, raise it
-    if result["error"]:
-        if isinstance(result["error"], dbus.exceptions.DBusException):
-            # Handle D-Bus errors with our error mapping
-            raise map_dbus_error(result["error"])
-        else:
-            # Re-raise other exceptions
-            raise result["error"]
+            return _engine.call_dbus(method, tuple(args), timeout)
+        except dbus.exceptions.DBusException as e:
+            # libdbus reports its own reply timeout as NoReply
+            if (e.get_dbus_name() == "org.freedesktop.DBus.Error.NoReply"
+                    and time.monotonic() - started >= timeout * 0.9):
+                _raise_timeout(method_name, timeout, device_address)
+            _raise_error(e)
     
-    # Return the result
-    return result["value"]
+    finished, future = _engine.call_blocking(method, tuple(args), {}, timeout)
+    if not finished:
+        _raise_timeout(method_name, timeout, device_address)
+    error = future.exception()
+    if error is not None:
+        _raise_error(error)
+    return future.result()
 
 
 class TimeoutProperties:
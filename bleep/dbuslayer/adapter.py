@@ -23,6 +23,7 @@ from bleep.bt_ref.exceptions import *
 from bleep.bt_ref.utils import dbus_to_python
 from bleep.core.log import get_logger
 from bleep.core.errors import BleepError
+from bleep.dbus.object_mirror import get_managed_objects as _mirror_objects
 from bleep.dbuslayer.manager import (
     system_dbus__bluez_device_manager as _DeviceManager,
 )
@@ -111,17 +112,17 @@ class system_dbus__bluez_adapter:
     def get_managed_objects(self):
         """Get all managed objects."""
         try:
-            object_manager = dbus.Interface(
-                self.system_bus.get_object(BLUEZ_SERVICE_NAME, "/"), DBUS_OM_IFACE
-            )
-            return object_manager.GetManagedObjects()
+            return _mirror_objects()
         except Exception as e:
             logger.error(f"Failed to get managed objects: {e}")
             return None
 
-    def get_discovered_devices(self):
+    def get_discovered_devices(self, adapter_only: bool = False):
         """Get list of discovered devices with device type classification.
         
+        When *adapter_only* is True only devices under this adapter's object
+        path are returned (BlueZ keeps a separate device object per adapter).
+        
         Device type is determined using evidence-based classification for immediate
         use by commands like classic-scan. Database persistence still uses separate
         classification logic in upsert_device().
@@ -141,9 +142,12 @@ class system_dbus__bluez_adapter:
                 return []
 
             devices = []
+            own_prefix = self.adapter_path + "/"
             for path, interfaces in managed_objects.items():
                 if DEVICE_INTERFACE not in interfaces:
                     continue
+                if adapter_only and not str(path).startswith(own_prefix):
+                    continue
 
                 properties = interfaces[DEVICE_INTERFACE]
                 device_address = properties.get("Address", "")
@@ -156,58 +160,7 @@ class system_dbus__bluez_adapter:
                     if cached_rssi is not None:
                         rssi = cached_rssi
                 
-                # Determine device type using existing classification method
-                device_type = self._determine_device_type(properties)
-                # Map "classic" to "br/edr" for compatibility with classic-scan filter
-                type_display = "br/edr" if device_type == BT_DEVICE_TYPE_CLASSIC else device_type
-                
-                # ManufacturerData: Dict[UInt16, Array[Byte]] → {int: bytes}
-                mfr_raw = properties.get("ManufacturerData")
-                if mfr_raw:
-                    try:
-                        mfr_data = {int(k): bytes(v) for k, v in mfr_raw.items()}
-                    except (TypeError, ValueError):
-                        mfr_data = {}
-                else:
-                    mfr_data = {}
-
-                # ServiceData: Dict[String, Array[Byte]] → {str: bytes}
-                sd_raw = properties.get("ServiceData")
-                if sd_raw:
-                    try:
-                        sd_data = {str(k): bytes(v) for k, v in sd_raw.items()}
-                    except (TypeError, ValueError):
-                        sd_data = {}
-                else:
-                    sd_data = {}
-
-                devices.append(
-                    {
-                        "path": path,
-                        "address": device_address,
-                        "name": properties.get("Name", ""),
-                        "rssi": rssi,
-                        "alias": properties.get("Alias", ""),
-                        "address_type": properties.get("AddressType"),
-                        "device_class": properties.get("Class"),
-                        "uuids": [str(uuid) for uuid in properties.get("UUIDs", [])] if properties.get("UUIDs") else [],
-                        "connected": properties.get("Connected", False),
-                        "type": type_display,
-                        "manufacturer_data": mfr_data,
-                        "service_data": sd_data,
-                        "tx_power": int(properties["TxPower"]) if "TxPower" in properties else None,
-                        "appearance": int(properties["Appearance"]) if "Appearance" in properties else None,
-                        "modalias": str(properties["Modalias"]) if "Modalias" in properties else None,
-                        "paired": bool(properties.get("Paired", False)),
-                        "bonded": bool(properties.get("Bonded", False)),
-                        "trusted": bool(properties.get("Trusted", False)),
-                        "blocked": bool(properties.get("Blocked", False)),
-                        "wake_allowed": bool(properties.get("WakeAllowed", False)),
-                        "icon": str(properties["Icon"]) if "Icon" in properties else None,
-                        "advertising_flags": bytes(properties["AdvertisingFlags"]) if "AdvertisingFlags" in properties else None,
-                        "advertising_data": {int(k): bytes(v) for k, v in properties["AdvertisingData"].items()} if "AdvertisingData" in properties else None,
-                    }
-                )
+                devices.append(self.device_entry(path, properties, rssi))
 
             # Phase 3: Properties.Get() fallback for connected devices only
             # Only query Properties.Get() for devices with None RSSI that are connected
@@ -230,6 +183,66 @@ class system_dbus__bluez_adapter:
             logger.error(f"Failed to get discovered devices: {e}")
             return []
 
+    def device_entry(self, path, properties: dict, rssi=None) -> dict:
+        """Build one discovery entry from a device's ``Device1`` properties.
+
+        *rssi* overrides the ``RSSI`` property (e.g. a value captured from a
+        signal after BlueZ dropped the property).
+        """
+        if rssi is None:
+            rssi = properties.get("RSSI") if "RSSI" in properties else None
+
+        # Determine device type using existing classification method
+        device_type = self._determine_device_type(properties)
+        # Map "classic" to "br/edr" for compatibility with classic-scan filter
+        type_display = "br/edr" if device_type == BT_DEVICE_TYPE_CLASSIC else device_type
+
+        # ManufacturerData: Dict[UInt16, Array[Byte]] → {int: bytes}
+        mfr_raw = properties.get("ManufacturerData")
+        if mfr_raw:
+            try:
+                mfr_data = {int(k): bytes(v) for k, v in mfr_raw.items()}
+            except (TypeError, ValueError):
+                mfr_data = {}
+        else:
+            mfr_data = {}
+
+        # ServiceData: Dict[String, Array[Byte]] → {str: bytes}
+        sd_raw = properties.get("ServiceData")
+        if sd_raw:
+            try:
+                sd_data = {str(k): bytes(v) for k, v in sd_raw.items()}
+            except (TypeError, ValueError):
+                sd_data = {}
+        else:
+            sd_data = {}
+
+        return {
+            "path": path,
+            "address": properties.get("Address", ""),
+            "name": properties.get("Name", ""),
+            "rssi": rssi,
+            "alias": properties.get("Alias", ""),
+            "address_type": properties.get("AddressType"),
+            "device_class": properties.get("Class"),
+            "uuids": [str(uuid) for uuid in properties.get("UUIDs", [])] if properties.get("UUIDs") else [],
+            "connected": properties.get("Connected", False),
+            "type": type_display,
+            "manufacturer_data": mfr_data,
+            "service_data": sd_data,
+            "tx_power": int(properties["TxPower"]) if "TxPower" in properties else None,
+            "appearance": int(properties["Appearance"]) if "Appearance" in properties else None,
+            "modalias": str(properties["Modalias"]) if "Modalias" in properties else None,
+            "paired": bool(properties.get("Paired", False)),
+            "bonded": bool(properties.get("Bonded", False)),
+            "trusted": bool(properties.get("Trusted", False)),
+            "blocked": bool(properties.get("Blocked", False)),
+            "wake_allowed": bool(properties.get("WakeAllowed", False)),
+            "icon": str(properties["Icon"]) if "Icon" in properties else None,
+            "advertising_flags": bytes(properties["AdvertisingFlags"]) if "AdvertisingFlags" in properties else None,
+            "advertising_data": {int(k): bytes(v) for k, v in properties["AdvertisingData"].items()} if "AdvertisingData" in properties else None,
+        }
+
     def create_device_manager(self) -> _DeviceManager:
         """Return (or lazily create) a device manager bound to this adapter."""
         if self._device_manager is None:
@@ -334,24 +347,18 @@ class system_dbus__bluez_adapter:
     def get_connected_devices(self) -> list:
         """Return MAC addresses of devices currently connected to this adapter.
 
-        Uses ``GetManagedObjects()`` and checks ``Connected`` property on each
-        ``Device1`` object whose path is under this adapter's path.
+        Reads the object-tree mirror (see :mod:`bleep.dbus.object_mirror`) and
+        checks the ``Connected`` property on each ``Device1`` object whose path
+        is under this adapter's path.
         """
+        prefix = self.adapter_path + "/"
         try:
-            bus = dbus.SystemBus()
-            obj_mgr = dbus.Interface(
-                bus.get_object("org.bluez", "/"),
-                "org.freedesktop.DBus.ObjectManager",
-            )
-            managed = obj_mgr.GetManagedObjects()
+            managed = _mirror_objects(prefix)
         except dbus.exceptions.DBusException:
             return []
 
         connected = []
-        prefix = self.adapter_path + "/"
         for path, ifaces in managed.items():
-            if not str(path).startswith(prefix):
-                continue
             dev_props = ifaces.get(DEVICE_INTERFACE)
             if dev_props and bool(dev_props.get("Connected", False)):
                 addr = str(dev_props.get("Address", ""))
@@ -368,12 +375,7 @@ class system_dbus__bluez_adapter:
         list when BlueZ is unreachable or no adapters are present.
         """
         try:
-            bus = dbus.SystemBus()
-            obj_mgr = dbus.Interface(
-                bus.get_object("org.bluez", "/"),
-                "org.freedesktop.DBus.ObjectManager",
-            )
-            managed = obj_mgr.GetManagedObjects()
+            managed = _mirror_objects("/org/bluez/")
         except dbus.exceptions.DBusException:
             return []
 
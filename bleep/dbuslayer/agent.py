@@ -1336,14 +1336,10 @@ class TrustManager:
         trusted_devices = []
         
         try:
-            # Get object manager
-            obj_manager = dbus.Interface(
-                self._bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-                DBUS_OM_IFACE
-            )
-            
-            # Get all objects
-            objects = obj_manager.GetManagedObjects()
+            from bleep.dbus.object_mirror import get_managed_objects as _mirror_objects
+
+            # Get all objects (from the object-tree mirror)
+            objects = _mirror_objects()
             
             # Find trusted devices
             for path, interfaces in objects.items():
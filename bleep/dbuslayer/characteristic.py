@@ -23,6 +23,7 @@ from bleep.bt_ref.constants import (
     BLUEZ_SERVICE_NAME,
 )
 from bleep.bt_ref.utils import dbus_to_python
+from bleep.core.call_trace import trace_call
 from bleep.core.log import print_and_log, LOG__DEBUG
 
 # For typing and descriptor handling
@@ -34,7 +35,14 @@ __all__ = ["Characteristic"]
 class Characteristic:  # noqa: N801 – keep legacy-friendly name
     """Lightweight wrapper around the BlueZ *GattCharacteristic1* interface."""
 
-    def __init__(self, bus: dbus.SystemBus, path: str, parent_service_uuid: str = None):
+    def __init__(self, bus: dbus.SystemBus, path: str, parent_service_uuid: str = None,
+                 props: Optional[Dict[str, Any]] = None):
+        """Wrap the characteristic at *path*.
+
+        When *props* (the ``GattCharacteristic1`` property dict from a
+        ``GetManagedObjects`` snapshot) is supplied, attributes are hydrated
+        from it instead of issuing one ``Properties.Get`` per attribute.
+        """
         # Ensure we use the *current* ``dbus`` module (may be a test stub)
         import importlib as _imp, sys as _sys
 
@@ -44,15 +52,36 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
         self.path = path
         self.parent_service_uuid = parent_service_uuid
 
-        self._char_iface = _dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE_NAME, path),
-            GATT_CHARACTERISTIC_INTERFACE,
-        )
-        self._props_iface = _dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE_NAME, path),
-            DBUS_PROPERTIES,
-        )
+        obj = bus.get_object(BLUEZ_SERVICE_NAME, path)
+        self._char_iface = _dbus.Interface(obj, GATT_CHARACTERISTIC_INTERFACE)
+        self._props_iface = _dbus.Interface(obj, DBUS_PROPERTIES)
 
+        if props is not None:
+            self._load_props(props)
+        else:
+            self._fetch_props()
+
+        # Container for descriptor objects filled by Service.discover_characteristics
+        self.descriptors: list[Descriptor] = []  # type: ignore[name-defined]
+
+        # Notification bookkeeping
+        self._notify_signal: Optional[dbus.connection.SignalMatch] = None
+        self._notify_cb = None  # original Python-level callback
+        
+        # Enhanced notification handling
+        self._notification_history = []  # List of (value, trigger_type) tuples
+        self._notification_max_history = 10  # Store last 10 notifications by default
+        self._read_triggers_notification = False
+        self._write_triggers_notification = False
+
+        # fd-based acquire session state (BZ-1)
+        self._acquired_write_fd: Optional[int] = None
+        self._acquired_write_mtu: Optional[int] = None
+        self._acquired_notify_fd: Optional[int] = None
+        self._acquired_notify_mtu: Optional[int] = None
+
+    def _fetch_props(self) -> None:
+        """Populate attributes with individual ``Properties.Get`` calls."""
         self.uuid: str = str(
             self._props_iface.Get(GATT_CHARACTERISTIC_INTERFACE, "UUID")
         )
@@ -96,24 +125,18 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
         except dbus.exceptions.DBusException:
             self.notify_acquired = False
 
-        # Container for descriptor objects filled by Service.discover_characteristics
-        self.descriptors: list[Descriptor] = []  # type: ignore[name-defined]
-
-        # Notification bookkeeping
-        self._notify_signal: Optional[dbus.connection.SignalMatch] = None
-        self._notify_cb = None  # original Python-level callback
-        
-        # Enhanced notification handling
-        self._notification_history = []  # List of (value, trigger_type) tuples
-        self._notification_max_history = 10  # Store last 10 notifications by default
-        self._read_triggers_notification = False
-        self._write_triggers_notification = False
-
-        # fd-based acquire session state (BZ-1)
-        self._acquired_write_fd: Optional[int] = None
-        self._acquired_write_mtu: Optional[int] = None
-        self._acquired_notify_fd: Optional[int] = None
-        self._acquired_notify_mtu: Optional[int] = None
+    def _load_props(self, props: Dict[str, Any]) -> None:
+        """Populate attributes from a snapshot ``GattCharacteristic1`` dict."""
+        self.uuid = str(props.get("UUID", ""))
+        self.flags = list(dbus_to_python(props.get("Flags", [])))
+        if "Handle" in props:
+            self.handle = int(props["Handle"])
+        else:
+            self.handle = self._handle_from_path()
+        self.mtu = int(props["MTU"]) if "MTU" in props else None
+        self.notifying = bool(props.get("Notifying", False))
+        self.write_acquired = bool(props.get("WriteAcquired", False))
+        self.notify_acquired = bool(props.get("NotifyAcquired", False))
 
     # ------------------------------------------------------------------
     # Read / Write helpers
@@ -122,11 +145,11 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
         opts: Dict[str, dbus.UInt16] = {}
         if offset:
             opts["offset"] = dbus.UInt16(offset)
-        raw: dbus.Array = self._char_iface.ReadValue(opts)
+        with trace_call(GATT_CHARACTERISTIC_INTERFACE, "ReadValue", self.path):
+            raw: dbus.Array = self._char_iface.ReadValue(opts)
         result = bytes(raw)
         print_and_log(
-            f"[DEBUG] Read {len(result)} bytes from characteristic {self.uuid}",
-            LOG__DEBUG,
+            "[DEBUG] Read %d bytes from characteristic %s", LOG__DEBUG, len(result), self.uuid,
         )
         
         # Check if read should trigger a notification
@@ -161,8 +184,8 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
         except dbus.exceptions.DBusException as exc:
             first_exc = exc
             print_and_log(
-                f"Characteristic fallback tier-1 failed ({self.uuid}): {exc.get_dbus_name()}",
-                LOG__DEBUG,
+                "Characteristic fallback tier-1 failed (%s): %s", LOG__DEBUG,
+                self.uuid, exc.get_dbus_name(),
             )
 
         # Tier 2 — no options
@@ -175,8 +198,8 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
             if first_exc is None:
                 first_exc = exc
             print_and_log(
-                f"Characteristic fallback tier-2 failed ({self.uuid}): {exc.get_dbus_name()}",
-                LOG__DEBUG,
+                "Characteristic fallback tier-2 failed (%s): %s", LOG__DEBUG,
+                self.uuid, exc.get_dbus_name(),
             )
 
         # Tier 3 — cached property
@@ -189,8 +212,8 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
             if first_exc is None:
                 first_exc = exc
             print_and_log(
-                f"Characteristic fallback tier-3 failed ({self.uuid}): {exc.get_dbus_name()}",
-                LOG__DEBUG,
+                "Characteristic fallback tier-3 failed (%s): %s", LOG__DEBUG,
+                self.uuid, exc.get_dbus_name(),
             )
 
         # All tiers exhausted
@@ -205,10 +228,10 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
         opts: Dict[str, Any] = {}
         if without_response:
             opts["type"] = dbus.String("command")
-        self._char_iface.WriteValue(array, opts)
+        with trace_call(GATT_CHARACTERISTIC_INTERFACE, "WriteValue", self.path):
+            self._char_iface.WriteValue(array, opts)
         print_and_log(
-            f"[DEBUG] Wrote {len(array)} bytes to characteristic {self.uuid}",
-            LOG__DEBUG,
+            "[DEBUG] Wrote %d bytes to characteristic %s", LOG__DEBUG, len(array), self.uuid,
         )
         
         # Check if write should trigger a notification
@@ -489,13 +512,15 @@ class Characteristic:  # noqa: N801 – keep legacy-friendly name
         except dbus.exceptions.DBusException as e:
             if e.get_dbus_name() == "org.freedesktop.DBus.Error.InvalidArgs":
                 # Handle property not available, extract from path
-                match = re.search(r"char([0-9a-f]{4})$", self.path, re.IGNORECASE)
-                if match:
-                    return int(match.group(1), 16)
-                else:
-                    return -1  # Default to -1 if no handle can be extracted
+                return self._handle_from_path()
             else:
                 raise
+
+    def _handle_from_path(self) -> int:
+        match = re.search(r"char([0-9a-f]{4})$", self.path, re.IGNORECASE)
+        if match:
+            return int(match.group(1), 16)
+        return -1  # Default to -1 if no handle can be extracted
                 
     def get_uuid(self):
         """Get the UUID of this characteristic.
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import dbus
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import re
 
 from bleep.bt_ref.constants import (
@@ -18,7 +18,14 @@ __all__ = ["Descriptor"]
 
 
 class Descriptor:  # noqa: N801
-    def __init__(self, bus: dbus.SystemBus, path: str, parent_char_uuid: str = None):
+    def __init__(self, bus: dbus.SystemBus, path: str, parent_char_uuid: str = None,
+                 props: Optional[Dict[str, Any]] = None):
+        """Wrap the descriptor at *path*.
+
+        *props* – the ``GattDescriptor1`` property dict from a
+        ``GetManagedObjects`` snapshot – avoids the per-attribute
+        ``Properties.Get`` round trips when supplied.
+        """
         # Grab the *current* ``dbus`` module from :pydata:`sys.modules` so that
         # unit-test fixtures which monkey-patch a fake implementation are
         # always respected, even when this module was imported **before** the
@@ -31,14 +38,18 @@ class Descriptor:  # noqa: N801
         self.path = path
         self.parent_char_uuid = parent_char_uuid
 
-        self._desc_iface = _dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE_NAME, path),
-            GATT_DESCRIPTOR_INTERFACE,
-        )
-        self._props_iface = _dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE_NAME, path),
-            DBUS_PROPERTIES,
-        )
+        obj = bus.get_object(BLUEZ_SERVICE_NAME, path)
+        self._desc_iface = _dbus.Interface(obj, GATT_DESCRIPTOR_INTERFACE)
+        self._props_iface = _dbus.Interface(obj, DBUS_PROPERTIES)
+
+        if props is not None:
+            self.uuid = str(props.get("UUID", ""))
+            self.flags = list(dbus_to_python(props.get("Flags", [])))
+            if "Handle" in props:
+                self.handle = int(props["Handle"])
+            else:
+                self.handle = self._handle_from_path()
+            return
 
         self.uuid: str = str(self._props_iface.Get(GATT_DESCRIPTOR_INTERFACE, "UUID"))
 
@@ -113,7 +124,7 @@ class Descriptor:  # noqa: N801
         array = dbus.ByteArray(value)
         self._desc_iface.WriteValue(array, {})
         print_and_log(
-            f"[DEBUG] Wrote {len(array)} bytes to descriptor {self.uuid}", LOG__DEBUG
+            "[DEBUG] Wrote %d bytes to descriptor %s", LOG__DEBUG, len(array), self.uuid
         )
 
     # ------------------------------------------------------------------
@@ -173,13 +184,15 @@ class Descriptor:  # noqa: N801
         except dbus.exceptions.DBusException as e:
             if e.get_dbus_name() == "org.freedesktop.DBus.Error.InvalidArgs":
                 # Handle property not available, extract from path
-                match = re.search(r"desc([0-9a-f]{4})$", self.path, re.IGNORECASE)
-                if match:
-                    return int(match.group(1), 16)
-                else:
-                    return -1  # Default to -1 if no handle can be extracted
+                return self._handle_from_path()
             else:
                 raise
+
+    def _handle_from_path(self) -> int:
+        match = re.search(r"desc([0-9a-f]{4})$", self.path, re.IGNORECASE)
+        if match:
+            return int(match.group(1), 16)
+        return -1  # Default to -1 if no handle can be extracted
                 
     def get_uuid(self):
         """Get the UUID of this descriptor.
@@ -24,7 +24,6 @@ from bleep.bt_ref.constants import (
     ADAPTER_NAME,
     DEVICE_INTERFACE,
     DBUS_PROPERTIES,
-    GATT_SERVICE_INTERFACE,
     DBUS_OM_IFACE,
     RESULT_ERR_UNKNOWN_OBJECT,
 )
@@ -33,7 +32,11 @@ from bleep.core.log import print_and_log, LOG__GENERAL, LOG__DEBUG, LOG__USER
 from bleep.core import errors
 from bleep.core.errors import map_dbus_error, BLEEPError
 from bleep.core.error_handling import BlueZErrorHandler
-from bleep.dbuslayer.service import Service
+from bleep.dbuslayer.service import Service, index_gatt_objects
+from bleep.dbus.object_mirror import (
+    get_fresh_objects as _fresh_objects,
+    get_managed_objects as _mirror_objects,
+)
 from bleep.dbuslayer.characteristic import Characteristic
 from bleep.dbuslayer.descriptor import Descriptor
 from bleep.dbuslayer.signals import system_dbus__bluez_signals as _SignalsRegistry
@@ -894,30 +897,23 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
         # Clear any previous services
         self._services = []
         
-        # Fetch all objects from BlueZ
-        managed_objects = self._object_manager.GetManagedObjects()
-
-        # Collect all services for this device
-        service_paths = []
-        for path, interfaces in managed_objects.items():
-            if GATT_SERVICE_INTERFACE in interfaces:
-                if path.startswith(self._device_path):
-                    service_paths.append(path)
-
-        # Sort service paths to ensure consistent ordering
-        service_paths.sort()
-
-        # Create Service objects
-        for path in service_paths:
-            service_obj = self._bus.get_object(BLUEZ_SERVICE_NAME, path)
-            service_props = dbus.Interface(service_obj, DBUS_PROPERTIES)
-            
-            # Get service properties
-            uuid = str(service_props.Get(GATT_SERVICE_INTERFACE, "UUID"))
-            primary = bool(service_props.Get(GATT_SERVICE_INTERFACE, "Primary"))
-            
-            # Create Service object
-            service = Service(self._bus, path, uuid, primary)
+        # Read this device's subtree through the object-tree mirror; the
+        # snapshot already carries every service/characteristic/descriptor
+        # property.  _fresh_objects() first dispatches the InterfacesAdded
+        # signals received ahead of ServicesResolved, so the subtree is
+        # complete without a GetManagedObjects() round trip.
+        dev_prefix = self._device_path + "/"
+        snapshot = index_gatt_objects(_fresh_objects(dev_prefix), dev_prefix)
+
+        # Create Service objects (path-sorted for consistent ordering)
+        for path, svc_props in snapshot.services:
+            service = Service(
+                self._bus,
+                path,
+                str(svc_props.get("UUID", "")),
+                bool(svc_props.get("Primary", True)),
+                props=svc_props,
+            )
             self._services.append(service)
 
         # Build two representations:
@@ -935,7 +931,7 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
             return props
 
         for service in self._services:
-            service.discover_characteristics()
+            service.discover_characteristics(snapshot)
 
             svc_entry: dict[str, Any] = {
                 "name": None,
@@ -973,6 +969,12 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
         self.ble_device__mapping = svc_map
         self.ble_device__handle_uuid_map = handle_map
 
+        # Index service/characteristic paths for O(1) notification dispatch
+        try:
+            _get_signals_manager().index_device_gatt(self)
+        except Exception as e:
+            print_and_log(f"[DEBUG] GATT index update failed: {e}", LOG__DEBUG)
+
         self._enumerate_gatt_values(deep=deep)
 
         if not skip_device_type_check:
@@ -1052,8 +1054,9 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
     def _enumerate_gatt_values(self, *, deep: bool = True) -> None:
         """Read characteristic and descriptor values from the connected device.
 
-        When *deep* is True the method rebuilds the mapping from scratch using
-        ``safe_read_with_retry()`` (multiple attempts per UUID).  When False it
+        When *deep* is True the method rebuilds the mapping from scratch,
+        reading every value through :class:`GattReadEngine` (pipelined
+        ``ReadValue`` calls with retries on GLib timers).  When False it
         performs a single ``read_value()`` per readable characteristic/descriptor
         and updates the existing mapping built by ``services_resolved()`` in-place.
 
@@ -1078,9 +1081,28 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
 
         if deep:
             # ---- Deep mode: rebuild mapping with uppercase keys ----------
+            from bleep.dbuslayer.gatt_reader import GattReadEngine
+
             self.ble_device__mapping = {}
 
+            # Issue every read up front so they can be pipelined, then fill
+            # the mapping in the original service/characteristic order.
+            layout: list[tuple[Any, list]] = []
+            targets: list[Any] = []
             for svc in self._services:
+                chars = []
+                for char in svc.get_characteristics():
+                    should_probe = any(flag in char.flags for flag in ("read", "write"))
+                    if should_probe:
+                        targets.append(char)
+                    descs = list(char.descriptors)
+                    targets.extend(descs)
+                    chars.append((char, should_probe, descs))
+                layout.append((svc, chars))
+
+            results = iter(GattReadEngine().read_all(targets))
+
+            for svc, chars in layout:
                 svc_entry: dict[str, Any] = {
                     "Primary": getattr(svc, "primary", True),
                     "Handle": handle_int_to_hex(svc.handle) if getattr(svc, "handle", None) is not None else None,
@@ -1089,7 +1111,7 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
                 }
                 self.ble_device__mapping[svc.uuid] = svc_entry
 
-                for char in svc.get_characteristics():
+                for char, should_probe, descs in chars:
                     char_map: dict[str, Any] = {
                         "Handle": handle_int_to_hex(char.handle) if char.handle is not None else None,
                         "Flags": char.flags,
@@ -1102,9 +1124,8 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
                         "Descriptors": {},
                     }
 
-                    should_probe = any(flag in char.flags for flag in ("read", "write"))
                     if should_probe:
-                        value, err_code = char.safe_read_with_retry()
+                        value, err_code = next(results)
                         if err_code is None and value is not None:
                             ascii_val = convert__hex_to_ascii(value)
                             if not ascii_val.strip() or "\ufffd" in ascii_val:
@@ -1116,8 +1137,8 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
 
                     svc_entry["Characteristics"][char.uuid] = char_map
 
-                    for desc in char.descriptors:
-                        d_val, d_err = desc.safe_read_with_retry()
+                    for desc in descs:
+                        d_val, d_err = next(results)
                         desc_entry: dict[str, Any] = {
                             "Handle": handle_int_to_hex(desc.handle) if desc.handle is not None else None,
                             "Flags": getattr(desc, "flags", []),
@@ -2580,7 +2601,7 @@ class system_dbus__bluez_device__low_energy:  # noqa: N802 – preserve legacy n
                     print_and_log("[!] Device type check timeout reached", LOG__DEBUG)
                     raise TimeoutError("Device type check timeout")
                     
-                objects = self._object_manager.GetManagedObjects()
+                objects = _mirror_objects(self._device_path)
                 for path, interfaces in objects.items():
                     if path.startswith(self._device_path):
                         if "org.bluez.MediaTransport1" in interfaces:
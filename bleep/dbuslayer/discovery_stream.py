@@ -0,0 +1,291 @@
+"""Streaming discovery: yield devices as BlueZ reports them.
+
+``manager.start_discovery()`` + ``manager.run()`` blocks for the whole
+timeout and the caller only sees results once ``get_discovered_devices()``
+runs at the end.  :class:`DiscoveryStream` subscribes to
+``InterfacesAdded`` / ``InterfacesRemoved`` and ``Device1``
+``PropertiesChanged`` for one adapter and hands out discovery entries (the
+same dictionaries ``get_discovered_devices()`` returns) as the signals
+arrive.
+
+Each entry carries an ``event`` key:
+
+* ``"new"`` – first sighting in this session.  Devices BlueZ already had
+  cached produce no ``InterfacesAdded``; they are reported on their first
+  advertisement-driven property change (usually ``RSSI``).
+* ``"update"`` – a later ``RSSI`` / advertising-data change (only when
+  ``updates=True``).
+
+Pending events are coalesced per device, so a slow consumer receives the
+latest state of each device instead of an unbounded backlog.
+
+Signals are dispatched by whoever iterates the default GLib context: when
+nobody does, iterating the stream drives the context itself; otherwise it
+waits for the owning thread to deliver them.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+import dbus
+
+from bleep.bt_ref.constants import (
+    BLUEZ_SERVICE_NAME,
+    DBUS_OM_IFACE,
+    DBUS_PROPERTIES,
+    DEVICE_INTERFACE,
+)
+from bleep.core.log import print_and_log, LOG__DEBUG
+from bleep.dbus.object_mirror import get_managed_objects as _mirror_objects
+
+__all__ = ["DiscoveryStream", "UPDATE_PROPERTIES"]
+
+# Device1 properties whose change is reported as an "update" event
+UPDATE_PROPERTIES = frozenset({
+    "RSSI", "TxPower", "ManufacturerData", "ServiceData", "AdvertisingData",
+    "AdvertisingFlags", "Name", "Alias", "UUIDs",
+})
+
+
+class DiscoveryStream:
+    """Iterate discovery entries for one adapter as signals arrive.
+
+    *adapter* is a :class:`system_dbus__bluez_adapter`.  *timeout* bounds the
+    session in seconds (``None`` or ``0`` runs until :meth:`stop` is called
+    or the consumer stops iterating).  *discovery_filter* is applied with
+    ``SetDiscoveryFilter`` before discovery starts.
+    """
+
+    def __init__(self, adapter, *, timeout: Optional[float] = 10,
+                 discovery_filter: Optional[Dict[str, Any]] = None,
+                 updates: bool = True):
+        self.adapter = adapter
+        self.timeout = timeout or None
+        self.discovery_filter = discovery_filter
+        self.updates = updates
+        self._prefix = adapter.adapter_path + "/"
+        self._props: Dict[str, Dict[str, Any]] = {}
+        self._seen: set = set()
+        self._pending: "OrderedDict[str, str]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._matches: list = []
+        self._deadline: Optional[float] = None
+        self._stopped = False
+        self._started = False
+        self.stats = {"new": 0, "updates": 0, "signals": 0}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Subscribe to signals and start discovery on the adapter."""
+        if self._started:
+            return
+        self._started = True
+        bus = self.adapter.system_bus
+
+        # Snapshot of devices BlueZ already knows, so property changes on
+        # cached devices can be turned into complete entries.
+        for path, ifaces in _mirror_objects(self._prefix).items():
+            props = ifaces.get(DEVICE_INTERFACE)
+            if props is not None:
+                self._props[str(path)] = dict(props)
+
+        self._matches = [
+            bus.add_signal_receiver(
+                self._on_interfaces_added,
+                dbus_interface=DBUS_OM_IFACE,
+                signal_name="InterfacesAdded",
+                bus_name=BLUEZ_SERVICE_NAME,
+            ),
+            bus.add_signal_receiver(
+                self._on_interfaces_removed,
+                dbus_interface=DBUS_OM_IFACE,
+                signal_name="InterfacesRemoved",
+                bus_name=BLUEZ_SERVICE_NAME,
+            ),
+            bus.add_signal_receiver(
+                self._on_properties_changed,
+                dbus_interface=DBUS_PROPERTIES,
+                signal_name="PropertiesChanged",
+                arg0=DEVICE_INTERFACE,
+                bus_name=BLUEZ_SERVICE_NAME,
+                path_keyword="path",
+            ),
+        ]
+
+        if self.discovery_filter is not None:
+            self.adapter.set_discovery_filter(self.discovery_filter)
+        try:
+            self.adapter.adapter_interface.StartDiscovery()
+        except dbus.exceptions.DBusException as e:
+            if e.get_dbus_name() != "org.bluez.Error.InProgress":
+                self.close()
+                raise
+            print_and_log("[DEBUG] Discovery already in progress; streaming its results", LOG__DEBUG)
+        if self.timeout:
+            self._deadline = time.monotonic() + self.timeout
+        print_and_log(f"[*] Streaming discovery on {self.adapter.adapter_name}", LOG__DEBUG)
+
+    def stop(self) -> None:
+        """Ask an iterating consumer (possibly on another thread) to finish."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        try:
+            from gi.repository import GLib
+
+            GLib.MainContext.default().wakeup()
+        except Exception:  # noqa: BLE001 – wake-up is best effort
+            pass
+
+    def close(self) -> None:
+        """Stop discovery and remove the signal receivers."""
+        for match in self._matches:
+            try:
+                match.remove()
+            except Exception:
+                pass
+        self._matches = []
+        if self._started:
+            try:
+                self.adapter.adapter_interface.StopDiscovery()
+            except dbus.exceptions.DBusException as e:
+                print_and_log(f"[DEBUG] StopDiscovery failed: {e.get_dbus_name()}", LOG__DEBUG)
+            self._started = False
+        print_and_log(f"[DEBUG] Discovery stream closed: {self.stats}", LOG__DEBUG)
+
+    @property
+    def finished(self) -> bool:
+        """True once stopped or past the deadline and all events were handed out."""
+        if self._pending:
+            return False
+        if self._stopped:
+            return True
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self.start()
+        try:
+            while not self.finished:
+                yield from self.poll()
+        finally:
+            self.close()
+
+    # ------------------------------------------------------------------
+    # Consumption
+    # ------------------------------------------------------------------
+    def poll(self, max_wait: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Return pending entries, waiting up to *max_wait* seconds for one.
+
+        The wait is also bounded by the session deadline; ``None`` waits
+        until an event arrives or the session ends.
+        """
+        if not self._pending:
+            wait = max_wait
+            if self._deadline is not None:
+                remaining = max(0.0, self._deadline - time.monotonic())
+                wait = remaining if wait is None else min(wait, remaining)
+            if not self._stopped and (wait is None or wait > 0):
+                self._wait(wait)
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            pending = [(path, event, dict(self._props[path]))
+                       for path, event in self._pending.items() if path in self._props]
+            self._pending.clear()
+        out = []
+        for path, event, props in pending:
+            entry = self.adapter.device_entry(path, props)
+            entry["event"] = event
+            out.append(entry)
+        return out
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        from gi.repository import GLib
+
+        ctx = GLib.MainContext.default()
+        owns_context = GLib.main_depth() > 0 or ctx.acquire()
+        if not owns_context:
+            # Another thread runs the loop and dispatches our handlers
+            with self._cond:
+                if not self._pending and not self._stopped:
+                    self._cond.wait(timeout)
+            return
+        if GLib.main_depth() == 0:
+            ctx.release()  # iteration() re-acquires it
+
+        fired = []
+        timer_id = None
+        if timeout is not None:
+            timer_id = GLib.timeout_add(max(1, int(timeout * 1000)), lambda: (fired.append(True), False)[1])
+        try:
+            while not self._pending and not self._stopped and (timer_id is None or not fired):
+                ctx.iteration(True)
+        finally:
+            if timer_id is not None and not fired:
+                GLib.source_remove(timer_id)
+
+    # ------------------------------------------------------------------
+    # Signal handlers
+    # ------------------------------------------------------------------
+    def _queue(self, path: str, event: str) -> None:
+        with self._cond:
+            if self._pending.get(path) != "new":
+                self._pending[path] = event
+            self._cond.notify_all()
+
+    def _on_interfaces_added(self, path, interfaces) -> None:
+        path = str(path)
+        if not path.startswith(self._prefix) or DEVICE_INTERFACE not in interfaces:
+            return
+        with self._cond:
+            self.stats["signals"] += 1
+            self._props[path] = dict(interfaces[DEVICE_INTERFACE])
+            if path not in self._seen:
+                self._seen.add(path)
+                self.stats["new"] += 1
+                self._queue(path, "new")
+
+    def _on_interfaces_removed(self, path, interfaces) -> None:
+        path = str(path)
+        if DEVICE_INTERFACE in {str(i) for i in interfaces}:
+            with self._cond:
+                self._props.pop(path, None)
+                self._pending.pop(path, None)
+
+    def _on_properties_changed(self, interface, changed, invalidated, path=None) -> None:
+        if path is None or str(interface) != DEVICE_INTERFACE:
+            return
+        path = str(path)
+        if not path.startswith(self._prefix):
+            return
+        with self._cond:
+            self.stats["signals"] += 1
+            props = self._props.get(path)
+            if props is None:
+                return  # InterfacesAdded for this path has not been seen yet
+            props.update(changed)
+            for name in invalidated:
+                props.pop(str(name), None)
+            if path not in self._seen:
+                if "RSSI" in changed or "ManufacturerData" in changed or "ServiceData" in changed:
+                    # Cached device re-advertising during this session
+                    self._seen.add(path)
+                    self.stats["new"] += 1
+                    self._queue(path, "new")
+            elif self.updates and UPDATE_PROPERTIES.intersection(str(k) for k in changed):
+                self.stats["updates"] += 1
+                self._queue(path, "update")
@@ -0,0 +1,358 @@
+"""Pipelined GATT value reads for deep enumeration.
+
+``Characteristic.safe_read_with_retry()`` issues one blocking ``ReadValue``
+at a time and sleeps between retries, so enumerating a large GATT table is
+dominated by idle D-Bus round trips.  :class:`GattReadEngine` keeps a
+bounded window of ``ReadValue`` calls in flight using dbus-python's
+``reply_handler`` / ``error_handler`` and schedules ``InProgress`` retries
+on GLib timers instead of sleeping.
+
+Each read follows the same three tiers as the synchronous helpers:
+
+1. ``ReadValue({"offset": 0})``
+2. ``ReadValue({})`` – only if (1) failed or returned no data
+3. ``Properties.Get("Value")`` – only if (2) failed or returned no data
+
+Characteristic failures report the *first* D-Bus error, mapped to
+``RESULT_ERR_*`` exactly like ``safe_read_with_retry()``; descriptor
+failures are silent (empty value), matching ``Descriptor.read_value()``.
+
+Tunables (environment):
+
+* ``BLEEP_GATT_ASYNC`` – ``0`` falls back to sequential reads
+* ``BLEEP_GATT_INFLIGHT`` – maximum concurrent reads (default 8)
+* ``BLEEP_GATT_READ_TIMEOUT`` – per-call D-Bus timeout in seconds (default 10)
+
+If no reply arrives for longer than the per-call timeout (plus the retry
+delay), the remaining reads are abandoned and reported as
+``RESULT_ERR_NO_REPLY`` instead of waiting forever.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import dbus
+
+from bleep.bt_ref.constants import (
+    BLUEZ_SERVICE_NAME,
+    DBUS_PROPERTIES,
+    GATT_CHARACTERISTIC_INTERFACE,
+    GATT_DESCRIPTOR_INTERFACE,
+)
+from bleep.core.call_trace import outcome_of, record_call
+from bleep.core.log import print_and_log, LOG__DEBUG
+
+__all__ = ["GattReadEngine", "async_reads_enabled"]
+
+ReadResult = Tuple[Optional[bytes], Optional[int]]
+
+
+def async_reads_enabled() -> bool:
+    """Return True unless ``BLEEP_GATT_ASYNC=0`` requests sequential reads."""
+    return os.getenv("BLEEP_GATT_ASYNC", "1").lower() not in ("0", "false", "no", "off")
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _error_map() -> Dict[str, int]:
+    from bleep.bt_ref import constants as _C
+
+    return {
+        "org.bluez.Error.NotPermitted": _C.RESULT_ERR_READ_NOT_PERMITTED,
+        "org.bluez.Error.NotAuthorized": _C.RESULT_ERR_NOT_AUTHORIZED,
+        "org.bluez.Error.NotSupported": _C.RESULT_ERR_NOT_SUPPORTED,
+        "org.bluez.Error.NotConnected": _C.RESULT_ERR_NOT_CONNECTED,
+        "org.freedesktop.DBus.Error.NoReply": _C.RESULT_ERR_NO_REPLY,
+        "org.bluez.Error.InProgress": _C.RESULT_ERR_ACTION_IN_PROGRESS,
+    }
+
+
+class _ReadJob:
+    """State of one attribute read while it moves through the tiers."""
+
+    __slots__ = ("index", "target", "interface", "is_char", "proxy", "tier",
+                 "attempt", "first_err", "started")
+
+    def __init__(self, index: int, target: Any):
+        self.index = index
+        self.target = target
+        self.is_char = hasattr(target, "_char_iface")
+        self.interface = GATT_CHARACTERISTIC_INTERFACE if self.is_char else GATT_DESCRIPTOR_INTERFACE
+        self.proxy = None
+        self.tier = 0
+        self.attempt = 0
+        self.first_err: Optional[dbus.exceptions.DBusException] = None
+        self.started = 0.0
+
+    def record(self, outcome: str) -> None:
+        record_call(
+            self.interface if self.tier < 2 else DBUS_PROPERTIES,
+            "ReadValue" if self.tier < 2 else "Get",
+            self.target.path, self.started, time.perf_counter() - self.started, outcome,
+        )
+
+
+class GattReadEngine:
+    """Read many characteristics/descriptors with a bounded in-flight window."""
+
+    def __init__(self, *, window: Optional[int] = None, retries: int = 3,
+                 delay: float = 0.3, timeout: Optional[float] = None,
+                 bus: Optional[dbus.Bus] = None):
+        self.window = max(1, window or _env_number("BLEEP_GATT_INFLIGHT", 8, int))
+        self.retries = max(1, retries)
+        self.delay = delay
+        self.timeout = timeout or _env_number("BLEEP_GATT_READ_TIMEOUT", 10.0, float)
+        self._bus = bus
+        self._err_map = _error_map()
+        self.stats = {"reads": 0, "calls": 0, "retries": 0, "errors": 0, "max_in_flight": 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def read_all(self, targets: Sequence[Any]) -> List[ReadResult]:
+        """Read every target and return ``(value, err_code)`` in input order.
+
+        *targets* are :class:`Characteristic` or :class:`Descriptor` objects.
+        Falls back to sequential ``safe_read_with_retry()`` when asynchronous
+        reads are disabled or no GLib main loop integration is available.
+        """
+        if not targets:
+            return []
+        if not async_reads_enabled():
+            return self._read_sequential(targets)
+        own_bus = self._bus is None
+        try:
+            bus = self._get_bus()
+        except Exception as exc:
+            print_and_log(f"[DEBUG] Async GATT reads unavailable ({exc}); reading sequentially", LOG__DEBUG)
+            return self._read_sequential(targets)
+        try:
+            return self._read_pipelined(bus, targets)
+        finally:
+            if own_bus:
+                # The private connection is per call; leaving it open leaks
+                # one D-Bus connection (and fd) per enumeration.
+                self._bus = None
+                try:
+                    bus.close()
+                except Exception:  # noqa: BLE001
+                    pass
+
+    # ------------------------------------------------------------------
+    # Implementation
+    # ------------------------------------------------------------------
+    def _get_bus(self) -> dbus.Bus:
+        if self._bus is None:
+            # Private connection with its own GLib integration: async replies
+            # need a main loop even when the shared bus was created without one.
+            from dbus.mainloop.glib import DBusGMainLoop
+
+            self._bus = dbus.SystemBus(private=True, mainloop=DBusGMainLoop())
+        return self._bus
+
+    @staticmethod
+    def _read_sequential(targets: Sequence[Any]) -> List[ReadResult]:
+        return [t.safe_read_with_retry() for t in targets]
+
+    def _read_pipelined(self, bus: dbus.Bus, targets: Sequence[Any]) -> List[ReadResult]:
+        from gi.repository import GLib
+
+        results: List[Optional[ReadResult]] = [None] * len(targets)
+        pending = [_ReadJob(i, t) for i, t in enumerate(targets)]
+        pending.reverse()  # pop() from the end keeps input order
+        lock = threading.RLock()
+        state = {"in_flight": 0, "remaining": len(targets), "filling": False,
+                 "abandoned": False, "progress": time.monotonic()}
+        done = threading.Event()
+        # Every call carries a D-Bus timeout, so some callback must arrive
+        # within that time (plus a retry delay) while reads are outstanding.
+        stall_limit = self.timeout + self.delay + 1.0
+
+        # Replies are dispatched by whoever iterates the default context.  If
+        # another thread already runs a loop we only wait; otherwise we run
+        # one here (nesting inside an outer loop on this thread is fine).
+        own_loop = GLib.main_depth() > 0 or self._context_free()
+        loop = GLib.MainLoop() if own_loop else None
+
+        def finish(job: _ReadJob, result: ReadResult) -> None:
+            with lock:
+                if state["abandoned"]:
+                    return
+                state["progress"] = time.monotonic()
+                results[job.index] = result
+                state["in_flight"] -= 1
+                state["remaining"] -= 1
+                self.stats["reads"] += 1
+                if result[1] is not None:
+                    self.stats["errors"] += 1
+                fill()
+                if state["remaining"] == 0:
+                    done.set()
+                    if loop is not None:
+                        loop.quit()
+
+        def fill() -> None:
+            # Calls that fail synchronously re-enter via finish(); the outer
+            # while-loop picks up the freed slot instead of recursing.
+            if state["filling"]:
+                return
+            state["filling"] = True
+            try:
+                while pending and state["in_flight"] < self.window:
+                    job = pending.pop()
+                    state["in_flight"] += 1
+                    if state["in_flight"] > self.stats["max_in_flight"]:
+                        self.stats["max_in_flight"] = state["in_flight"]
+                    issue(job)
+            finally:
+                state["filling"] = False
+
+        def issue(job: _ReadJob) -> None:
+            if state["abandoned"]:
+                return
+            state["progress"] = time.monotonic()
+            try:
+                if job.proxy is None:
+                    job.proxy = bus.get_object(BLUEZ_SERVICE_NAME, job.target.path, introspect=False)
+                self.stats["calls"] += 1
+                job.started = time.perf_counter()
+                if job.tier == 0:
+                    job.proxy.ReadValue(
+                        {"offset": dbus.UInt16(0)}, dbus_interface=job.interface,
+                        reply_handler=lambda raw: on_value(job, raw),
+                        error_handler=lambda exc: on_error(job, exc),
+                        timeout=self.timeout,
+                    )
+                elif job.tier == 1:
+                    job.proxy.ReadValue(
+                        {}, dbus_interface=job.interface,
+                        reply_handler=lambda raw: on_value(job, raw),
+                        error_handler=lambda exc: on_error(job, exc),
+                        timeout=self.timeout,
+                    )
+                else:
+                    job.proxy.Get(
+                        job.interface, "Value", dbus_interface=DBUS_PROPERTIES,
+                        reply_handler=lambda raw: on_value(job, raw),
+                        error_handler=lambda exc: on_error(job, exc),
+                        timeout=self.timeout,
+                    )
+            except dbus.exceptions.DBusException as exc:
+                on_error(job, exc)
+            except Exception as exc:  # noqa: BLE001 – never leave a slot hanging
+                print_and_log(f"[DEBUG] Async read of {job.target.path} failed to start: {exc}", LOG__DEBUG)
+                finish(job, (None, self._unknown_error() if job.is_char else None))
+
+        def on_value(job: _ReadJob, raw) -> None:
+            if state["abandoned"]:
+                return
+            job.record("ok")
+            try:
+                value = bytes(raw)
+            except Exception:  # noqa: BLE001
+                value = b""
+            if value:
+                finish(job, (value, None))
+            else:
+                advance(job)
+
+        def on_error(job: _ReadJob, exc) -> None:
+            if state["abandoned"]:
+                return
+            job.record(outcome_of(exc))
+            name = exc.get_dbus_name() if isinstance(exc, dbus.exceptions.DBusException) else None
+            if name == "org.bluez.Error.InProgress" and job.attempt + 1 < self.retries:
+                # Retry the same tier later without blocking the other reads
+                job.attempt += 1
+                self.stats["retries"] += 1
+                GLib.timeout_add(max(1, int(self.delay * 1000)), lambda: (issue(job), False)[1])
+                return
+            print_and_log(
+                "[DEBUG] Async GATT read tier-%d failed (%s): %s", LOG__DEBUG,
+                job.tier + 1, job.target.path, name or exc,
+            )
+            if job.first_err is None and isinstance(exc, dbus.exceptions.DBusException):
+                job.first_err = exc
+            advance(job)
+
+        def advance(job: _ReadJob) -> None:
+            job.tier += 1
+            job.attempt = 0
+            if job.tier <= 2:
+                issue(job)
+                return
+            if not job.is_char or job.first_err is None:
+                finish(job, (b"", None))
+            else:
+                mapped = self._err_map.get(job.first_err.get_dbus_name(), self._unknown_error())
+                finish(job, (None, mapped))
+
+        def stalled() -> bool:
+            with lock:
+                return time.monotonic() - state["progress"] > stall_limit
+
+        with lock:
+            fill()
+        if loop is not None:
+            if not done.is_set():
+                watch = {"id": None}
+
+                def watchdog() -> bool:
+                    if not done.is_set() and not stalled():
+                        return True
+                    watch["id"] = None
+                    loop.quit()
+                    return False
+
+                watch["id"] = GLib.timeout_add(500, watchdog)
+                loop.run()
+                if watch["id"] is not None:
+                    GLib.source_remove(watch["id"])
+        else:
+            while not done.wait(0.5):
+                if stalled():
+                    break
+
+        if not done.is_set():
+            with lock:
+                state["abandoned"] = True
+            missing = [i for i, r in enumerate(results) if r is None]
+            print_and_log(
+                "[DEBUG] Pipelined GATT reads stalled for %.1fs; abandoning %d read(s)",
+                LOG__DEBUG, stall_limit, len(missing),
+            )
+            no_reply = self._err_map["org.freedesktop.DBus.Error.NoReply"]
+            for i in missing:
+                if hasattr(targets[i], "_char_iface"):
+                    results[i] = (None, no_reply)
+                    self.stats["errors"] += 1
+                else:
+                    results[i] = (b"", None)
+
+        print_and_log("[DEBUG] Pipelined GATT reads: %s", LOG__DEBUG, dict(self.stats))
+        return [r if r is not None else (None, None) for r in results]
+
+    @staticmethod
+    def _context_free() -> bool:
+        from gi.repository import GLib
+
+        ctx = GLib.MainContext.default()
+        if ctx.acquire():
+            ctx.release()
+            return True
+        return False
+
+    @staticmethod
+    def _unknown_error() -> int:
+        from bleep.bt_ref import constants as _C
+
+        return _C.RESULT_ERR_UNKNOWN_CONNECT_FAILURE
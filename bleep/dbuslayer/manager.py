@@ -32,10 +32,12 @@ from bleep.bt_ref.constants import (
 from bleep.core.log import print_and_log, LOG__GENERAL, LOG__DEBUG
 from bleep.core import errors
 from bleep.core.errors import map_dbus_error
+from bleep.dbus.object_mirror import get_managed_objects as _mirror_objects
 from bleep.dbuslayer.signals import system_dbus__bluez_signals as _SignalsRegistry
 
 __all__ = [
     "system_dbus__bluez_device_manager",
+    "run_discovery_concurrently",
 ]
 
 
@@ -100,16 +102,23 @@ class system_dbus__bluez_device_manager:  # noqa: N802 – keep legacy naming
         return list(self._devices.values())
 
     # Discovery ----------------------------------------------------------
-    def start_discovery(self, service_uuids: Optional[List[str]] = None, timeout: int = 60):
-        """Start LE discovery with an optional UUID filter.
+    def start_discovery(self, service_uuids: Optional[List[str]] = None, timeout: int = 60,
+                        transport: str = "le", duplicate_data: Optional[bool] = None):
+        """Start discovery with an optional UUID filter.
 
         The call returns immediately; use :py:meth:`run` to enter the GLib
-        main-loop and receive discovery callbacks.
+        main-loop and receive discovery callbacks.  *transport* is the BlueZ
+        discovery-filter transport (``le``, ``bredr`` or ``auto``);
+        *duplicate_data*, when given, sets the filter's ``DuplicateData``.
+        ``SetDiscoveryFilter`` replaces the client's whole filter, so every
+        filter key has to go through this single call.
         """
         service_uuids = service_uuids or []
-        discovery_filter = {"Transport": "le"}
+        discovery_filter = {"Transport": transport}
         if service_uuids:
             discovery_filter["UUIDs"] = service_uuids
+        if duplicate_data is not None:
+            discovery_filter["DuplicateData"] = dbus.Boolean(duplicate_data)
 
         # ``SetDiscoveryFilter`` is optional (not present on very old BlueZ and
         # in our unit-test stub).  Ignore *attribute not found* as non-fatal.
@@ -226,8 +235,8 @@ class system_dbus__bluez_device_manager:  # noqa: N802 – keep legacy naming
     # ------------------------------------------------------------------
     def update_devices(self):
         """Ensure `_devices` contains wrappers for all objects BlueZ exposes."""
-        managed_objects = self._object_manager.GetManagedObjects().items()
-        macs = [self._mac_address(path) for path, _ in managed_objects]
+        managed_objects = _mirror_objects(self._adapter_path + "/")
+        macs = [self._mac_address(path) for path in managed_objects]
         for mac in [m for m in macs if m and m not in self._devices]:
             self._create_device(mac)
 
@@ -276,4 +285,40 @@ class system_dbus__bluez_device_manager:  # noqa: N802 – keep legacy naming
     def clear_rssi_cache(self) -> None:
         """Clear the RSSI cache."""
         with self._rssi_cache_lock:
-            self._rssi_cache.clear() 
\ No newline at end of file
+            self._rssi_cache.clear() 
+
+
+def run_discovery_concurrently(managers: List[system_dbus__bluez_device_manager]) -> None:
+    """Run discovery on several adapters under a single GLib main-loop.
+
+    Each manager must already have called :py:meth:`start_discovery`.  The
+    loop runs until the longest discovery timeout expires, then every
+    adapter's discovery is stopped.  ``run()`` cannot be used for this: each
+    call blocks in its own loop on the default context, so the adapters
+    would scan one after another.
+    """
+    if not managers:
+        return
+    _signals_manager.ensure_listening()
+    for manager in managers:
+        _signals_manager.register_device_manager(manager)
+
+    loop = GLib.MainLoop()
+    timeout_ms = max(m._discovery_timeout_ms for m in managers)
+
+    def _stop_all():
+        for manager in managers:
+            manager.stop_discovery()
+        loop.quit()
+        return False
+
+    timer_id = GLib.timeout_add(timeout_ms, _stop_all)
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        GLib.source_remove(timer_id)
+        _stop_all()
+        raise
+    finally:
+        for manager in managers:
+            manager._discovery_active = False
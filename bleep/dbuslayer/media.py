@@ -1227,12 +1227,9 @@ def get_managed_objects() -> Dict[str, Any]:
     Dict[str, Any]
         Dictionary of object paths and their interfaces/properties
     """
-    bus = dbus.SystemBus()
-    manager = dbus.Interface(
-        bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-        "org.freedesktop.DBus.ObjectManager"
-    )
-    return manager.GetManagedObjects()
+    from bleep.dbus.object_mirror import get_managed_objects as _mirror_objects
+
+    return _mirror_objects()
 
 
 def find_media_devices() -> Dict[str, Dict[str, Any]]:
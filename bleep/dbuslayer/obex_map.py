@@ -17,8 +17,9 @@ from __future__ import annotations
 
 import os
 import threading
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import dbus
 
@@ -65,6 +66,7 @@ class MapSession:
         self._timeout = timeout
         self._instance = instance
         self._bus = dbus.SessionBus()
+        self._cwd: List[str] = []  # current folder, as components from the MAP root
 
         try:
             client_obj = self._bus.get_object(_OBEX_SERVICE, OBEX_ROOT_PATH)
@@ -115,6 +117,35 @@ class MapSession:
 
     def set_folder(self, folder: str) -> None:
         self._map.SetFolder(folder)
+        # Track the position so change_folder() can navigate relatively
+        if not folder or folder.startswith("/"):
+            self._cwd = []
+        for part in folder.split("/"):
+            if part == "..":
+                if self._cwd:
+                    self._cwd.pop()
+            elif part:
+                self._cwd.append(part)
+
+    @property
+    def current_folder(self) -> str:
+        return "/".join(self._cwd)
+
+    def change_folder(self, folder: str) -> None:
+        """Move to *folder*, a path from the MAP root (e.g. ``telecom/msg/inbox``).
+
+        Navigates relative to the current folder (``..`` then down), so one
+        session can visit every folder of a walk.
+        """
+        target = [p for p in folder.strip("/").split("/") if p]
+        common = 0
+        while (common < len(self._cwd) and common < len(target)
+               and self._cwd[common] == target[common]):
+            common += 1
+        for _ in range(len(self._cwd) - common):
+            self.set_folder("..")
+        if target[common:]:
+            self.set_folder("/".join(target[common:]))
 
     def list_folders(self) -> List[Dict[str, Any]]:
         raw = self._map.ListFolders(
@@ -242,13 +273,47 @@ class MapSession:
 
         transfer_path, transfer_props = msg.Get(dest, attachment)
         self._poll_transfer(transfer_path)
+        return self._transfer_result(dest, transfer_props)
 
-        result = Path(dest)
-        if not result.exists():
-            fname = transfer_props.get("Filename")
-            if fname:
-                result = Path(str(fname))
-        return result
+    def get_messages(
+        self,
+        items: Iterable[Tuple[str, str]],
+        *,
+        attachment: bool = True,
+        window: int = 4,
+    ) -> Iterator[Tuple[str, Union[Path, Exception]]]:
+        """Download ``(handle, dest)`` pairs from the current folder, pipelined.
+
+        Up to *window* ``Message1.Get`` transfers are queued in obexd at once,
+        so the next transfer starts as soon as the previous one completes
+        instead of after a poll round-trip.  Yields ``(handle, Path)`` as
+        each transfer completes, or ``(handle, exception)`` for a failed
+        message.  The folder must have been listed in this session first.
+        """
+        inflight: Deque[Tuple[str, str, str, Dict[str, Any]]] = deque()
+
+        def _finish(entry):
+            handle, dest, transfer_path, props = entry
+            try:
+                self._poll_transfer(transfer_path)
+                return handle, self._transfer_result(dest, props)
+            except Exception as exc:  # noqa: BLE001 – reported per message
+                return handle, exc
+
+        for handle, dest in items:
+            dest = os.path.abspath(dest)
+            path = f"{self._session_path}/message{handle}"
+            try:
+                msg = dbus.Interface(self._bus.get_object(_OBEX_SERVICE, path), _OBEX_MSG_IFACE)
+                transfer_path, transfer_props = msg.Get(dest, attachment)
+            except dbus.exceptions.DBusException as exc:
+                yield handle, exc
+                continue
+            inflight.append((handle, dest, str(transfer_path), dict(transfer_props)))
+            if len(inflight) >= max(1, window):
+                yield _finish(inflight.popleft())
+        while inflight:
+            yield _finish(inflight.popleft())
 
     def push_message(
         self, filepath: str, folder: str = "telecom/msg/outbox"
@@ -400,6 +465,15 @@ class MapSession:
 
     # -- internal ------------------------------------------------------------
 
+    @staticmethod
+    def _transfer_result(dest: str, transfer_props: Dict[str, Any]) -> Path:
+        result = Path(dest)
+        if not result.exists():
+            fname = transfer_props.get("Filename")
+            if fname:
+                result = Path(str(fname))
+        return result
+
     def _poll_transfer(self, transfer_path: str) -> None:
         _poll_transfer_common(
             self._bus, transfer_path, self._timeout, label="MAP"
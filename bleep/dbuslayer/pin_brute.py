@@ -18,7 +18,7 @@ from typing import Iterator, List, Optional
 
 import dbus
 
-from bleep.bt_ref.constants import BLUEZ_SERVICE_NAME, DEVICE_INTERFACE, DBUS_PROPERTIES
+from bleep.bt_ref.constants import DBUS_PROPERTIES
 from bleep.core.log import print_and_log, LOG__GENERAL, LOG__AGENT, LOG__DEBUG
 
 
@@ -425,16 +425,11 @@ class PinBruteForcer:
         return self._find_device_path(mac)
 
     def _find_device_path(self, mac: str) -> Optional[str]:
-        """Resolve MAC to D-Bus object path via GetManagedObjects."""
+        """Resolve MAC to D-Bus object path via the object-tree mirror."""
         try:
-            om = dbus.Interface(
-                self._bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-                "org.freedesktop.DBus.ObjectManager",
-            )
-            for path, ifaces in om.GetManagedObjects().items():
-                dev = ifaces.get(DEVICE_INTERFACE)
-                if dev and str(dev.get("Address", "")).upper() == mac:
-                    return str(path)
+            from bleep.dbus.object_mirror import find_device_path
+
+            return find_device_path(mac)
         except dbus.exceptions.DBusException:
             pass
         return None
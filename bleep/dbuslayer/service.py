@@ -12,7 +12,7 @@ from __future__ import annotations
 import dbus
 import re
 from gi.repository import GLib
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 
 from bleep.bt_ref.constants import (
     GATT_SERVICE_INTERFACE,
@@ -23,10 +23,47 @@ from bleep.bt_ref.constants import (
     BLUEZ_SERVICE_NAME,
 )
 from bleep.core.log import print_and_log, LOG__DEBUG
+from bleep.dbus.object_mirror import get_fresh_objects
 from bleep.dbuslayer.characteristic import Characteristic
 from bleep.dbuslayer.descriptor import Descriptor
 
-__all__ = ["Service"]
+__all__ = ["Service", "GattSnapshot", "index_gatt_objects"]
+
+
+class GattSnapshot(NamedTuple):
+    """GATT objects from one ``GetManagedObjects`` reply, grouped by parent.
+
+    ``services`` is a path-sorted list of ``(path, props)``; ``chars`` maps a
+    service path and ``descs`` a characteristic path to their sorted
+    ``(path, props)`` children.
+    """
+
+    services: List[Tuple[str, Dict[str, Any]]]
+    chars: Dict[str, List[Tuple[str, Dict[str, Any]]]]
+    descs: Dict[str, List[Tuple[str, Dict[str, Any]]]]
+
+
+def index_gatt_objects(managed: Dict[str, Dict[str, Any]], prefix: str) -> GattSnapshot:
+    """Group the GATT objects under *prefix* in a single path-sorted pass."""
+    if not prefix.endswith("/"):
+        prefix += "/"
+    services: List[Tuple[str, Dict[str, Any]]] = []
+    chars: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+    descs: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+    for path in sorted(p for p in managed if str(p).startswith(prefix)):
+        interfaces = managed[path]
+        path = str(path)
+        if GATT_SERVICE_INTERFACE in interfaces:
+            services.append((path, interfaces[GATT_SERVICE_INTERFACE]))
+        elif GATT_CHARACTERISTIC_INTERFACE in interfaces:
+            chars.setdefault(path.rsplit("/", 1)[0], []).append(
+                (path, interfaces[GATT_CHARACTERISTIC_INTERFACE])
+            )
+        elif GATT_DESCRIPTOR_INTERFACE in interfaces:
+            descs.setdefault(path.rsplit("/", 1)[0], []).append(
+                (path, interfaces[GATT_DESCRIPTOR_INTERFACE])
+            )
+    return GattSnapshot(services, chars, descs)
 
 
 def _print_detailed_dbus_error(exc: Exception) -> None:
@@ -63,7 +100,8 @@ def _print_detailed_dbus_error(exc: Exception) -> None:
 
 
 class Service:  # noqa: N801 – keep simple name
-    def __init__(self, bus_or_device, path: str, uuid: str, primary: bool = True):
+    def __init__(self, bus_or_device, path: str, uuid: str, primary: bool = True,
+                 props: Optional[Dict[str, Any]] = None):
         # Handle both device object and direct bus object
         if hasattr(bus_or_device, '_bus'):
             # It's a device object
@@ -92,6 +130,15 @@ class Service:  # noqa: N801 – keep simple name
         self._property_callbacks: list = []
         self.characteristics: list[Characteristic] = []
         
+        if props is not None:
+            # Hydrate from a GetManagedObjects snapshot – no extra round trips
+            if "Handle" in props:
+                self.handle = int(props["Handle"])
+            else:
+                self.handle = self._handle_from_path()
+            self.includes = [str(p) for p in props.get("Includes", [])]
+            return
+
         # Try to get the Handle property, if available
         try:
             self.handle = self.get_handle()
@@ -175,37 +222,27 @@ class Service:  # noqa: N801 – keep simple name
                         LOG__DEBUG,
                     )
 
-    def discover_characteristics(self):
-        """Populate `self.characteristics` with Characteristic objects."""
+    def discover_characteristics(self, snapshot: Optional[GattSnapshot] = None):
+        """Populate `self.characteristics` with Characteristic objects.
+
+        When *snapshot* (see :func:`index_gatt_objects`) is supplied the
+        characteristic and descriptor objects are hydrated from it;
+        otherwise this service's subtree is read from the object-tree mirror.
+        """
         if self.characteristics:
             return self.characteristics  # already populated
             
-        if self.device is None:
-            # If we don't have a device object, we can't use its object manager
-            # Instead, we'll get managed objects directly from the bus
-            obj_manager = dbus.Interface(
-                self.bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-                "org.freedesktop.DBus.ObjectManager"
-            )
-            managed = obj_manager.GetManagedObjects()
-        else:
-            # Use the device's object manager
-            managed = self.device._object_manager.GetManagedObjects()
+        if snapshot is None:
+            prefix = self.path + "/"
+            snapshot = index_gatt_objects(get_fresh_objects(prefix), prefix)
             
-        char_prefix = f"{self.path}/char"
-        for path, interfaces in managed.items():
-            if not path.startswith(char_prefix):
-                continue
-            if GATT_CHARACTERISTIC_INTERFACE not in interfaces:
-                continue
-            char_obj = Characteristic(self.bus, path, self.uuid)
-            # Discover descriptors under this characteristic
-            descs: list[Descriptor] = []
-            desc_prefix = f"{path}/desc"
-            for dpath, dintf in managed.items():
-                if dpath.startswith(desc_prefix) and GATT_DESCRIPTOR_INTERFACE in dintf:
-                    descs.append(Descriptor(self.bus, dpath, char_obj.uuid))
-            char_obj.descriptors = descs  # type: ignore[attr-defined]
+        for path, char_props in snapshot.chars.get(self.path, []):
+            char_obj = Characteristic(self.bus, path, self.uuid, props=char_props)
+            # Descriptors under this characteristic
+            char_obj.descriptors = [  # type: ignore[attr-defined]
+                Descriptor(self.bus, dpath, char_obj.uuid, props=dprops)
+                for dpath, dprops in snapshot.descs.get(path, [])
+            ]
             self.characteristics.append(char_obj)
         return self.characteristics
 
@@ -220,13 +257,15 @@ class Service:  # noqa: N801 – keep simple name
         except dbus.exceptions.DBusException as e:
             if e.get_dbus_name() == "org.freedesktop.DBus.Error.InvalidArgs":
                 # Handle property not available, extract from path
-                match = re.search(r"service([0-9a-f]{4})$", self.path, re.IGNORECASE)
-                if match:
-                    return int(match.group(1), 16)
-                else:
-                    return -1  # Default to -1 if no handle can be extracted
+                return self._handle_from_path()
             else:
                 raise
+
+    def _handle_from_path(self) -> int:
+        match = re.search(r"service([0-9a-f]{4})$", self.path, re.IGNORECASE)
+        if match:
+            return int(match.group(1), 16)
+        return -1  # Default to -1 if no handle can be extracted
                 
     def get_characteristics(self):
         """Get the characteristics for this service.
@@ -12,8 +12,9 @@ from __future__ import annotations
 
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import dbus
 import dbus.lowlevel
@@ -147,49 +148,139 @@ class DBusEventCapture:
     original_message: Optional[Any] = None  # dbus.lowlevel.Message, but using Any for compatibility
 
 
+class _PathNode:
+    """Node of the :class:`SignalCorrelator` path trie."""
+
+    __slots__ = ("name", "parent", "children", "captures")
+
+    def __init__(self, name: str = "", parent: Optional["_PathNode"] = None):
+        self.name = name
+        self.parent = parent
+        self.children: Dict[str, "_PathNode"] = {}
+        self.captures: Deque[SignalCapture] = deque()
+
+
+def _path_components(path: str) -> List[str]:
+    return [part for part in (path or "").split("/") if part]
+
+
 class SignalCorrelator:
     """Correlates related signals from different sources.
     
     **DEPRECATED**: For new code, use `DBusEventAggregator` which provides
     unified correlation across all D-Bus event types. This class is retained
     for backward compatibility.
+
+    Captures are kept in arrival order in a deque (trimmed from the head once
+    older than :attr:`max_age`) and indexed by object path in a trie, so
+    :meth:`get_related` only visits captures on the same device/service
+    subtree – ancestors and descendants of the capture's path.
     """
     
-    def __init__(self):
+    def __init__(self, max_age: float = 30.0):
         """Initialize the correlator."""
-        self._captures: List[SignalCapture] = []
+        self.max_age = max_age
+        self._captures: Deque[Tuple[SignalCapture, _PathNode]] = deque()
+        self._root = _PathNode()
         self._lock = threading.Lock()
         
+    def _node_for(self, path: str, create: bool) -> Optional[_PathNode]:
+        node = self._root
+        for part in _path_components(path):
+            child = node.children.get(part)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[part] = _PathNode(part, node)
+            node = child
+        return node
+
+    def _trim(self, now: float) -> None:
+        """Drop captures older than ``max_age`` from the head (lock held)."""
+        captures = self._captures
+        while captures and now - captures[0][0].timestamp >= self.max_age:
+            capture, node = captures.popleft()
+            if node.captures and node.captures[0] is capture:
+                node.captures.popleft()
+            else:
+                # Out-of-order timestamp on this path – remove by identity
+                try:
+                    node.captures.remove(capture)
+                except ValueError:
+                    pass
+            # Prune empty branches so the trie tracks only live paths
+            while node.parent is not None and not node.captures and not node.children:
+                del node.parent.children[node.name]
+                node = node.parent
+
     def add_capture(self, capture: SignalCapture) -> None:
         """Add a signal capture to the correlation pool."""
         with self._lock:
-            self._captures.append(capture)
-            # Trim old captures (older than 30 seconds)
-            now = time.time()
-            self._captures = [c for c in self._captures if now - c.timestamp < 30]
+            node = self._node_for(capture.path, create=True)
+            node.captures.append(capture)
+            self._captures.append((capture, node))
+            self._trim(time.time())
     
     def get_related(self, capture: SignalCapture, 
                     time_window: float = 1.0) -> List[SignalCapture]:
-        """Get captures related to the given capture within a time window."""
+        """Get captures related to the given capture within a time window.
+
+        Related means on the same device/service/characteristic branch: the
+        capture's own path, any ancestor path or any descendant path.
+        """
+        ts = capture.timestamp
+        related: List[SignalCapture] = []
+
+        def _collect(node: _PathNode) -> None:
+            for c in node.captures:
+                if c is not capture and abs(c.timestamp - ts) <= time_window:
+                    related.append(c)
+
         with self._lock:
-            related = []
-            for c in self._captures:
-                # Skip the input capture itself
-                if c is capture:
-                    continue
-                    
-                # Check if it's within the time window
-                if abs(c.timestamp - capture.timestamp) <= time_window:
-                    # Path-based relationship (same device/service/characteristic)
-                    if c.path.startswith(capture.path) or capture.path.startswith(c.path):
-                        related.append(c)
-                        
-            return related
+            # Ancestors (and the exact path)
+            node = self._root
+            _collect(node)
+            for part in _path_components(capture.path):
+                node = node.children.get(part)
+                if node is None:
+                    break
+                _collect(node)
+            else:
+                # Descendants of the exact path
+                stack = list(node.children.values())
+                while stack:
+                    child = stack.pop()
+                    _collect(child)
+                    stack.extend(child.children.values())
+
+        related.sort(key=lambda c: c.timestamp)
+        return related
     
     def clear(self) -> None:
         """Clear all captures."""
         with self._lock:
             self._captures.clear()
+            self._root = _PathNode()
+
+    def __len__(self) -> int:
+        return len(self._captures)
+
+
+def _path_prefixes(path: str) -> List[str]:
+    """Return every component-aligned prefix of a D-Bus object path.
+
+    ``/org/bluez/hci0`` → ``["/", "/org", "/org/bluez", "/org/bluez/hci0"]``.
+    """
+    if not path or not path.startswith("/"):
+        return [path]
+    prefixes = ["/"]
+    end = path.find("/", 1)
+    while end != -1:
+        prefixes.append(path[:end])
+        end = path.find("/", end + 1)
+    if path != "/":
+        prefixes.append(path.rstrip("/") or "/")
+    return prefixes
 
 
 class DBusEventAggregator:
@@ -197,19 +288,59 @@ class DBusEventAggregator:
     
     Provides a unified view of all D-Bus communications for comprehensive monitoring
     and analysis. Replaces separate signal/method call capture systems.
+
+    Events live in a fixed-capacity ring buffer addressed by a monotonically
+    increasing sequence number.  Secondary indexes (event type, serial,
+    reply serial, interface, exact path and path prefix) hold sequence numbers
+    in arrival order, so eviction only pops the head of the indexes the
+    evicted event belongs to, and serial/path correlation visits just the
+    matching events instead of the whole window.
     """
     
-    def __init__(self, max_events: int = 1000):
+    def __init__(self, max_events: int = 10000):
         """Initialize the aggregator.
         
         Parameters
         ----------
         max_events : int
-            Maximum number of events to keep in memory (default: 1000)
+            Maximum number of events to keep in memory (default: 10000)
         """
-        self._events: List[DBusEventCapture] = []
+        self._max_events = max(1, int(max_events))
+        self._ring: List[Optional[DBusEventCapture]] = [None] * self._max_events
+        self._next_seq = 0  # sequence number of the next event to be added
         self._lock = threading.Lock()
-        self._max_events = max_events
+        self._by_type: Dict[str, Deque[int]] = {}
+        self._by_serial: Dict[int, Deque[int]] = {}  # method calls only
+        self._by_reply_serial: Dict[int, Deque[int]] = {}
+        self._by_interface: Dict[str, Deque[int]] = {}
+        self._by_path: Dict[str, Deque[int]] = {}
+        self._by_prefix: Dict[str, Deque[int]] = {}
+
+    # -- index maintenance -------------------------------------------------
+
+    def _index_keys(self, event: DBusEventCapture):
+        yield self._by_type, event.event_type
+        if event.event_type == "method_call":
+            yield self._by_serial, event.serial
+        if event.reply_serial is not None:
+            yield self._by_reply_serial, event.reply_serial
+        yield self._by_interface, event.interface
+        yield self._by_path, event.path
+        for prefix in _path_prefixes(event.path):
+            yield self._by_prefix, prefix
+
+    def _get(self, seq: int) -> Optional[DBusEventCapture]:
+        if seq < self._next_seq - self._max_events or seq >= self._next_seq:
+            return None
+        return self._ring[seq % self._max_events]
+
+    @property
+    def _oldest_seq(self) -> int:
+        return max(0, self._next_seq - self._max_events)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._next_seq - self._oldest_seq
         
     def add_event(self, event: DBusEventCapture) -> None:
         """Add an event to the aggregator.
@@ -220,10 +351,34 @@ class DBusEventAggregator:
             Event to add
         """
         with self._lock:
-            self._events.append(event)
-            # Trim old events
-            if len(self._events) > self._max_events:
-                self._events.pop(0)
+            seq = self._next_seq
+            slot = seq % self._max_events
+            evicted = self._ring[slot] if seq >= self._max_events else None
+            if evicted is not None:
+                evicted_seq = seq - self._max_events
+                for index, key in self._index_keys(evicted):
+                    bucket = index.get(key)
+                    if bucket and bucket[0] == evicted_seq:
+                        bucket.popleft()
+                        if not bucket:
+                            del index[key]
+            self._ring[slot] = event
+            self._next_seq = seq + 1
+            for index, key in self._index_keys(event):
+                bucket = index.get(key)
+                if bucket is None:
+                    bucket = index[key] = deque()
+                bucket.append(seq)
+
+    def _iter_newest(self, seqs) -> Any:
+        """Yield live events for *seqs* (ascending) from newest to oldest."""
+        oldest = self._oldest_seq
+        for seq in reversed(seqs):
+            if seq < oldest:
+                break
+            event = self._ring[seq % self._max_events]
+            if event is not None:
+                yield event
     
     def get_events(self, 
                    event_type: Optional[str] = None,
@@ -240,7 +395,7 @@ class DBusEventAggregator:
         interface : str, optional
             Filter by D-Bus interface
         path : str, optional
-            Filter by D-Bus path (exact match or prefix)
+            Filter by D-Bus path (exact match or path-component prefix)
         time_window : float, optional
             Filter by time window in seconds (events within this time from now)
         limit : int
@@ -251,22 +406,39 @@ class DBusEventAggregator:
         List[DBusEventCapture]
             List of matching events, most recent first
         """
-        with self._lock:
-            events = self._events.copy()
-        
-        # Apply filters
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-        if interface:
-            events = [e for e in events if e.interface == interface]
         if path:
-            events = [e for e in events if e.path == path or e.path.startswith(path)]
-        if time_window:
-            now = time.time()
-            events = [e for e in events if now - e.timestamp <= time_window]
-        
+            path = path.rstrip("/") or "/"
+        with self._lock:
+            # Drive the scan from the most selective index that applies.
+            candidates: List[Any] = []
+            if event_type:
+                candidates.append(self._by_type.get(event_type, ()))
+            if interface:
+                candidates.append(self._by_interface.get(interface, ()))
+            if path:
+                candidates.append(self._by_prefix.get(path, ()))
+            if candidates:
+                seqs = min(candidates, key=len)
+            else:
+                seqs = range(self._oldest_seq, self._next_seq)
+            cutoff = time.time() - time_window if time_window else None
+
+            events: List[DBusEventCapture] = []
+            for e in self._iter_newest(seqs):
+                if cutoff is not None and e.timestamp < cutoff:
+                    break  # arrival order: everything older is outside the window
+                if event_type and e.event_type != event_type:
+                    continue
+                if interface and e.interface != interface:
+                    continue
+                if path and not (e.path == path or e.path.startswith(path + "/") or path == "/"):
+                    continue
+                events.append(e)
+                if len(events) >= limit:
+                    break
+
         # Return most recent first
-        return sorted(events, key=lambda x: x.timestamp, reverse=True)[:limit]
+        return sorted(events, key=lambda x: x.timestamp, reverse=True)
     
     def correlate_events(self, event: DBusEventCapture, 
                         time_window: float = 2.0) -> List[DBusEventCapture]:
@@ -274,7 +446,7 @@ class DBusEventAggregator:
         
         Correlates by:
         - Serial number (method call → return/error)
-        - Path relationships
+        - Path relationships (ancestor or descendant object paths)
         - Time window
         
         Parameters
@@ -290,28 +462,31 @@ class DBusEventAggregator:
             List of related events, sorted by timestamp
         """
         with self._lock:
+            buckets: List[Any] = []
+            # Serial correlation (method call → return/error and back)
+            if event.event_type == "method_call":
+                buckets.append(self._by_reply_serial.get(event.serial, ()))
+            if event.reply_serial is not None:
+                buckets.append(self._by_serial.get(event.reply_serial, ()))
+            # Path correlation: descendants (and same path) plus ancestors
+            prefixes = _path_prefixes(event.path)
+            buckets.append(self._by_prefix.get(prefixes[-1], ()))
+            for ancestor in prefixes[:-1]:
+                buckets.append(self._by_path.get(ancestor, ()))
+
+            seen: Set[int] = set()
             related = []
-            for e in self._events:
-                if e is event:
-                    continue
-                
-                # Check time window
-                if abs(e.timestamp - event.timestamp) > time_window:
-                    continue
-                
-                # Correlate by serial (method call → return/error)
-                if (event.event_type == "method_call" and 
-                    e.reply_serial is not None and
-                    e.reply_serial == event.serial):
-                    related.append(e)
-                elif (e.event_type == "method_call" and 
-                      event.reply_serial is not None and
-                      event.reply_serial == e.serial):
-                    related.append(e)
-                
-                # Correlate by path
-                elif (e.path.startswith(event.path) or 
-                      event.path.startswith(e.path)):
+            oldest = self._oldest_seq
+            for bucket in buckets:
+                for seq in bucket:
+                    if seq < oldest or seq in seen:
+                        continue
+                    seen.add(seq)
+                    e = self._ring[seq % self._max_events]
+                    if e is None or e is event:
+                        continue
+                    if abs(e.timestamp - event.timestamp) > time_window:
+                        continue
                     related.append(e)
             
             return sorted(related, key=lambda x: x.timestamp)
@@ -330,32 +505,31 @@ class DBusEventAggregator:
             Complete chain: [method_call, return/error], sorted by timestamp
         """
         with self._lock:
-            events = self._events.copy()
-        
-        # Find the method call
-        call_event = None
-        for event in events:
-            if (event.event_type == "method_call" and 
-                event.serial == method_call_serial):
-                call_event = event
-                break
-        
-        if not call_event:
-            return []
-        
-        # Find related return/error
-        chain = [call_event]
-        related = self.correlate_events(call_event, time_window=5.0)
-        for event in related:
-            if event.event_type in ("method_return", "error"):
-                chain.append(event)
+            call_event = None
+            for seq in self._by_serial.get(method_call_serial, ()):
+                call_event = self._get(seq)
+                if call_event is not None:
+                    break
+            if call_event is None:
+                return []
+
+            chain = [call_event]
+            for seq in self._by_reply_serial.get(method_call_serial, ()):
+                e = self._get(seq)
+                if (e is not None and e.event_type in ("method_return", "error")
+                        and abs(e.timestamp - call_event.timestamp) <= 5.0):
+                    chain.append(e)
         
         return sorted(chain, key=lambda x: x.timestamp)
     
     def clear(self) -> None:
         """Clear all events."""
         with self._lock:
-            self._events.clear()
+            self._ring = [None] * self._max_events
+            self._next_seq = 0
+            for index in (self._by_type, self._by_serial, self._by_reply_serial,
+                          self._by_interface, self._by_path, self._by_prefix):
+                index.clear()
 
 
 class PropertyMonitor:
@@ -439,6 +613,7 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         
         # DeviceManager instance for RSSI forwarding (optional)
         self._device_manager: Optional[Any] = None
+        self._device_managers: Dict[str, Any] = {}
         
         # Agent instance for method invocation correlation (optional)
         self._agent_instance: Optional[Any] = None
@@ -456,6 +631,12 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         self._signal_correlator = SignalCorrelator()
         self._property_monitor = PropertyMonitor()
         
+        # GATT object index: device path -> {service/characteristic path ->
+        # (device, object)}.  Maintained on register_device, index_device_gatt
+        # (services_resolved) and InterfacesRemoved so notification dispatch
+        # is two dict lookups and removing a device only touches its entries.
+        self._gatt_index: Dict[str, Dict[str, Tuple[object, Any]]] = {}
+        
         # Notification tracking
         self._notification_callbacks: Dict[str, List[Callable]] = {}  # path -> callbacks
         self._read_triggers: Dict[str, List[Callable]] = {}  # path -> callbacks
@@ -484,15 +665,101 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
     def register_device(self, device):
         """Register *system_dbus__bluez_device__low_energy* instance for callbacks."""
         self._devices[device._device_path] = device  # type: ignore[attr-defined]
+        if getattr(device, "_services", None):
+            self.index_device_gatt(device)
         if not self._matches:
             self._attach_bus_listeners()
 
     def unregister_device(self, device):
         """Unregister a device from signal handling."""
         self._devices.pop(device._device_path, None)  # type: ignore[attr-defined]
+        self._drop_gatt_index(device._device_path)  # type: ignore[attr-defined]
         if not self._devices:
             self._detach_bus_listeners()
 
+    def index_device_gatt(self, device) -> None:
+        """(Re)build the path index for *device*'s services and characteristics.
+
+        Called from ``services_resolved`` once the Service/Characteristic
+        objects exist, so ``PropertiesChanged`` dispatch can find the owning
+        object with a single dict lookup.
+        """
+        dev_path = device._device_path  # type: ignore[attr-defined]
+        entries: Dict[str, Tuple[object, Any]] = {}
+        for svc in list(getattr(device, "_services", []) or []):
+            entries[svc.path] = (device, svc)
+            for char in list(getattr(svc, "characteristics", []) or []):
+                entries[char.path] = (device, char)
+        with self._lock:
+            self._gatt_index[dev_path] = entries
+
+    @staticmethod
+    def _gatt_device_key(path: str) -> Optional[str]:
+        """Return the ``.../hciX/dev_XX_...`` prefix of *path*, or None above it."""
+        parts = path.split("/", 5)
+        if len(parts) >= 5 and parts[4].startswith("dev_"):
+            return "/".join(parts[:5])
+        return None
+
+    def _drop_gatt_index(self, path: str) -> None:
+        with self._lock:
+            self._drop_gatt_index_locked(path)
+
+    def _drop_gatt_index_locked(self, path: str) -> None:
+        """Remove *path* and every indexed object below it (lock held)."""
+        dev_key = self._gatt_device_key(path)
+        if dev_key is None:
+            # Adapter (or root) removed: drop every device beneath it
+            prefix = path.rstrip("/") + "/"
+            for key in [k for k in self._gatt_index if k.startswith(prefix)]:
+                del self._gatt_index[key]
+            return
+        if dev_key == path:
+            self._gatt_index.pop(dev_key, None)
+            return
+        entries = self._gatt_index.get(dev_key)
+        if not entries:
+            return
+        prefix = path.rstrip("/") + "/"
+        for key in [k for k in entries if k == path or k.startswith(prefix)]:
+            del entries[key]
+
+    def _lookup_gatt_object(self, path: str, attr: str) -> Optional[Tuple[object, Any]]:
+        """Return ``(device, obj)`` for a service/characteristic *path*.
+
+        Falls back to walking the registered devices when the path has not
+        been indexed yet (e.g. services resolved through another code path)
+        and caches the result.  *attr* selects ``"service"`` or ``"char"``.
+        """
+        dev_key = self._gatt_device_key(path)
+        hit = self._gatt_index.get(dev_key, {}).get(path) if dev_key else None
+        if hit is not None:
+            return hit
+        for dev_path, device in list(self._devices.items()):
+            if not path.startswith(dev_path):
+                continue
+            try:
+                for svc in device._services:  # type: ignore[attr-defined]
+                    if attr == "service":
+                        if svc.path == path:
+                            hit = (device, svc)
+                            break
+                        continue
+                    for char in svc.characteristics:
+                        if char.path == path:
+                            hit = (device, char)
+                            break
+                    if hit:
+                        break
+            except AttributeError:
+                # Device not fully initialised – ignore
+                return None
+            break
+        if hit is not None and dev_key is not None:
+            with self._lock:
+                self._gatt_index.setdefault(dev_key, {})[path] = hit
+        return hit
+
     def register_device_manager(self, device_manager: Any) -> None:
         """Register a DeviceManager instance for RSSI forwarding.
         
@@ -500,6 +767,11 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
             device_manager: Instance of system_dbus__bluez_device_manager
         """
         self._device_manager = device_manager
+        # Per-adapter routing so concurrent multi-adapter scans each get
+        # the RSSI updates for their own device paths
+        adapter_path = getattr(device_manager, "_adapter_path", None)
+        if adapter_path:
+            self._device_managers[adapter_path] = device_manager
 
     def register_agent(self, agent_instance: Any) -> None:
         """Register an agent instance for method invocation correlation.
@@ -980,9 +1252,9 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
                 # Validate event type matches message type
                 if event and event.event_type != "signal":
                     print_and_log(
-                        f"[!] WARNING: Event type mismatch for signal: expected 'signal', got '{event.event_type}' "
-                        f"(interface={interface}, path={path})",
-                        LOG__DEBUG
+                        "[!] WARNING: Event type mismatch for signal: expected 'signal', got '%s' "
+                        "(interface=%s, path=%s)",
+                        LOG__DEBUG, event.event_type, interface, path,
                     )
             
             elif msg_type == DBUS_MESSAGE_METHOD_CALL:
@@ -990,9 +1262,9 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
                 # Validate event type matches message type
                 if event and event.event_type != "method_call":
                     print_and_log(
-                        f"[!] WARNING: Event type mismatch for method call: expected 'method_call', got '{event.event_type}' "
-                        f"(interface={interface}, method={message.get_member()}, path={path})",
-                        LOG__DEBUG
+                        "[!] WARNING: Event type mismatch for method call: expected 'method_call', got '%s' "
+                        "(interface=%s, method=%s, path=%s)",
+                        LOG__DEBUG, event.event_type, interface, message.get_member(), path,
                     )
             
             elif msg_type == DBUS_MESSAGE_METHOD_RETURN:
@@ -1000,9 +1272,9 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
                 # Validate event type matches message type
                 if event and event.event_type != "method_return":
                     print_and_log(
-                        f"[!] WARNING: Event type mismatch for method return: expected 'method_return', got '{event.event_type}' "
-                        f"(interface={interface}, path={path}, reply_serial={message.get_reply_serial()})",
-                        LOG__DEBUG
+                        "[!] WARNING: Event type mismatch for method return: expected 'method_return', got '%s' "
+                        "(interface=%s, path=%s, reply_serial=%s)",
+                        LOG__DEBUG, event.event_type, interface, path, message.get_reply_serial(),
                     )
             
             elif msg_type == DBUS_MESSAGE_ERROR:
@@ -1010,16 +1282,15 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
                 # Validate event type matches message type
                 if event and event.event_type != "error":
                     print_and_log(
-                        f"[!] WARNING: Event type mismatch for error: expected 'error', got '{event.event_type}' "
-                        f"(interface={interface}, path={path}, error_name={message.get_error_name()})",
-                        LOG__DEBUG
+                        "[!] WARNING: Event type mismatch for error: expected 'error', got '%s' "
+                        "(interface=%s, path=%s, error_name=%s)",
+                        LOG__DEBUG, event.event_type, interface, path, message.get_error_name(),
                     )
             else:
                 # Unknown message type - log for debugging
                 print_and_log(
-                    f"[!] WARNING: Unknown D-Bus message type: {msg_type} "
-                    f"(interface={interface}, path={path})",
-                    LOG__DEBUG
+                    "[!] WARNING: Unknown D-Bus message type: %s (interface=%s, path=%s)",
+                    LOG__DEBUG, msg_type, interface, path,
                 )
             
             if event:
@@ -1043,11 +1314,8 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         
         except Exception as exc:
             # Log exception type and message transparently for debugging
-            error_type = type(exc).__name__
-            error_msg = str(exc)
             print_and_log(
-                f"[-] Error processing D-Bus message: {error_type}: {error_msg}",
-                LOG__DEBUG
+                "[-] Error processing D-Bus message: %s: %s", LOG__DEBUG, type(exc).__name__, exc
             )
         
         return None  # Allow message to continue
@@ -1228,10 +1496,9 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         valid_types = {"signal", "method_call", "method_return", "error"}
         if event.event_type not in valid_types:
             print_and_log(
-                f"[!] WARNING: Invalid event type '{event.event_type}' for event "
-                f"{event.method_name or event.signal_name or 'unknown'} "
-                f"(interface={event.interface}, path={event.path})",
-                LOG__DEBUG
+                "[!] WARNING: Invalid event type '%s' for event %s (interface=%s, path=%s)",
+                LOG__DEBUG, event.event_type, event.method_name or event.signal_name or "unknown",
+                event.interface, event.path,
             )
             return
         
@@ -2092,10 +2359,7 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
             self._signal_correlator.add_capture(signal_capture)
             
         except Exception as exc:
-            print_and_log(
-                f"[-] Error processing method call message: {exc}",
-                LOG__DEBUG
-            )
+            print_and_log("[-] Error processing method call message: %s", LOG__DEBUG, exc)
         
         # Return None to allow message to continue to destination
         return None
@@ -2231,13 +2495,14 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
                         mac_part = path.split("/dev_")[-1]
                         # Convert XX_XX_XX_XX_XX_XX to XX:XX:XX:XX:XX:XX
                         mac_address = mac_part.replace("_", ":").upper()
+                        manager = self._device_managers.get(path.split("/dev_")[0], self._device_manager)
                         # Forward to DeviceManager if discovery is active
-                        if hasattr(self._device_manager, "is_discovery_active") and self._device_manager.is_discovery_active():
-                            if hasattr(self._device_manager, "_capture_rssi_from_signal"):
+                        if hasattr(manager, "is_discovery_active") and manager.is_discovery_active():
+                            if hasattr(manager, "_capture_rssi_from_signal"):
                                 try:
                                     rssi_int = int(rssi_value) if rssi_value is not None else None
                                     if rssi_int is not None:
-                                        self._device_manager._capture_rssi_from_signal(mac_address, rssi_int)
+                                        manager._capture_rssi_from_signal(mac_address, rssi_int)
                                 except (ValueError, TypeError, AttributeError):
                                     # Ignore errors in RSSI capture (non-critical)
                                     pass
@@ -2247,21 +2512,15 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
             
         # Route GattService1 property changes to the owning Service object
         if interface == GATT_SERVICE_INTERFACE:
-            for dev_path, device in self._devices.items():
-                if not path.startswith(dev_path):
-                    continue
-                if hasattr(device, "_services"):
-                    for svc in device._services:
-                        if svc.path == path:
-                            try:
-                                svc._props_changed(interface, changed, invalidated)
-                            except Exception as e:
-                                print_and_log(
-                                    f"[ERROR] Service signal dispatch error: {e}",
-                                    LOG__DEBUG,
-                                )
-                            break
-                break
+            hit = self._lookup_gatt_object(path, "service")
+            if hit is not None:
+                try:
+                    hit[1]._props_changed(interface, changed, invalidated)
+                except Exception as e:
+                    print_and_log(
+                        f"[ERROR] Service signal dispatch error: {e}",
+                        LOG__DEBUG,
+                    )
 
         # Handle GATT characteristic notifications specifically
         if interface == GATT_CHARACTERISTIC_INTERFACE and "Value" in changed:
@@ -2269,32 +2528,22 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
             source = "notification"
             capture.source = source
             
-            # Process notification callbacks specific to this characteristic
+            # Snapshot callbacks under the lock, invoke them outside it so a
+            # slow callback cannot block registration or other dispatch.
             with self._lock:
-                callbacks = self._notification_callbacks.get(path, [])
-                for callback in callbacks:
-                    try:
-                        callback(path, value)
-                    except Exception as e:
-                        print_and_log(f"[ERROR] Notification callback error: {e}", LOG__DEBUG)
-            
-            # Find owning device (device path is prefix of characteristic path)
-            for dev_path, device in self._devices.items():
-                if not path.startswith(dev_path):
-                    continue
+                callbacks = list(self._notification_callbacks.get(path, ()))
+            for callback in callbacks:
                 try:
-                    # Navigate to characteristic instance
-                    for svc in device._services:  # type: ignore[attr-defined]
-                        for char in svc.characteristics:
-                            if char.path == path:
-                                char_value = value  # noqa: F841 – local alias for clarity
-                                # Notify device & characteristic
-                                if hasattr(device, "characteristic_value_updated"):
-                                    device.characteristic_value_updated(char, value)  # type: ignore[attr-defined]
-                                return
-                except AttributeError:
-                    # Device not fully initialised – ignore
-                    return
+                    callback(path, value)
+                except Exception as e:
+                    print_and_log(f"[ERROR] Notification callback error: {e}", LOG__DEBUG)
+            
+            # Notify owning device & characteristic
+            hit = self._lookup_gatt_object(path, "char")
+            if hit is not None:
+                device, char = hit
+                if hasattr(device, "characteristic_value_updated"):
+                    device.characteristic_value_updated(char, value)  # type: ignore[attr-defined]
 
     # ------------------------------------------------------------------
     # Callbacks – ObjectManager
@@ -2340,6 +2589,8 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         )
         self._signal_correlator.add_capture(capture)
         
+        self._drop_gatt_index(object_path)
+        
         for dev_path, device in self._devices.items():
             if not object_path.startswith(dev_path):
                 continue
@@ -2452,14 +2703,14 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         )
         self._signal_correlator.add_capture(capture)
         
-        # Process read callbacks
+        # Process read callbacks (outside the lock)
         with self._lock:
-            callbacks = self._read_triggers.get(char_path, [])
-            for callback in callbacks:
-                try:
-                    callback(char_path, value)
-                except Exception as e:
-                    print_and_log(f"[ERROR] Read callback error: {e}", LOG__DEBUG)
+            callbacks = list(self._read_triggers.get(char_path, ()))
+        for callback in callbacks:
+            try:
+                callback(char_path, value)
+            except Exception as e:
+                print_and_log(f"[ERROR] Read callback error: {e}", LOG__DEBUG)
     
     def handle_write_event(self, char_path: str, value: bytes) -> None:
         """Handle a characteristic write event.
@@ -2484,14 +2735,14 @@ class system_dbus__bluez_signals:  # noqa: N801 – keep legacy-friendly name
         )
         self._signal_correlator.add_capture(capture)
         
-        # Process write callbacks
+        # Process write callbacks (outside the lock)
         with self._lock:
-            callbacks = self._write_triggers.get(char_path, [])
-            for callback in callbacks:
-                try:
-                    callback(char_path, value)
-                except Exception as e:
-                    print_and_log(f"[ERROR] Write callback error: {e}", LOG__DEBUG)
+            callbacks = list(self._write_triggers.get(char_path, ()))
+        for callback in callbacks:
+            try:
+                callback(char_path, value)
+            except Exception as e:
+                print_and_log(f"[ERROR] Write callback error: {e}", LOG__DEBUG)
 
 
 __all__ = ["system_dbus__bluez_signals"]
@@ -2507,3 +2758,12 @@ __all__ = ["system_dbus__bluez_signals"]
 LegacySignals = system_dbus__bluez_signals  # type: ignore  # noqa: N801
 
 __all__.append("LegacySignals")
+
+# Load the signal-capture layer so every SignalCapture created from here on is
+# routed (bleep.signals.integration patches the class on import).  When
+# bleep.signals is already in sys.modules it is either loaded or currently
+# importing us, and its own import of the integration module applies the patch.
+import sys as _sys  # noqa: E402
+
+if "bleep.signals" not in _sys.modules:
+    import bleep.signals  # noqa: E402,F401
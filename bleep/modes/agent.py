@@ -120,7 +120,7 @@ def _check_agent_status(bus) -> int:
         )
         print_and_log(
             "[*] To verify agent is being used, check agent logs during pairing: "
-            "tail -f /tmp/bti__logging__agent.txt",
+            "tail -F /tmp/bti__logging__agent.txt",
             LOG__GENERAL
         )
         return 0
@@ -17,7 +17,7 @@ def _conn():
 
 
 def _valid_cols() -> list[str]:
-    with _obs._db_cursor() as cur:  # type: ignore[attr-defined]
+    with _obs._read_cursor() as cur:  # type: ignore[attr-defined]
         return [c[1] for c in cur.execute("PRAGMA table_info(devices)")]
 
 
@@ -152,7 +152,7 @@ def _cmd_help(args, state):
             ("csend", "csend <hex:XX|str:XX|file:PATH|data>",                              "Send data over RFCOMM"),
             ("crecv", "crecv [--timeout N] [--size N] [--hex] [--save FILE]",              "Receive from RFCOMM"),
             ("craw",  "craw [channel|--svc NAME|--first] [--hex]",                         "Interactive RFCOMM send/recv session"),
-            ("crfcomm","crfcomm [--probe] [--timeout N]",                                    "List RFCOMM channels, optionally probe endpoints"),
+            ("crfcomm","crfcomm [--probe] [--timeout N] [--concurrency N]",                   "List RFCOMM channels, optionally probe endpoints"),
             ("copp",  "copp send <file> | pull [dest] | exchange <local> [dest]",          "Object Push Profile"),
             ("cmapinfo","cmapinfo",                                                        "MAP version, features & BlueZ compat info"),
             ("cmap",  "cmap folders|list|get|push|inbox|props|read|delete",                "Message Access Profile"),
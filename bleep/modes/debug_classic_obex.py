@@ -474,8 +474,8 @@ def cmd_cmap(args: List[str], state: DebugState) -> None:
         print("                                         - List messages in folder")
         print("  cmap get <handle> [dest.txt]           - Download & display message contents")
         print("  cmap push <filepath> [folder]          - Push/send a message (bMessage format)")
-        print("  cmap download-all [dest] [--folders f1,f2] [--count N]")
-        print("                                         - Download all messages from device")
+        print("  cmap download-all [dest] [--folders f1,f2] [--count N] [--full] [--verify]")
+        print("                                         - Download new/changed messages from device")
         print("  cmap push-all <dir|glob> [folder] [--dry-run] [--delay N]")
         print("                                         - Push all .bmsg files to device")
         print("  cmap inbox                             - Trigger inbox update")
@@ -744,9 +744,17 @@ def cmd_cmap(args: List[str], state: DebugState) -> None:
         dest_dir: Optional[str] = None
         dl_folders: Optional[List[str]] = None
         dl_count: Optional[int] = None
+        dl_full = False
+        dl_verify = False
         j = 1
         while j < len(args):
-            if args[j] == "--folders" and j + 1 < len(args):
+            if args[j] == "--full":
+                dl_full = True
+                j += 1
+            elif args[j] == "--verify":
+                dl_verify = True
+                j += 1
+            elif args[j] == "--folders" and j + 1 < len(args):
                 dl_folders = [f.strip() for f in args[j + 1].split(",") if f.strip()]
                 j += 2
             elif args[j] == "--count" and j + 1 < len(args):
@@ -768,20 +776,23 @@ def cmd_cmap(args: List[str], state: DebugState) -> None:
             dest_dir = str(OBEX_RECEIVE_DIR / f"{mac_clean}_map_dump")
 
         try:
-            from bleep.ble_ops.classic.map import download_all_messages
+            from bleep.ble_ops.classic.map import sync_messages
 
             def _dl_progress(folder: str, cur: int, total: int, path: str) -> None:
                 short = folder.replace("telecom/msg/", "")
                 print(f"  [{cur}/{total}] {short} → {path}")
 
             print(f"[MAP] Downloading all messages → {dest_dir}")
-            results = download_all_messages(
+            stats = sync_messages(
                 mac, dest_dir,
                 folders=dl_folders,
                 max_count=dl_count,
                 instance=instance,
                 progress_cb=_dl_progress,
+                incremental=not dl_full,
+                verify=dl_verify,
             )
+            results = stats["folders"]
             total_msgs = 0
             total_bytes = 0
             print()
@@ -795,6 +806,10 @@ def cmd_cmap(args: List[str], state: DebugState) -> None:
                 else:
                     print(f"  {fld_short:<25}    0 msgs")
             print(f"\n[+] Download complete: {total_msgs} messages ({total_bytes / 1024:.1f} KB)")
+            print(
+                f"    {stats['downloaded']} new/changed, {stats['unchanged']} unchanged, "
+                f"{stats['failed']} failed"
+            )
         except Exception as exc:
             print_and_log(
                 f"[-] MAP download-all failed: {format_dbus_error(exc)}", LOG__DEBUG,
@@ -386,11 +386,12 @@ def cmd_craw(args: List[str], state: DebugState) -> None:
 def cmd_crfcomm(args: List[str], state: DebugState) -> None:
     """List RFCOMM channels from the SDP service map, optionally probe each.
 
-    Usage: crfcomm [--probe] [--timeout N]
+    Usage: crfcomm [--probe] [--timeout N] [--concurrency N]
     """
     parser = argparse.ArgumentParser(prog="crfcomm", add_help=False)
     parser.add_argument("--probe", action="store_true", help="Probe each RFCOMM channel")
     parser.add_argument("--timeout", type=float, default=4.0, help="Per-channel probe timeout")
+    parser.add_argument("--concurrency", type=int, default=None, help="Channels probed at once")
     try:
         opts = parser.parse_args(args)
     except SystemExit:
@@ -434,11 +435,14 @@ def cmd_crfcomm(args: List[str], state: DebugState) -> None:
         print(f"  {ch:>3}  {svc_name:<30}  {uuid}")
 
     if opts.probe:
-        from bleep.ble_ops.classic.rfcomm import probe_rfcomm_channel
+        from bleep.ble_ops.classic.rfcomm import probe_all_channels
 
         print(f"\n[*] Probing {len(rfcomm_entries)} RFCOMM channel(s)...\n")
-        for ch, svc_name, _ in rfcomm_entries:
-            result = probe_rfcomm_channel(mac, ch, timeout=opts.timeout)
+        results = probe_all_channels(
+            mac, [e[0] for e in rfcomm_entries],
+            timeout=opts.timeout, concurrency=opts.concurrency,
+        )
+        for (ch, svc_name, _), result in zip(rfcomm_entries, results):
             status = result.classification.upper()
             extra = ""
             if result.raw_response:
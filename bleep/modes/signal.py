@@ -22,21 +22,60 @@ def _arg_parser() -> argparse.ArgumentParser:
     p.add_argument("mac", metavar="MAC", help="Target BLE MAC address")
     p.add_argument("char", metavar="CHAR", help="Characteristic UUID or char00xx handle")
     p.add_argument("--time", type=int, default=30, help="Listen duration (s)")
+    p.add_argument("--out", help="Stream notifications to FILE")
+    p.add_argument("--format", choices=["jsonl", "segment"], default="jsonl", help="Output format for --out")
+    p.add_argument("--compress", choices=["gzip", "zstd"], help="Compress jsonl output")
+    p.add_argument("--rotate-mb", type=float, help="Rotate output after N MiB")
+    p.add_argument("--rotate-seconds", type=float, help="Rotate output after N seconds")
     p.add_argument("--help", "-h", action="help")
     return p
 
 
 def main(argv: list[str] | None = None):
     argv = argv or sys.argv[1:]
-    args = _arg_parser().parse_args(argv)
+    parser = _arg_parser()
+    args = parser.parse_args(argv)
+    if args.compress and args.format == "segment":
+        parser.error("--compress applies to jsonl output only, not --format segment")
 
     target = args.mac.upper()
     device, _mapping, _m1, _m2 = _connect_enum(target)
 
     sigs = _Signals()
 
+    writer = None
+    if args.out:
+        from bleep.signals.storage import JsonlWriter, SegmentWriter
+
+        rotate = dict(
+            rotate_bytes=int(args.rotate_mb * 1024 * 1024) if args.rotate_mb else None,
+            rotate_seconds=args.rotate_seconds,
+        )
+        if args.format == "segment":
+            writer = SegmentWriter(args.out, **rotate)
+        else:
+            writer = JsonlWriter(args.out, compress=args.compress, **rotate)
+
+    # Buffered so a notification costs an append; written once per second
+    pending: list = []
+
+    def _drain():
+        if writer is not None and pending:
+            batch = pending[:]
+            del pending[:]
+            if args.format == "segment":
+                writer.write_many((ts, p, v) for ts, p, v in batch)
+            else:
+                writer.write_many(
+                    {"timestamp": ts, "path": p, "mac": target, "value": v} for ts, p, v in batch
+                )
+            writer.flush()
+        return True
+
     # Connect callback
     def _notify_cb(uuid, value: bytes):  # type: ignore
+        if writer is not None:
+            pending.append((time.time(), uuid, bytes(value)))
         print_and_log(f"[NOTIFY] {uuid}: {value.hex()}", LOG__GENERAL)
 
     dev_uuid = None
@@ -73,8 +112,15 @@ def main(argv: list[str] | None = None):
     signal.signal(signal.SIGINT, _sigint)
 
     GLib.timeout_add_seconds(args.time, loop.quit)
+    if writer is not None:
+        GLib.timeout_add_seconds(1, _drain)
     loop.run()
 
+    if writer is not None:
+        _drain()
+        writer.close()
+        print_and_log(f"[*] Notifications written to {writer.path or args.out}", LOG__GENERAL)
+
     print_and_log("[*] Done", LOG__GENERAL)
     return 0
 
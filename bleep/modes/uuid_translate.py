@@ -8,9 +8,9 @@ human-readable formats using BLEEP's internal UUID databases.
 import argparse
 import json
 import sys
-from typing import List, Optional
+from typing import List, Optional, TextIO
 
-from bleep.bt_ref.uuid_translator import translate_uuid, UUIDCategory
+from bleep.bt_ref.uuid_translator import translate_uuid, translate_many, UUIDCategory
 from bleep.core.log import print_and_log, LOG__GENERAL, LOG__DEBUG
 
 
@@ -124,7 +124,28 @@ def format_json_output(result: dict) -> str:
     return json.dumps(json_result, indent=2, ensure_ascii=False)
 
 
-def translate_single_uuid(uuid_input: str, json_output: bool = False, verbose: bool = False) -> int:
+def read_uuid_lines(stream: TextIO) -> List[str]:
+    """
+    Read UUIDs from a text stream, one per line.
+    
+    Blank lines and ``#`` comments are skipped; several UUIDs on one line may
+    be separated by whitespace or commas.
+    
+    Args:
+        stream: Open text stream (file or stdin)
+        
+    Returns:
+        List of UUID strings in input order
+    """
+    uuids: List[str] = []
+    for line in stream:
+        line = line.split("#", 1)[0]
+        uuids.extend(token for token in line.replace(",", " ").split() if token)
+    return uuids
+
+
+def translate_single_uuid(uuid_input: str, json_output: bool = False, verbose: bool = False,
+                          include_unknown: bool = False) -> int:
     """
     Translate a single UUID and print results.
     
@@ -137,7 +158,7 @@ def translate_single_uuid(uuid_input: str, json_output: bool = False, verbose: b
         Exit code (0 for success, 1 for error)
     """
     try:
-        result = translate_uuid(uuid_input)
+        result = translate_uuid(uuid_input, include_unknown)
         
         if json_output:
             output = format_json_output(result)
@@ -156,14 +177,19 @@ def translate_single_uuid(uuid_input: str, json_output: bool = False, verbose: b
         return 1
 
 
-def translate_multiple_uuids(uuids: List[str], json_output: bool = False, verbose: bool = False) -> int:
+def translate_multiple_uuids(uuids: List[str], json_output: bool = False, verbose: bool = False,
+                             include_unknown: bool = False) -> int:
     """
     Translate multiple UUIDs and print results.
     
+    The whole list is translated with :func:`translate_many`, so repeated
+    UUIDs are only resolved once.
+    
     Args:
         uuids: List of UUID strings to translate
         json_output: If True, output in JSON format
         verbose: If True, include verbose details
+        include_unknown: If True, include "Unknown" entries in results
         
     Returns:
         Exit code (0 for success, 1 for error)
@@ -171,15 +197,18 @@ def translate_multiple_uuids(uuids: List[str], json_output: bool = False, verbos
     results = []
     errors = []
     
-    for uuid_input in uuids:
-        try:
-            result = translate_uuid(uuid_input)
-            results.append(result)
-        except Exception as e:
-            error_msg = f"Error translating UUID '{uuid_input}': {e}"
-            errors.append(error_msg)
-            if verbose:
-                print(error_msg, file=sys.stderr)
+    try:
+        results = translate_many(uuids, include_unknown)
+    except Exception:
+        # Fall back to one-by-one so a single bad entry is reported by name
+        for uuid_input in uuids:
+            try:
+                results.append(translate_uuid(uuid_input, include_unknown))
+            except Exception as e:
+                error_msg = f"Error translating UUID '{uuid_input}': {e}"
+                errors.append(error_msg)
+                if verbose:
+                    print(error_msg, file=sys.stderr)
     
     if json_output:
         # Output as JSON array
@@ -231,10 +260,22 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     
     parser.add_argument(
         "uuids",
-        nargs="+",
+        nargs="*",
         help="UUID(s) to translate (16-bit, 32-bit, or 128-bit format)"
     )
     
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Also read UUIDs from standard input (one per line)"
+    )
+    
+    parser.add_argument(
+        "--file",
+        metavar="PATH",
+        help="Also read UUIDs from PATH (one per line, '#' comments allowed)"
+    )
+    
     parser.add_argument(
         "--json",
         action="store_true",
@@ -253,7 +294,10 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Include 'Unknown' entries in results"
     )
     
-    return parser.parse_args(args)
+    parsed = parser.parse_args(args)
+    if not (parsed.uuids or parsed.stdin or parsed.file):
+        parser.error("at least one UUID, --stdin or --file is required")
+    return parsed
 
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -273,20 +317,36 @@ def main(args: Optional[List[str]] = None) -> int:
         import logging
         logging.getLogger("bleep").setLevel(logging.DEBUG)
     
+    uuids = list(parsed_args.uuids)
+    if parsed_args.file:
+        try:
+            with open(parsed_args.file, "r", encoding="utf-8") as f:
+                uuids.extend(read_uuid_lines(f))
+        except OSError as e:
+            print(f"Error reading UUID file '{parsed_args.file}': {e}", file=sys.stderr)
+            return 1
+    if parsed_args.stdin:
+        uuids.extend(read_uuid_lines(sys.stdin))
+    if not uuids:
+        print("No UUIDs to translate", file=sys.stderr)
+        return 1
+    
     # Translate UUIDs
-    if len(parsed_args.uuids) == 1:
+    if len(uuids) == 1 and not (parsed_args.stdin or parsed_args.file):
         # Single UUID
         return translate_single_uuid(
-            parsed_args.uuids[0],
+            uuids[0],
             json_output=parsed_args.json,
-            verbose=parsed_args.verbose
+            verbose=parsed_args.verbose,
+            include_unknown=parsed_args.include_unknown
         )
     else:
         # Multiple UUIDs
         return translate_multiple_uuids(
-            parsed_args.uuids,
+            uuids,
             json_output=parsed_args.json,
-            verbose=parsed_args.verbose
+            verbose=parsed_args.verbose,
+            include_unknown=parsed_args.include_unknown
         )
 
 
@@ -28,20 +28,15 @@ from bleep.core.log import print_and_log, LOG__GENERAL, LOG__DEBUG, LOG__AGENT
 def find_device_path(mac: str) -> Optional[str]:
     """Resolve a MAC address to its BlueZ D-Bus object path.
 
-    Walks ``GetManagedObjects`` on the system bus.  Returns ``None`` when
-    the device has not been discovered yet.
+    Uses the address index of the object-tree mirror
+    (:mod:`bleep.dbus.object_mirror`).  Returns ``None`` when the device has
+    not been discovered yet.
     """
     mac = mac.strip().upper()
     try:
-        bus = dbus.SystemBus()
-        om = dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-            "org.freedesktop.DBus.ObjectManager",
-        )
-        for path, ifaces in om.GetManagedObjects().items():
-            dev = ifaces.get(DEVICE_INTERFACE)
-            if dev and str(dev.get("Address", "")).upper() == mac:
-                return str(path)
+        from bleep.dbus.object_mirror import find_device_path as _mirror_find
+
+        return _mirror_find(mac)
     except dbus.exceptions.DBusException:
         pass
     return None
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+BLEEP Startup Benchmark
+
+Measures how long ``import bleep`` and the scripted CLI fast paths
+(``bleep uuid-translate``, ``bleep db``) take to start, using
+``python -X importtime`` in fresh interpreters:
+
+1. Median wall-clock time of the whole process
+2. Median cumulative import time of everything imported by the scenario
+3. Number of modules imported and the slowest top-level imports
+4. Modules that must never be loaded by a scenario (e.g. GLib for uuid-translate)
+
+Record a baseline on a reference machine and compare later runs against it
+so import-time regressions are visible:
+
+Usage:
+    python3 startup_benchmark.py [--repeat 7] [--top 10]
+    python3 startup_benchmark.py --save startup_baseline.json
+    python3 startup_benchmark.py --compare startup_baseline.json [--tolerance 0.25]
+
+Exits non-zero when a forbidden module is imported or a scenario is slower
+than the baseline by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_MARKER = "--bleep-startup-benchmark--"
+
+# name -> (python code run after the marker, modules that must not be imported)
+SCENARIOS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "import": (
+        "import bleep",
+        ("dbus", "gi", "bleep.core.log", "bleep.signals"),
+    ),
+    "cli-import": (
+        "import bleep.cli",
+        ("dbus", "gi", "bleep.core.log", "bleep.signals"),
+    ),
+    "uuid-translate": (
+        "from bleep.cli import main; main(['uuid-translate', '180f', '2a19', '0x110b'])",
+        ("gi", "bleep.dbuslayer", "bleep.signals", "bleep.core.preflight"),
+    ),
+    "db": (
+        "from bleep.cli import main; main(['db', '--help'])",
+        ("gi", "bleep.dbuslayer", "bleep.signals", "bleep.core.preflight"),
+    ),
+}
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Return ``(module, cumulative_us, depth)`` for imports after the marker."""
+    entries = []
+    started = False
+    for line in stderr.splitlines():
+        if line.strip() == _MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # column header
+        name = fields[2]
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped, int(fields[1]), depth))
+    return entries
+
+
+def run_once(code: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Run *code* in a fresh interpreter; return wall seconds and import entries."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    script = f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush()\n{code}"
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode not in (0, None):
+        tail = "\n".join(l for l in proc.stderr.splitlines() if not l.startswith("import time:"))
+        raise RuntimeError(f"scenario exited with {proc.returncode}:\n{tail[-2000:]}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def measure(name: str, repeat: int) -> Dict[str, object]:
+    code, forbidden = SCENARIOS[name]
+    walls, imports = [], []
+    entries: List[Tuple[str, int, int]] = []
+    for _ in range(repeat):
+        wall, entries = run_once(code)
+        walls.append(wall * 1000.0)
+        imports.append(sum(us for _, us, depth in entries if depth == 0) / 1000.0)
+    modules = {module for module, _, _ in entries}
+    loaded_forbidden = sorted(
+        f for f in forbidden if any(m == f or m.startswith(f + ".") for m in modules)
+    )
+    top = sorted(((m, us) for m, us, depth in entries if depth == 0), key=lambda e: -e[1])
+    return {
+        "wall_ms": round(statistics.median(walls), 2),
+        "import_ms": round(statistics.median(imports), 2),
+        "modules": len(modules),
+        "forbidden": loaded_forbidden,
+        "top": [(m, round(us / 1000.0, 2)) for m, us in top],
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Return human-readable regressions of *results* against *baseline*."""
+    problems = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key in ("import_ms", "wall_ms"):
+            limit = base[key] * (1.0 + tolerance)
+            if result[key] > limit:
+                problems.append(
+                    f"{name}: {key} {result[key]:.1f} > {base[key]:.1f} (+{tolerance:.0%} allowed)"
+                )
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure BLEEP start-up and import time")
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per scenario (default: 7)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--save", metavar="FILE", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown versus the baseline (default: 0.25 = 25%%)")
+    opts = parser.parse_args(argv)
+
+    results: Dict[str, dict] = {}
+    failed = False
+    for name in opts.scenario or SCENARIOS:
+        try:
+            result = measure(name, max(1, opts.repeat))
+        except RuntimeError as exc:
+            print(f"[-] {name}: {exc}")
+            failed = True
+            continue
+        results[name] = result
+        print(f"[*] {name}: wall {result['wall_ms']:.1f} ms, imports {result['import_ms']:.1f} ms, "
+              f"{result['modules']} modules")
+        for module, ms in result["top"][:opts.top]:
+            print(f"      {ms:8.2f} ms  {module}")
+        if result["forbidden"]:
+            print(f"[-] {name}: imported {', '.join(result['forbidden'])}")
+            failed = True
+
+    if opts.save:
+        baseline = {
+            name: {k: r[k] for k in ("wall_ms", "import_ms", "modules")}
+            for name, r in results.items()
+        }
+        baseline["_python"] = {"version": sys.version.split()[0]}
+        Path(opts.save).write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"[+] Baseline written to {opts.save}")
+
+    if opts.compare:
+        baseline = json.loads(Path(opts.compare).read_text(encoding="utf-8"))
+        problems = compare(results, baseline, opts.tolerance)
+        for problem in problems:
+            print(f"[-] Regression: {problem}")
+        if problems:
+            failed = True
+        else:
+            print(f"[+] Within {opts.tolerance:.0%} of {opts.compare}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,7 @@ from bleep.signals.capture_config import (
 from bleep.signals.router import (
     SignalRouter,
     ActionExecutor,
+    CompiledRouteMatcher,
     get_router,
     set_router,
     process_signal,
@@ -28,6 +29,14 @@ from bleep.signals.router import (
     register_callback,
 )
 
+from bleep.signals.storage import (
+    JsonlWriter,
+    SegmentWriter,
+    read_jsonl,
+    read_segment,
+    iter_segment,
+)
+
 from bleep.signals.integration import (
     integrate_with_bluez_signals,
     patch_signal_capture_class,
@@ -51,6 +60,7 @@ __all__ = [
     # Router classes
     "SignalRouter",
     "ActionExecutor",
+    "CompiledRouteMatcher",
     
     # Router functions
     "get_router",
@@ -59,6 +69,13 @@ __all__ = [
     "process_signal_capture",
     "register_callback",
     
+    # Streaming storage
+    "JsonlWriter",
+    "SegmentWriter",
+    "read_jsonl",
+    "read_segment",
+    "iter_segment",
+    
     # Integration functions
     "integrate_with_bluez_signals",
     "patch_signal_capture_class",
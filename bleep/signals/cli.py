@@ -92,6 +92,10 @@ def _create_parser() -> argparse.ArgumentParser:
     export_parser.add_argument("config", help="Name of the configuration file")
     export_parser.add_argument("file", help="JSON file to export to")
     
+    # Pipeline statistics
+    stats_parser = subparsers.add_parser("stats", help="Show action pipeline queue/drop statistics")
+    stats_parser.add_argument("--json", action="store_true", help="Output raw JSON")
+    
     return parser
 
 
@@ -429,6 +433,55 @@ def _cmd_export(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_stats(args: argparse.Namespace) -> int:
+    """Show action pipeline statistics.
+    
+    Uses the in-process router when one exists, otherwise the snapshot
+    persisted by the most recent capture session.
+    
+    Args:
+        args: Command arguments
+        
+    Returns:
+        Exit code
+    """
+    from bleep.signals import router as _router
+    from bleep.signals.pipeline import STATS_FILE, load_stats_snapshot
+    
+    stats = None
+    if _router._global_router is not None:
+        stats = _router._global_router.get_stats()
+    if stats is None:
+        stats = load_stats_snapshot()
+    if stats is None:
+        print_and_log(f"No pipeline statistics available ({STATS_FILE})", LOG__GENERAL)
+        return 1
+    
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return 0
+    
+    from datetime import datetime
+    updated = datetime.fromtimestamp(stats.get("updated", 0)).isoformat(timespec="seconds")
+    cfg = stats.get("config", {})
+    print_and_log(f"Pipeline stats (pid {stats.get('pid')}, updated {updated})", LOG__GENERAL)
+    print_and_log(
+        f"  max_queue={cfg.get('max_queue')} batch_size={cfg.get('batch_size')} "
+        f"flush_interval_ms={cfg.get('flush_interval_ms')}",
+        LOG__GENERAL,
+    )
+    header = f"  {'lane':<10} {'enqueued':>9} {'processed':>9} {'dropped':>8} {'batches':>8} {'errors':>7} {'depth':>6} {'max':>6}"
+    print_and_log(header, LOG__GENERAL)
+    for name, lane in sorted(stats.get("lanes", {}).items()):
+        print_and_log(
+            f"  {name:<10} {lane.get('enqueued', 0):>9} {lane.get('processed', 0):>9} "
+            f"{lane.get('dropped', 0):>8} {lane.get('batches', 0):>8} {lane.get('errors', 0):>7} "
+            f"{lane.get('depth', 0):>6} {lane.get('max_depth', 0):>6}",
+            LOG__GENERAL,
+        )
+    return 0
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI.
     
@@ -463,6 +516,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         return _cmd_import(args)
     elif args.command == "export":
         return _cmd_export(args)
+    elif args.command == "stats":
+        return _cmd_stats(args)
     else:
         print_and_log(f"Unknown command: {args.command}", LOG__GENERAL)
         return 1
@@ -140,8 +140,12 @@ def patch_signal_capture_class() -> None:
     """Patch the SignalCapture class to automatically route captures.
     
     This function monkey patches the SignalCapture.__init__ method to automatically
-    route new signal captures through the signal capture system.
+    route new signal captures through the signal capture system.  It runs
+    when this module is imported (which :mod:`bleep.dbuslayer.signals` does
+    on load); repeated calls are no-ops.
     """
+    if getattr(SignalCapture, "_bleep_routed", False):
+        return
     original_init = SignalCapture.__init__
     
     def _patched_init(self, *args, **kwargs):
@@ -153,4 +157,9 @@ def patch_signal_capture_class() -> None:
     
     # Apply the monkey patch
     SignalCapture.__init__ = _patched_init
+    SignalCapture._bleep_routed = True
 
+
+# Route captures as soon as the integration layer is loaded (previously done
+# eagerly by ``bleep/__init__``, which pulled D-Bus and GLib into every import).
+patch_signal_capture_class()
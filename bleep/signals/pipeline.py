@@ -0,0 +1,274 @@
+"""Asynchronous action execution pipeline for signal routes.
+
+The router runs on the D-Bus signal thread, so any action that touches the
+disk or the observation database must not execute inline.  The pipeline
+gives each action type its own *lane*: a bounded queue drained by a worker
+thread that processes records in batches (one CSV flush / JSON rewrite per
+file per batch rather than per row).
+
+Overflowing lanes drop the newest record and count it; per-lane statistics
+are available from :meth:`ActionPipeline.get_stats` and are periodically
+snapshotted to ``~/.bleep/signals/pipeline_stats.json`` so that
+``bleep signal-config stats`` can report on a capture running in another
+process.  Pipelines that never received a record (short-lived CLI runs)
+leave the snapshot alone.
+
+Tunables (environment):
+
+* ``BLEEP_SIGNAL_ASYNC`` – ``0`` runs actions synchronously (legacy mode)
+* ``BLEEP_SIGNAL_QUEUE_MAX`` – per-lane queue bound (default 10000)
+* ``BLEEP_SIGNAL_BATCH_SIZE`` – max records per batch (default 256)
+* ``BLEEP_SIGNAL_FLUSH_MS`` – max time a record waits for its batch (default 500)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bleep.core.log import print_and_log, LOG__DEBUG
+
+STATS_FILE = os.path.expanduser("~/.bleep/signals/pipeline_stats.json")
+
+_STATS_PERSIST_INTERVAL = 2.0  # seconds between snapshot writes
+
+# A lane handler receives a list of (action, signal_data) pairs.
+BatchHandler = Callable[[List[Tuple[Any, Dict[str, Any]]]], None]
+
+_STOP = object()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def async_enabled() -> bool:
+    """Return True unless ``BLEEP_SIGNAL_ASYNC=0`` requests synchronous actions."""
+    return os.getenv("BLEEP_SIGNAL_ASYNC", "1").lower() not in ("0", "false", "no", "off")
+
+
+class _ActionLane:
+    """Bounded queue plus worker thread for a single action type."""
+
+    def __init__(self, name: str, handler: BatchHandler, *,
+                 max_queue: int, batch_size: int, flush_interval: float,
+                 on_batch: Optional[Callable[[], None]] = None):
+        self.name = name
+        self._handler = handler
+        self._on_batch = on_batch
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(0.001, flush_interval)
+        self._stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "dropped": 0,
+            "batches": 0,
+            "errors": 0,
+            "max_depth": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"bleep-signal-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, action: Any, signal_data: Dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait((action, signal_data))
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+            return False
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            if depth > self._stats["max_depth"]:
+                self._stats["max_depth"] = depth
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every record queued before this call is processed."""
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            out = dict(self._stats)
+        out["depth"] = self._queue.qsize()
+        return out
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: List[Tuple[Any, Dict[str, Any]]] = []
+            barriers: List[threading.Event] = []
+            stop = False
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    barriers.append(item)
+                else:
+                    batch.append(item)
+                if stop or barriers or len(batch) >= self._batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._handler(batch)
+                    with self._stats_lock:
+                        self._stats["processed"] += len(batch)
+                        self._stats["batches"] += 1
+                except Exception as e:
+                    with self._stats_lock:
+                        self._stats["errors"] += 1
+                    print_and_log(
+                        f"[ERROR] Signal {self.name} batch failed: {e}", LOG__DEBUG
+                    )
+                if self._on_batch is not None:
+                    self._on_batch()
+            for barrier in barriers:
+                barrier.set()
+            if stop:
+                return
+
+
+class ActionPipeline:
+    """Per-action-type lanes feeding batch handlers off the signal thread."""
+
+    def __init__(self, handlers: Dict[str, BatchHandler], *,
+                 max_queue: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 flush_interval_ms: Optional[int] = None,
+                 stats_file: Optional[str] = STATS_FILE):
+        max_queue = max_queue or _env_int("BLEEP_SIGNAL_QUEUE_MAX", 10000)
+        batch_size = batch_size or _env_int("BLEEP_SIGNAL_BATCH_SIZE", 256)
+        flush_ms = flush_interval_ms or _env_int("BLEEP_SIGNAL_FLUSH_MS", 500)
+        self.config = {
+            "max_queue": max_queue,
+            "batch_size": batch_size,
+            "flush_interval_ms": flush_ms,
+        }
+        self._stats_file = stats_file
+        self._last_persist = 0.0
+        self._persist_lock = threading.Lock()
+        self._lanes = {
+            name: _ActionLane(
+                name, handler,
+                max_queue=max_queue,
+                batch_size=batch_size,
+                flush_interval=flush_ms / 1000.0,
+                on_batch=self._maybe_persist_stats,
+            )
+            for name, handler in handlers.items()
+        }
+        self._closed = False
+        # Orders submit() against close() so nothing is queued behind a
+        # lane's stop marker, where it would never be processed.
+        self._state_lock = threading.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, lane: str, action: Any, signal_data: Dict[str, Any]) -> bool:
+        """Queue *signal_data* for *lane*.
+
+        Returns False when the record was not queued: either the lane was
+        full (counted as ``dropped``) or the pipeline is closed (check
+        :attr:`closed`; the caller still owns the record).
+        """
+        with self._state_lock:
+            if self._closed:
+                return False
+            return self._lanes[lane].submit(action, signal_data)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every lane to drain the records queued so far."""
+        if self._closed:
+            return True
+        ok = True
+        for lane in self._lanes.values():
+            ok = lane.flush(timeout) and ok
+        return ok
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain and stop all lanes, then write a final stats snapshot."""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+        for lane in self._lanes.values():
+            lane.stop(timeout)
+        self._maybe_persist_stats(force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lanes = {name: lane.stats() for name, lane in self._lanes.items()}
+        totals = {key: sum(s[key] for s in lanes.values())
+                  for key in ("enqueued", "processed", "dropped", "batches", "errors", "depth")}
+        return {
+            "pid": os.getpid(),
+            "updated": time.time(),
+            "config": dict(self.config),
+            "lanes": lanes,
+            "totals": totals,
+        }
+
+    def _maybe_persist_stats(self, force: bool = False) -> None:
+        if not self._stats_file:
+            return
+        now = time.monotonic()
+        with self._persist_lock:
+            if not force and now - self._last_persist < _STATS_PERSIST_INTERVAL:
+                return
+            self._last_persist = now
+            stats = self.get_stats()
+            totals = stats["totals"]
+            if not (totals["enqueued"] or totals["dropped"]):
+                # Idle pipeline: don't clobber the snapshot of a real capture.
+                return
+            try:
+                os.makedirs(os.path.dirname(self._stats_file), exist_ok=True)
+                tmp = f"{self._stats_file}.{os.getpid()}.tmp"
+                with open(tmp, "w") as f:
+                    json.dump(stats, f, indent=2)
+                os.replace(tmp, self._stats_file)
+            except OSError as e:
+                print_and_log(f"[DEBUG] Could not write pipeline stats: {e}", LOG__DEBUG)
+
+
+def load_stats_snapshot(path: str = STATS_FILE) -> Optional[Dict[str, Any]]:
+    """Return the last persisted pipeline stats, or None if unavailable."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
@@ -4,6 +4,7 @@ This module provides classes for routing signals based on configured filters
 and executing the associated actions.
 """
 
+import atexit
 import csv
 import json
 import os
@@ -23,16 +24,30 @@ from bleep.signals.capture_config import (
     SignalType,
     ActionType,
 )
+from bleep.signals.pipeline import ActionPipeline, async_enabled
+from bleep.signals.storage import JsonlWriter, SegmentWriter, SEGMENT_EXT
 
 
 class ActionExecutor:
-    """Executes actions on captured signals."""
+    """Executes actions on captured signals.
+
+    LOG, SAVE, DB_STORE, FORWARD and TRANSFORM actions are handed to an
+    :class:`~bleep.signals.pipeline.ActionPipeline` by :meth:`submit` so they
+    run in batches on worker threads; CALLBACK actions always run inline.
+    """
+    
+    # Action types executed on pipeline worker threads
+    _ASYNC_ACTIONS = (ActionType.LOG, ActionType.SAVE, ActionType.DB_STORE,
+                      ActionType.FORWARD, ActionType.TRANSFORM)
     
-    def __init__(self, output_dir: Optional[str] = None):
+    def __init__(self, output_dir: Optional[str] = None,
+                 async_actions: Optional[bool] = None):
         """Initialize the action executor.
         
         Args:
             output_dir: Directory for saving output files. Defaults to ~/.bleep/signals/output
+            async_actions: Run non-callback actions on the batching pipeline.
+                Defaults to on unless ``BLEEP_SIGNAL_ASYNC=0``.
         """
         self.output_dir = output_dir or os.path.expanduser("~/.bleep/signals/output")
         os.makedirs(self.output_dir, exist_ok=True)
@@ -40,12 +55,23 @@ class ActionExecutor:
         # File handles for persistent output
         self._file_handles: Dict[str, Any] = {}
         self._csv_writers: Dict[str, csv.writer] = {}
+        # Streaming writers (jsonl / segment), keyed by base file path
+        self._stream_writers: Dict[str, Union[JsonlWriter, SegmentWriter]] = {}
         
         # Registered callbacks
         self._callbacks: Dict[str, Callable] = {}
         
         # Lock for thread safety
         self._lock = threading.Lock()
+        
+        # Batching pipeline (None = synchronous execution)
+        self._pipeline: Optional[ActionPipeline] = None
+        if async_actions if async_actions is not None else async_enabled():
+            self._pipeline = ActionPipeline({
+                action_type.value: self._make_batch_handler(action_type)
+                for action_type in self._ASYNC_ACTIONS
+            })
+            atexit.register(self._pipeline.close)
     
     def register_callback(self, name: str, callback: Callable) -> None:
         """Register a callback function.
@@ -66,6 +92,53 @@ class ActionExecutor:
         with self._lock:
             self._callbacks.pop(name, None)
     
+    def submit(self, action: SignalAction, signal_data: Dict[str, Any]) -> None:
+        """Queue an action for the pipeline, or execute it inline.
+        
+        Each queued action gets its own shallow copy of *signal_data* since
+        the save handlers rewrite ``value``/``timestamp`` in place.  Once the
+        pipeline has been closed (explicitly or at interpreter exit) actions
+        run inline instead of being discarded; records refused because a
+        lane is full are counted as ``dropped`` in :meth:`get_stats`.
+        
+        Args:
+            action: Action to execute
+            signal_data: Signal data to act on
+        """
+        if self._pipeline is not None and action.action_type in self._ASYNC_ACTIONS:
+            if self._pipeline.submit(action.action_type.value, action, dict(signal_data)):
+                return
+            if not self._pipeline.closed:
+                return  # lane full: dropped and counted by the pipeline
+        self.execute(action, signal_data)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued actions have been executed.
+        
+        Returns:
+            True if the pipeline drained within *timeout*
+        """
+        if self._pipeline is None:
+            return True
+        return self._pipeline.flush(timeout)
+    
+    def get_stats(self) -> Optional[Dict[str, Any]]:
+        """Return pipeline queue statistics, or None when running synchronously."""
+        if self._pipeline is None:
+            return None
+        return self._pipeline.get_stats()
+    
+    def _make_batch_handler(self, action_type: ActionType) -> Callable:
+        if action_type == ActionType.SAVE:
+            return self._execute_save_batch
+        if action_type == ActionType.DB_STORE:
+            return self._execute_db_store_batch
+        
+        def _handle(batch: List[Tuple[SignalAction, Dict[str, Any]]]) -> None:
+            for action, signal_data in batch:
+                self.execute(action, signal_data)
+        return _handle
+    
     def execute(self, action: SignalAction, signal_data: Dict[str, Any]) -> None:
         """Execute an action on a signal.
         
@@ -116,6 +189,51 @@ class ActionExecutor:
         message = f"[SIGNAL] {signal_type} on {path}: {value_str}"
         print_and_log(message, log_level)
     
+    def _save_target(self, action: SignalAction) -> Tuple[str, str]:
+        """Return ``(format, filepath)`` for a SAVE action."""
+        file_format = action.parameters.get('format', 'csv')
+        ext = SEGMENT_EXT if file_format == 'segment' else f".{file_format}"
+        filename = action.parameters.get('file', f"signals_{datetime.now().strftime('%Y%m%d')}{ext}")
+        return file_format, os.path.join(self.output_dir, filename)
+    
+    def _stream_writer(self, action: SignalAction, file_format: str,
+                       filepath: str) -> Union[JsonlWriter, SegmentWriter]:
+        """Get or create the streaming writer for a jsonl/segment SAVE target.
+        
+        Recognised action parameters: ``compress`` (``gzip``/``zstd``, jsonl
+        only), ``rotate_mb`` and ``rotate_seconds``.
+        """
+        writer = self._stream_writers.get(filepath)
+        if writer is None:
+            params = action.parameters
+            rotate_mb = params.get('rotate_mb')
+            rotate_s = params.get('rotate_seconds')
+            rotate = dict(
+                rotate_bytes=int(float(rotate_mb) * 1024 * 1024) if rotate_mb else None,
+                rotate_seconds=float(rotate_s) if rotate_s else None,
+            )
+            if file_format == 'jsonl':
+                writer = JsonlWriter(filepath, compress=params.get('compress'), **rotate)
+            else:
+                if params.get('compress'):
+                    print_and_log(
+                        f"[!] 'compress' is ignored for segment output ({filepath})",
+                        LOG__GENERAL,
+                    )
+                writer = SegmentWriter(filepath, **rotate)
+            self._stream_writers[filepath] = writer
+        return writer
+    
+    def _save_stream(self, action: SignalAction, file_format: str, filepath: str,
+                     records: List[Dict[str, Any]]) -> None:
+        """Append records to a jsonl/segment target and flush once."""
+        writer = self._stream_writer(action, file_format, filepath)
+        if file_format == 'jsonl':
+            writer.write_many(records)
+        else:
+            writer.write_signals(records)
+        writer.flush()
+    
     def _execute_save(self, action: SignalAction, signal_data: Dict[str, Any]) -> None:
         """Execute a SAVE action.
         
@@ -123,22 +241,51 @@ class ActionExecutor:
             action: Action to execute
             signal_data: Signal data to save
         """
-        file_format = action.parameters.get('format', 'csv')
-        filename = action.parameters.get('file', f"signals_{datetime.now().strftime('%Y%m%d')}.{file_format}")
-        filepath = os.path.join(self.output_dir, filename)
+        file_format, filepath = self._save_target(action)
         
         with self._lock:
             if file_format == 'csv':
                 self._save_csv(filepath, signal_data)
             elif file_format == 'json':
                 self._save_json(filepath, signal_data)
+            elif file_format in ('jsonl', 'segment'):
+                self._save_stream(action, file_format, filepath, [signal_data])
+    
+    def _execute_save_batch(self, batch: List[Tuple[SignalAction, Dict[str, Any]]]) -> None:
+        """Execute a batch of SAVE actions with one flush/rewrite per file.
+        
+        Args:
+            batch: ``(action, signal_data)`` pairs in arrival order
+        """
+        grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        first_action: Dict[Tuple[str, str], SignalAction] = {}
+        for action, signal_data in batch:
+            target = self._save_target(action)
+            grouped.setdefault(target, []).append(signal_data)
+            first_action.setdefault(target, action)
+        
+        with self._lock:
+            for (file_format, filepath), records in grouped.items():
+                try:
+                    if file_format == 'csv':
+                        for signal_data in records:
+                            self._save_csv(filepath, signal_data, flush=False)
+                        self._file_handles[filepath].flush()
+                    elif file_format == 'json':
+                        self._save_json_many(filepath, records)
+                    elif file_format in ('jsonl', 'segment'):
+                        self._save_stream(first_action[(file_format, filepath)],
+                                          file_format, filepath, records)
+                except Exception as e:
+                    print_and_log(f"[ERROR] Action execution failed: {e}", LOG__DEBUG)
     
-    def _save_csv(self, filepath: str, signal_data: Dict[str, Any]) -> None:
+    def _save_csv(self, filepath: str, signal_data: Dict[str, Any], flush: bool = True) -> None:
         """Save signal data to a CSV file.
         
         Args:
             filepath: Path to the CSV file
             signal_data: Signal data to save
+            flush: Flush the file after the row (batched writers flush once)
         """
         # Convert value to string if it's bytes
         value = signal_data.get('value', None)
@@ -183,7 +330,8 @@ class ActionExecutor:
             signal_data.get('char_uuid', '')
         ]
         writer.writerow(row)
-        self._file_handles[filepath].flush()
+        if flush:
+            self._file_handles[filepath].flush()
     
     def _save_json(self, filepath: str, signal_data: Dict[str, Any]) -> None:
         """Save signal data to a JSON file.
@@ -192,14 +340,24 @@ class ActionExecutor:
             filepath: Path to the JSON file
             signal_data: Signal data to save
         """
-        # Convert value to string if it's bytes
-        value = signal_data.get('value', None)
-        if isinstance(value, bytes):
-            signal_data['value'] = value.hex()
+        self._save_json_many(filepath, [signal_data])
+    
+    def _save_json_many(self, filepath: str, records: List[Dict[str, Any]]) -> None:
+        """Append several signal records to a JSON file in one rewrite.
         
-        # Add timestamp if not present
-        if 'timestamp' not in signal_data:
-            signal_data['timestamp'] = datetime.now().isoformat()
+        Args:
+            filepath: Path to the JSON file
+            records: Signal data to save
+        """
+        for signal_data in records:
+            # Convert value to string if it's bytes
+            value = signal_data.get('value', None)
+            if isinstance(value, bytes):
+                signal_data['value'] = value.hex()
+            
+            # Add timestamp if not present
+            if 'timestamp' not in signal_data:
+                signal_data['timestamp'] = datetime.now().isoformat()
         
         # Load existing data if file exists
         data = []
@@ -212,7 +370,7 @@ class ActionExecutor:
                 data = []
         
         # Append new data
-        data.append(signal_data)
+        data.extend(records)
         
         # Write back to file
         with open(filepath, 'w') as f:
@@ -249,6 +407,19 @@ class ActionExecutor:
         except Exception as e:
             print_and_log(f"[ERROR] Failed to store signal in database: {e}", LOG__DEBUG)
     
+    def _execute_db_store_batch(self, batch: List[Tuple[SignalAction, Dict[str, Any]]]) -> None:
+        """Execute a batch of DB_STORE actions in one database transaction.
+        
+        Args:
+            batch: ``(action, signal_data)`` pairs in arrival order
+        """
+        from bleep.core.observations import store_signal_captures
+        
+        try:
+            store_signal_captures([signal_data for _, signal_data in batch])
+        except Exception as e:
+            print_and_log(f"[ERROR] Failed to store signal batch in database: {e}", LOG__DEBUG)
+    
     def _execute_forward(self, action: SignalAction, signal_data: Dict[str, Any]) -> None:
         """Execute a FORWARD action.
         
@@ -274,7 +445,11 @@ class ActionExecutor:
         print_and_log(f"[TRANSFORM] Would apply {transform_type} transformation", LOG__DEBUG)
     
     def close(self) -> None:
-        """Close all open file handles."""
+        """Drain the pipeline and close all open file handles."""
+        if self._pipeline is not None:
+            self._pipeline.close()
+            # Release the exit hook so a discarded executor can be collected
+            atexit.unregister(self._pipeline.close)
         with self._lock:
             for f in self._file_handles.values():
                 try:
@@ -282,9 +457,114 @@ class ActionExecutor:
                 except Exception:
                     pass
             self._file_handles.clear()
+            for w in self._stream_writers.values():
+                try:
+                    w.close()
+                except Exception:
+                    pass
+            self._stream_writers.clear()
             self._csv_writers.clear()
 
 
+class _CompiledRoute:
+    """A route with its filter criteria pre-normalised for matching."""
+
+    __slots__ = ("order", "route", "service_uuid", "property_name",
+                 "path_regex", "value_regex", "min_len", "max_len")
+
+    def __init__(self, order: int, route: SignalRoute):
+        flt = route.filter
+        self.order = order
+        self.route = route
+        self.service_uuid = flt.service_uuid.lower() if flt.service_uuid else None
+        self.property_name = flt.property_name or None
+        self.path_regex = flt._path_regex
+        self.value_regex = flt._value_regex
+        self.min_len = flt.min_value_length
+        self.max_len = flt.max_value_length
+
+
+class CompiledRouteMatcher:
+    """Indexed matcher equivalent to calling ``SignalFilter.matches`` per route.
+
+    Routes are bucketed in a three-level dispatch table keyed by signal type,
+    upper-cased device MAC and lower-cased characteristic UUID (``None`` is
+    the wildcard bucket at each level).  A signal only visits the buckets for
+    its own keys plus the wildcards; the remaining criteria run cheapest
+    first, with the value regex last and the value hex-encoded at most once
+    per signal.
+    """
+
+    def __init__(self, routes: List[SignalRoute]):
+        self.routes = [r for r in routes if r.enabled]
+        self._table: Dict[Optional[SignalType],
+                          Dict[Optional[str], Dict[Optional[str], List[_CompiledRoute]]]] = {}
+        for order, route in enumerate(self.routes):
+            flt = route.filter
+            type_key = None if flt.signal_type in (None, SignalType.ANY) else flt.signal_type
+            mac_key = flt.device_mac.upper() if flt.device_mac else None
+            char_key = flt.char_uuid.lower() if flt.char_uuid else None
+            (self._table.setdefault(type_key, {})
+                        .setdefault(mac_key, {})
+                        .setdefault(char_key, [])
+                        .append(_CompiledRoute(order, route)))
+
+    @staticmethod
+    def _select(level: Dict[Optional[str], Any], key: Optional[str]) -> List[Any]:
+        # A signal without the attribute matches every bucket (the filter
+        # only constrains attributes that are present on the signal).
+        if key is None:
+            return list(level.values())
+        return [b for b in (level.get(key), level.get(None)) if b is not None]
+
+    def match(self, signal_type: SignalType, path: str,
+              property_name: Optional[str] = None,
+              value: Any = None,
+              device_mac: Optional[str] = None,
+              service_uuid: Optional[str] = None,
+              char_uuid: Optional[str] = None) -> List[SignalRoute]:
+        """Return the routes matching the signal, in configuration order."""
+        mac = device_mac.upper() if device_mac else None
+        char = char_uuid.lower() if char_uuid else None
+        svc = service_uuid.lower() if service_uuid else None
+
+        candidates: List[_CompiledRoute] = []
+        for type_key in (signal_type, None) if signal_type is not None else (None,):
+            by_mac = self._table.get(type_key)
+            if by_mac is None:
+                continue
+            for by_char in self._select(by_mac, mac):
+                for bucket in self._select(by_char, char):
+                    candidates.extend(bucket)
+        if not candidates:
+            return []
+        if len(candidates) > 1:
+            candidates.sort(key=lambda c: c.order)
+
+        value_str: Optional[str] = None
+        matched: List[SignalRoute] = []
+        for c in candidates:
+            if c.service_uuid and svc and c.service_uuid != svc:
+                continue
+            if c.property_name and property_name and c.property_name != property_name:
+                continue
+            if c.path_regex is not None and not c.path_regex.search(path):
+                continue
+            if value is not None:
+                if isinstance(value, (bytes, str)):
+                    if c.min_len is not None and len(value) < c.min_len:
+                        continue
+                    if c.max_len is not None and len(value) > c.max_len:
+                        continue
+                if c.value_regex is not None:
+                    if value_str is None:
+                        value_str = value.hex() if isinstance(value, bytes) else str(value)
+                    if not c.value_regex.search(value_str):
+                        continue
+            matched.append(c.route)
+        return matched
+
+
 class SignalRouter:
     """Routes signals based on configured filters to appropriate actions."""
     
@@ -299,8 +579,9 @@ class SignalRouter:
         self.config = config or create_default_config()
         self.action_executor = ActionExecutor()
         
-        # Active routes (enabled routes from config)
-        self.active_routes = [r for r in self.config.routes if r.enabled]
+        # Active routes (enabled routes from config), compiled for dispatch
+        self._matcher = CompiledRouteMatcher(self.config.routes)
+        self.active_routes = self._matcher.routes
         
         # Lock for thread safety
         self._lock = threading.Lock()
@@ -313,7 +594,8 @@ class SignalRouter:
         """
         with self._lock:
             self.config = config
-            self.active_routes = [r for r in self.config.routes if r.enabled]
+            self._matcher = CompiledRouteMatcher(self.config.routes)
+            self.active_routes = self._matcher.routes
     
     def register_callback(self, name: str, callback: Callable) -> None:
         """Register a callback function.
@@ -357,25 +639,22 @@ class SignalRouter:
         }
         
         # Find matching routes
-        matching_routes = []
         with self._lock:
-            for route in self.active_routes:
-                if route.filter.matches(
-                    signal_type=signal_type,
-                    path=path,
-                    interface=interface,
-                    property_name=property_name,
-                    value=value,
-                    device_mac=device_mac,
-                    service_uuid=service_uuid,
-                    char_uuid=char_uuid
-                ):
-                    matching_routes.append(route)
-        
-        # Execute actions for matching routes
+            matcher = self._matcher
+        matching_routes = matcher.match(
+            signal_type=signal_type,
+            path=path,
+            property_name=property_name,
+            value=value,
+            device_mac=device_mac,
+            service_uuid=service_uuid,
+            char_uuid=char_uuid
+        )
+        
+        # Hand actions to the executor (queued unless CALLBACK / sync mode)
         for route in matching_routes:
             for action in route.actions:
-                self.action_executor.execute(action, signal_data)
+                self.action_executor.submit(action, signal_data)
     
     def process_signal_capture(self, capture: SignalCapture) -> None:
         """Process a SignalCapture object.
@@ -421,6 +700,10 @@ class SignalRouter:
             value=value
         )
     
+    def get_stats(self) -> Optional[Dict[str, Any]]:
+        """Return action pipeline statistics (None in synchronous mode)."""
+        return self.action_executor.get_stats()
+    
     def close(self) -> None:
         """Close the router and release resources."""
         self.action_executor.close()
@@ -0,0 +1,404 @@
+"""Streaming storage formats for captured signals.
+
+Two append-only formats for long captures, used by the SAVE action
+(``format: "jsonl"`` / ``format: "segment"``) and by ``bleep signal --out``:
+
+* **JSONL** – one JSON object per line, optionally gzip or zstd compressed
+  (compressed streams are written as concatenated members/frames so files
+  can be appended to and still decompress as a whole).
+* **Segment** – a compact columnar binary format.  Records are written in
+  blocks; each block stores the timestamps (float64), path ids (uint32) and
+  value lengths (uint32) as packed columns followed by the concatenated
+  value bytes.  Path strings are interned once per file in a table that is
+  extended block by block.  :func:`read_segment` loads the columns back in
+  bulk.
+
+Both writers rotate to a new file once ``rotate_bytes`` (uncompressed) or
+``rotate_seconds`` is exceeded; rotated files get a ``-YYYYmmdd-HHMMSS``
+suffix on the stem so that a glob of the stem picks up the whole capture.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard as _zstd  # optional
+except ImportError:  # pragma: no cover - optional dependency
+    _zstd = None
+
+COMPRESSIONS = (None, "gzip", "zstd")
+
+_COMPRESS_EXT = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+SEGMENT_MAGIC = b"BLSG"
+SEGMENT_VERSION = 1
+SEGMENT_EXT = ".bseg"
+
+# File header: magic, version (u16), reserved (u16)
+_FILE_HEADER = struct.Struct("<4sHH")
+# Block header: rows, new path entries, values length, crc32 of payload
+_BLOCK_HEADER = struct.Struct("<IIQI")
+# Path table entry: id, utf-8 length
+_PATH_ENTRY = struct.Struct("<IH")
+
+_LITTLE = sys.byteorder == "little"
+
+
+def signal_timestamp(signal_data: Dict[str, Any]) -> float:
+    """Return the epoch timestamp of a router signal record."""
+    ts = signal_data.get("timestamp")
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    if isinstance(ts, str):
+        try:
+            return datetime.fromisoformat(ts).timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+def _value_bytes(value: Any) -> bytes:
+    if value is None:
+        return b""
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (list, tuple)) and all(isinstance(x, int) for x in value):
+        return bytes(value)
+    return str(value).encode("utf-8")
+
+
+def _open_compressed(path: str, compress: Optional[str], mode: str):
+    if compress is None:
+        return open(path, mode)
+    if compress == "gzip":
+        return gzip.open(path, mode)
+    if compress == "zstd":
+        if _zstd is None:
+            raise RuntimeError("zstd compression requires the 'zstandard' package")
+        raw = open(path, mode)
+        if "r" in mode:
+            return _zstd.ZstdDecompressor().stream_reader(raw, closefd=True, read_across_frames=True)
+        return _zstd.ZstdCompressor().stream_writer(raw, closefd=True)
+    raise ValueError(f"Unknown compression: {compress!r} (expected one of {COMPRESSIONS})")
+
+
+def _compression_for(path: str) -> Optional[str]:
+    if path.endswith(".gz"):
+        return "gzip"
+    if path.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+class _RotatingWriter:
+    """Common size/time rotation for the append-only writers."""
+
+    def __init__(self, path: str, *, rotate_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None):
+        self.base_path = path
+        self.rotate_bytes = rotate_bytes or None
+        self.rotate_seconds = rotate_seconds or None
+        self.path: Optional[str] = None
+        self._fh = None
+        self._bytes = 0
+        self._opened_at = 0.0
+
+    @property
+    def rotating(self) -> bool:
+        return bool(self.rotate_bytes or self.rotate_seconds)
+
+    def _next_path(self) -> str:
+        if not self.rotating:
+            return self.base_path
+        head, tail = os.path.split(self.base_path)
+        stem, dot, ext = tail.partition(".")
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        candidate = os.path.join(head, f"{stem}-{stamp}{dot}{ext}")
+        n = 1
+        while os.path.exists(candidate):
+            candidate = os.path.join(head, f"{stem}-{stamp}_{n}{dot}{ext}")
+            n += 1
+        return candidate
+
+    def _should_rotate(self) -> bool:
+        if self._fh is None:
+            return True
+        if self.rotate_bytes and self._bytes >= self.rotate_bytes:
+            return True
+        if self.rotate_seconds and time.monotonic() - self._opened_at >= self.rotate_seconds:
+            return True
+        return False
+
+    def _ensure_open(self) -> None:
+        if not self._should_rotate():
+            return
+        self.close()
+        self.path = self._next_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fh = self._open(self.path)
+        self._bytes = 0
+        self._opened_at = time.monotonic()
+
+    def _open(self, path: str):  # pragma: no cover - abstract
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonlWriter(_RotatingWriter):
+    """Append-only JSON Lines writer with optional gzip/zstd and rotation."""
+
+    def __init__(self, path: str, *, compress: Optional[str] = None,
+                 rotate_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None):
+        if compress not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compress!r} (expected one of {COMPRESSIONS})")
+        if compress == "zstd" and _zstd is None:
+            raise RuntimeError("zstd compression requires the 'zstandard' package")
+        ext = _COMPRESS_EXT[compress]
+        if ext and not path.endswith(ext):
+            path += ext
+        super().__init__(path, rotate_bytes=rotate_bytes, rotate_seconds=rotate_seconds)
+        self.compress = compress
+
+    def _open(self, path: str):
+        return _open_compressed(path, self.compress, "ab")
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        lines = []
+        for record in records:
+            value = record.get("value")
+            if isinstance(value, (bytes, bytearray)):
+                record = dict(record, value=bytes(value).hex())
+            lines.append(json.dumps(record, default=str, separators=(",", ":")))
+        if not lines:
+            return
+        self._ensure_open()
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        self._fh.write(data)
+        self._bytes += len(data)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.write_many((record,))
+
+
+def _truncation_errors() -> Tuple[type, ...]:
+    errors: Tuple[type, ...] = (EOFError,)
+    if _zstd is not None:
+        errors += (_zstd.ZstdError,)
+    return errors
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from a (possibly compressed) JSONL capture file.
+
+    A capture whose writer was killed before :meth:`JsonlWriter.close` ends
+    in an unterminated compressed stream and possibly a partial line;
+    iteration then stops cleanly after the last complete record.
+    """
+    compress = _compression_for(path)
+    fh = _open_compressed(path, compress, "rb")
+    if compress == "zstd":
+        fh = io.BufferedReader(fh)
+    with fh:
+        try:
+            for line in fh:
+                complete = line.endswith(b"\n")
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    if complete:
+                        raise
+                    break  # partial final line of an interrupted capture
+                yield record
+        except _truncation_errors():
+            pass  # compressed stream ends without its end-of-stream marker
+
+
+class SegmentWriter(_RotatingWriter):
+    """Columnar binary writer: one block per :meth:`write_many` call.
+
+    Records are ``(timestamp, path, value)`` tuples; use
+    :meth:`write_signals` to write router signal dictionaries.
+    """
+
+    def __init__(self, path: str, *, rotate_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None):
+        super().__init__(path, rotate_bytes=rotate_bytes, rotate_seconds=rotate_seconds)
+        self._path_ids: Dict[str, int] = {}
+
+    def _open(self, path: str):
+        existing = os.path.exists(path) and os.path.getsize(path) > 0
+        fh = open(path, "ab")
+        self._path_ids = {}
+        if existing:
+            # Appending to a previous capture: recover its path table.
+            for pid, p in _scan_path_table(path):
+                self._path_ids[p] = pid
+        else:
+            fh.write(_FILE_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, 0))
+        return fh
+
+    def write_many(self, records: Iterable[Tuple[float, str, Any]]) -> None:
+        timestamps = array("d")
+        path_ids = array("I")
+        lengths = array("I")
+        values: List[bytes] = []
+        paths: List[str] = []
+        for ts, path, value in records:
+            timestamps.append(float(ts))
+            paths.append(path)
+            raw = _value_bytes(value)
+            lengths.append(len(raw))
+            values.append(raw)
+        if not timestamps:
+            return
+        self._ensure_open()
+
+        new_entries = []
+        for path in paths:
+            pid = self._path_ids.get(path)
+            if pid is None:
+                pid = self._path_ids[path] = len(self._path_ids)
+                encoded = path.encode("utf-8")
+                new_entries.append(_PATH_ENTRY.pack(pid, len(encoded)) + encoded)
+            path_ids.append(pid)
+
+        if not _LITTLE:  # pragma: no cover - big-endian hosts
+            for col in (timestamps, path_ids, lengths):
+                col.byteswap()
+        blob = b"".join(values)
+        payload = b"".join(new_entries) + timestamps.tobytes() + path_ids.tobytes() + lengths.tobytes() + blob
+        header = _BLOCK_HEADER.pack(len(timestamps), len(new_entries), len(blob), zlib.crc32(payload))
+        self._fh.write(header)
+        self._fh.write(payload)
+        self._bytes += len(header) + len(payload)
+
+    def write_signals(self, signals: Iterable[Dict[str, Any]]) -> None:
+        """Write router signal dictionaries (``timestamp``/``path``/``value``)."""
+        self.write_many(
+            (signal_timestamp(s), s.get("path") or "", s.get("value")) for s in signals
+        )
+
+    def write(self, ts: float, path: str, value: Any) -> None:
+        self.write_many(((ts, path, value),))
+
+
+def _iter_blocks(path: str) -> Iterator[Tuple[int, List[Tuple[int, str]], bytes, int]]:
+    """Yield ``(rows, new_paths, payload_without_paths, values_len)`` per block."""
+    with open(path, "rb") as fh:
+        header = fh.read(_FILE_HEADER.size)
+        if len(header) < _FILE_HEADER.size:
+            return
+        magic, version, _ = _FILE_HEADER.unpack(header)
+        if magic != SEGMENT_MAGIC:
+            raise ValueError(f"{path}: not a BLEEP signal segment file")
+        if version != SEGMENT_VERSION:
+            raise ValueError(f"{path}: unsupported segment version {version}")
+        while True:
+            raw = fh.read(_BLOCK_HEADER.size)
+            if len(raw) < _BLOCK_HEADER.size:
+                return  # EOF (or a torn trailing header)
+            rows, n_paths, values_len, crc = _BLOCK_HEADER.unpack(raw)
+            paths: List[Tuple[int, str]] = []
+            path_bytes = []
+            for _ in range(n_paths):
+                entry = fh.read(_PATH_ENTRY.size)
+                if len(entry) < _PATH_ENTRY.size:
+                    return
+                pid, length = _PATH_ENTRY.unpack(entry)
+                encoded = fh.read(length)
+                path_bytes.append(entry + encoded)
+                paths.append((pid, encoded.decode("utf-8")))
+            body = fh.read(rows * 16 + values_len)
+            if len(body) < rows * 16 + values_len:
+                return  # torn trailing block from an interrupted capture
+            if zlib.crc32(b"".join(path_bytes) + body) != crc:
+                raise ValueError(f"{path}: checksum mismatch in segment block")
+            yield rows, paths, body, values_len
+
+
+def _scan_path_table(path: str) -> List[Tuple[int, str]]:
+    table: List[Tuple[int, str]] = []
+    for _rows, paths, _body, _vlen in _iter_blocks(path):
+        table.extend(paths)
+    return table
+
+
+def read_segment(path: str) -> Dict[str, Any]:
+    """Load a segment file into columns.
+
+    Returns a dict with ``timestamp`` (``array('d')``), ``path_id``
+    (``array('I')``), ``paths`` (id → path list) and ``value`` (list of
+    bytes).  Columns are loaded with one ``frombytes`` per block.
+    """
+    timestamps = array("d")
+    path_ids = array("I")
+    values: List[bytes] = []
+    paths: Dict[int, str] = {}
+    for rows, new_paths, body, _values_len in _iter_blocks(path):
+        paths.update(new_paths)
+        ts_end = rows * 8
+        id_end = ts_end + rows * 4
+        len_end = id_end + rows * 4
+        block_ts = array("d")
+        block_ts.frombytes(body[:ts_end])
+        block_ids = array("I")
+        block_ids.frombytes(body[ts_end:id_end])
+        block_lens = array("I")
+        block_lens.frombytes(body[id_end:len_end])
+        if not _LITTLE:  # pragma: no cover - big-endian hosts
+            for col in (block_ts, block_ids, block_lens):
+                col.byteswap()
+        timestamps.extend(block_ts)
+        path_ids.extend(block_ids)
+        blob = memoryview(body)[len_end:]
+        offset = 0
+        for length in block_lens:
+            values.append(bytes(blob[offset:offset + length]))
+            offset += length
+    path_list = [""] * (max(paths) + 1 if paths else 0)
+    for pid, p in paths.items():
+        path_list[pid] = p
+    return {"timestamp": timestamps, "path_id": path_ids, "paths": path_list, "value": values}
+
+
+def iter_segment(path: str) -> Iterator[Tuple[float, str, bytes]]:
+    """Yield ``(timestamp, path, value)`` rows from a segment file."""
+    data = read_segment(path)
+    paths = data["paths"]
+    for ts, pid, value in zip(data["timestamp"], data["path_id"], data["value"]):
+        yield ts, paths[pid], value
@@ -56,7 +56,7 @@ setup(
     extras_require=_pygobject_extras,
     package_data={
         "bleep.docs": ["*.md"],
-        "bleep.bt_ref": ["yaml_cache/*.yaml", "url_mappings.json"],
+        "bleep.bt_ref": ["yaml_cache/*.yaml", "url_mappings.json", "*.bref"],
     },
     entry_points={
         'console_scripts': [